@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Compare two WheelSpin benchmark result files
+
+Usage:
+    python benchmarks/compare.py before.json after.json
+    python benchmarks/compare.py before.json after.json --threshold 10 --fail-on-regression
+
+Scenarios are matched by name. For every metric the relative change is shown;
+changes above the threshold (in percent) are flagged. All metrics are
+"lower is better".
+"""
+
+import argparse
+import json
+import sys
+
+# (label, path into the metrics dict, unit scale, unit name)
+METRICS = [
+    ('end-to-end', ('end_to_end_s',), 1.0, 's'),
+    ('frame mean', ('render_frame_s', 'mean'), 1000.0, 'ms'),
+    ('frame p95', ('render_frame_s', 'p95'), 1000.0, 'ms'),
+    ('encode', ('encode_s',), 1.0, 's'),
+    ('peak RSS', ('peak_rss_bytes',), 1.0 / 2**20, 'MiB'),
+    ('output', ('output_bytes',), 1.0 / 1024, 'KiB'),
+]
+
+
+def load_results(path: str) -> dict:
+    with open(path, encoding='utf-8') as f:
+        report = json.load(f)
+    return {entry['name']: entry for entry in report['results']}
+
+
+def lookup(metrics: dict, path: tuple):
+    value = metrics
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def compare(before: dict, after: dict, threshold: float):
+    """Return (rows, regressions) for scenarios present in both runs"""
+    rows = []
+    regressions = []
+    for name in before:
+        if name not in after:
+            continue
+        old_metrics = before[name]['metrics']
+        new_metrics = after[name]['metrics']
+        for label, path, scale, unit in METRICS:
+            old = lookup(old_metrics, path)
+            new = lookup(new_metrics, path)
+            if old is None or new is None:
+                continue
+            change = ((new - old) / old * 100.0) if old else 0.0
+            flag = ''
+            if change > threshold:
+                flag = 'REGRESSION'
+                regressions.append((name, label, change))
+            elif change < -threshold:
+                flag = 'improved'
+            rows.append((name, label, old * scale, new * scale, unit, change, flag))
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Diff two WheelSpin benchmark runs")
+    parser.add_argument('before', help="Baseline results JSON")
+    parser.add_argument('after', help="New results JSON")
+    parser.add_argument('--threshold', type=float, default=5.0,
+                        help="Percent change that counts as significant (default: 5)")
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help="Exit with status 1 if any metric regressed beyond the threshold")
+    args = parser.parse_args(argv)
+
+    before = load_results(args.before)
+    after = load_results(args.after)
+    rows, regressions = compare(before, after, args.threshold)
+
+    print(f"{'scenario':<16} {'metric':<11} {'before':>12} {'after':>12} {'change':>9}")
+    print("-" * 64)
+    for name, label, old, new, unit, change, flag in rows:
+        print(f"{name:<16} {label:<11} {old:>9.2f}{unit:>3} {new:>9.2f}{unit:>3} {change:>+8.1f}% {flag}")
+
+    only_before = sorted(set(before) - set(after))
+    only_after = sorted(set(after) - set(before))
+    if only_before:
+        print(f"\nOnly in {args.before}: {', '.join(only_before)}")
+    if only_after:
+        print(f"Only in {args.after}: {', '.join(only_after)}")
+
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed by more than {args.threshold:.1f}%")
+        if args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Frame transport benchmark: pickled images vs the shared memory frame ring
+
+Measures what it costs to move rendered frames from a worker process to the
+parent, without the rendering itself:
+- pickle: the worker puts each PIL image on a multiprocessing queue and the
+  parent takes it off (pickle, pipe, unpickle)
+- ring: the worker copies the frame into a FrameRing slot and sends the slot
+  number; the parent wraps the slot as an image without copying
+
+A frame is rendered once before forking and sent repeatedly, so both
+transports move identical bytes. The end-to-end section renders a spin with
+plain multiprocessing (Pool.imap returning images) and with
+render_gif_processes(), both encoding the GIF in the parent.
+
+Usage:
+    python benchmarks/frame_transport.py
+    python benchmarks/frame_transport.py --sizes 500 1000 --frames 60 -o transport.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from wheelspin.encoding import encode_gif  # noqa: E402
+from wheelspin.frame_ring import FrameRing, render_gif_processes  # noqa: E402
+from wheelspin.wheel_generator import WheelGenerator  # noqa: E402
+
+LABELS = [f"Player {i}" for i in range(12)]
+START_ROTATION = 123.4
+
+_frame = None  # the frame sent by the transport workers, inherited when forking
+_generator = None  # the generator used by Pool workers
+
+
+def _send_pickled(frames, ready):
+    for _ in range(frames):
+        ready.put(_frame)
+
+
+def _send_ring(frames, ring_name, slots, free, ready):
+    ring = FrameRing(_frame.size[0], slots, name=ring_name)
+    try:
+        for _ in range(frames):
+            slot = free.get()
+            ring.write(slot, _frame)
+            ready.put(slot)
+    finally:
+        ring.close()
+
+
+def transport_pickled(frames: int) -> float:
+    """Seconds to move `frames` frames as pickled images"""
+    ready = multiprocessing.Queue(maxsize=2)
+    worker = multiprocessing.Process(target=_send_pickled, args=(frames, ready))
+    start = time.perf_counter()
+    worker.start()
+    for _ in range(frames):
+        ready.get().load()
+    elapsed = time.perf_counter() - start
+    worker.join()
+    return elapsed
+
+
+def transport_ring(frames: int, slots: int = 2) -> float:
+    """Seconds to move `frames` frames through shared memory slots"""
+    ring = FrameRing(_frame.size[0], slots)
+    free = multiprocessing.Queue()
+    ready = multiprocessing.Queue()
+    worker = multiprocessing.Process(target=_send_ring, args=(frames, ring.name, slots, free, ready))
+    start = time.perf_counter()
+    worker.start()
+    for slot in range(slots):
+        free.put(slot)
+    for _ in range(frames):
+        slot = ready.get()
+        ring.read(slot, lambda image: image.getpixel((0, 0)))  # touch the frame, copy nothing
+        free.put(slot)
+    elapsed = time.perf_counter() - start
+    worker.join()
+    ring.close()
+    return elapsed
+
+
+def _render_pool_frame(args):
+    index, num_frames = args
+    return _generator.create_animation_frame(LABELS, START_ROTATION, index, num_frames)
+
+
+def end_to_end_pickled(generator, frames: int, processes: int) -> float:
+    global _generator
+    _generator = generator
+    start = time.perf_counter()
+    with multiprocessing.Pool(processes) as pool:
+        rendered = pool.imap(_render_pool_frame, [(i, frames) for i in range(frames)], chunksize=1)
+        encode_gif(rendered, io.BytesIO())
+    return time.perf_counter() - start
+
+
+def end_to_end_ring(generator, frames: int, processes: int) -> float:
+    start = time.perf_counter()
+    render_gif_processes(generator, LABELS, START_ROTATION, frames, io.BytesIO(), processes=processes)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    global _frame
+    parser = argparse.ArgumentParser(description="Compare frame transport between processes")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 1000], help="Image sizes in pixels")
+    parser.add_argument('--frames', type=int, default=40, help="Frames per measurement")
+    parser.add_argument('--processes', type=int, default=2, help="Worker processes for the end-to-end runs")
+    parser.add_argument('-o', '--output', help="JSON file to write")
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in args.sizes:
+        generator = WheelGenerator(size=size)
+        _frame = generator.create_animation_frame(LABELS, START_ROTATION, 0, args.frames)
+        pickled = transport_pickled(args.frames)
+        ring = transport_ring(args.frames)
+        with contextlib.redirect_stdout(io.StringIO()):
+            e2e_pickled = end_to_end_pickled(generator, args.frames, args.processes)
+            e2e_ring = end_to_end_ring(generator, args.frames, args.processes)
+        result = {
+            'size': size,
+            'frames': args.frames,
+            'frame_bytes': size * size * 4,
+            'pickle_ms_per_frame': pickled * 1000 / args.frames,
+            'ring_ms_per_frame': ring * 1000 / args.frames,
+            'end_to_end_pickle_s': e2e_pickled,
+            'end_to_end_ring_s': e2e_ring,
+        }
+        results.append(result)
+        print(f"  {size:>5}px  transport {result['pickle_ms_per_frame']:7.2f}ms pickled  "
+              f"{result['ring_ms_per_frame']:7.2f}ms ring   "
+              f"end-to-end {e2e_pickled:6.2f}s pickled  {e2e_ring:6.2f}s ring")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'processes': args.processes, 'results': results}, f, indent=2)
+        print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
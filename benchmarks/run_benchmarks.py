@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+WheelSpin benchmark suite
+
+Runs a matrix of wheel configurations and records, for each one:
+- end-to-end latency of create_spinning_wheel_advanced()
+- per-frame render time (mean / median / p95 / max)
+- GIF encode time
+- peak RSS of the end-to-end call
+- size of the encoded GIF in bytes
+
+Every scenario runs in a fresh subprocess so peak RSS is not polluted by
+earlier scenarios. Results are written as JSON; use compare.py to diff two runs.
+
+Usage:
+    python benchmarks/run_benchmarks.py                     # default suite
+    python benchmarks/run_benchmarks.py --quick             # small, fast subset
+    python benchmarks/run_benchmarks.py --full              # include the heavy scenarios
+    python benchmarks/run_benchmarks.py --filter segments   # only matching scenarios
+    python benchmarks/run_benchmarks.py -o results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add parent directory to path
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+BASELINE = {
+    'segments': 8,
+    'size': 500,
+    'labels': 'short',
+    'animation_speed': 1.0,
+}
+
+# Label generators keyed by the 'labels' scenario parameter
+LABEL_SETS = {
+    'short': lambda n: [f"P{i}" for i in range(n)],
+    'medium': lambda n: [f"Player {i}" for i in range(n)],
+    'long': lambda n: [f"Contestant number {i} from the long list" for i in range(n)],
+    'unicode': lambda n: [["東京", "Москва", "Zürich", "مرحبا", "★ Star ★", "こんにちは"][i % 6] + str(i)
+                          for i in range(n)],
+}
+
+
+def _scenario(name, heavy=False, quick=False, **overrides):
+    params = dict(BASELINE)
+    params.update(overrides)
+    return {'name': name, 'params': params, 'heavy': heavy, 'quick': quick}
+
+
+# Each axis is swept on its own, holding the others at the baseline
+SCENARIOS = [
+    _scenario('baseline', quick=True),
+    # Segment count sweep
+    _scenario('segments-2', segments=2, quick=True),
+    _scenario('segments-50', segments=50),
+    _scenario('segments-100', segments=100),
+    _scenario('segments-1000', segments=1000, heavy=True),
+    _scenario('segments-20000', segments=20000, heavy=True),
+    # Image size sweep
+    _scenario('size-250', size=250, quick=True),
+    _scenario('size-1000', size=1000),
+    _scenario('size-2000', size=2000, heavy=True),
+    # Label length / script sweep
+    _scenario('labels-medium', labels='medium'),
+    _scenario('labels-long', labels='long', quick=True),
+    _scenario('labels-unicode', labels='unicode', quick=True),
+    # Animation speed sweep
+    _scenario('speed-0.5', animation_speed=0.5),
+    _scenario('speed-2.0', animation_speed=2.0),
+]
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process in bytes (0 if unavailable)"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def summarize(samples):
+    """Summary statistics for a list of timings in seconds"""
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        'count': len(ordered),
+        'total': sum(ordered),
+        'mean': statistics.mean(ordered),
+        'median': statistics.median(ordered),
+        'p95': ordered[p95_index],
+        'max': ordered[-1],
+    }
+
+
+def run_scenario(params: dict) -> dict:
+    """Run one scenario in the current process and return its metrics"""
+    from wheelspin import create_spinning_wheel_advanced
+    from wheelspin.geometry import spin_rotation
+    from wheelspin.wheel_generator import WheelGenerator
+
+    labels = LABEL_SETS[params['labels']](params['segments'])
+    start_rotation = 123.4  # fixed so runs are comparable
+
+    # End-to-end latency through the public API
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = os.path.join(tmp, 'bench.gif')
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            create_spinning_wheel_advanced(
+                labels,
+                output_file,
+                size=params['size'],
+                start_rotation=start_rotation,
+                animation_speed=params['animation_speed'],
+            )
+            end_to_end = time.perf_counter() - start
+        output_bytes = os.path.getsize(output_file)
+    # Read before the replay below, which holds every frame at once; the peak
+    # only ever grows, so this is the end-to-end call's own high-water mark
+    end_to_end_rss = peak_rss_bytes()
+
+    # Phase breakdown: replay create_gif() with timers around render and encode
+    generator = WheelGenerator(
+        size=params['size'],
+        colors=['#eeb312', '#d61126', '#346ae9', '#019b26', '#9b59b6', '#e67e22'],
+        animation_speed=params['animation_speed'],
+    )
+    segments = len(labels)
+    num_frames = generator.calculate_frames(segments)
+    frame_times = []
+    frames = []
+    for i in range(num_frames):
+        rotation = spin_rotation(i, num_frames, start_rotation)
+        start = time.perf_counter()
+        frames.append(generator.create_wheel_frame(segments, rotation, labels))
+        frame_times.append(time.perf_counter() - start)
+
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    frames[0].save(
+        buffer,
+        format='GIF',
+        append_images=frames[1:],
+        save_all=True,
+        duration=50,
+        transparency=0,
+        disposal=2
+    )
+    encode_time = time.perf_counter() - start
+
+    return {
+        'end_to_end_s': end_to_end,
+        'frames': num_frames,
+        'render_frame_s': summarize(frame_times),
+        'encode_s': encode_time,
+        'peak_rss_bytes': end_to_end_rss,
+        'replay_peak_rss_bytes': peak_rss_bytes(),
+        'output_bytes': output_bytes,
+    }
+
+
+def run_isolated(scenario: dict) -> dict:
+    """Run a scenario in a fresh interpreter so peak RSS is per-scenario"""
+    cmd = [sys.executable, str(Path(__file__).resolve()), '--single', json.dumps(scenario['params'])]
+    completed = subprocess.run(cmd, capture_output=True, text=True, cwd=str(REPO_ROOT))
+    if completed.returncode != 0:
+        return {'error': completed.stderr.strip().splitlines()[-1] if completed.stderr else 'failed'}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def environment_info() -> dict:
+    """Describe the host so results from different machines are not confused"""
+    try:
+        import PIL
+        pillow_version = PIL.__version__
+    except ImportError:
+        pillow_version = None
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                  text=True, cwd=str(REPO_ROOT)).stdout.strip() or None
+    except OSError:
+        revision = None
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'pillow': pillow_version,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'git_revision': revision,
+    }
+
+
+def select_scenarios(quick: bool, full: bool, name_filter: str):
+    selected = []
+    for scenario in SCENARIOS:
+        if quick and not scenario['quick']:
+            continue
+        if scenario['heavy'] and not full:
+            continue
+        if name_filter and name_filter not in scenario['name']:
+            continue
+        selected.append(scenario)
+    return selected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the WheelSpin benchmark suite")
+    parser.add_argument('-o', '--output', default='bench_results.json', help="JSON file to write")
+    parser.add_argument('--quick', action='store_true', help="Run the small, fast subset only")
+    parser.add_argument('--full', action='store_true', help="Include heavy scenarios (1000 segments, 2000px)")
+    parser.add_argument('--filter', default='', help="Only run scenarios whose name contains this text")
+    parser.add_argument('--single', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.single:
+        # Child process mode: run one scenario and print its metrics as JSON
+        print(json.dumps(run_scenario(json.loads(args.single))))
+        return 0
+
+    scenarios = select_scenarios(args.quick, args.full, args.filter)
+    print(f"Running {len(scenarios)} scenarios...")
+
+    results = []
+    for scenario in scenarios:
+        metrics = run_isolated(scenario)
+        results.append({'name': scenario['name'], 'params': scenario['params'], 'metrics': metrics})
+        if 'error' in metrics:
+            print(f"  {scenario['name']:<16} ERROR: {metrics['error']}")
+            continue
+        print(f"  {scenario['name']:<16} {metrics['end_to_end_s']:7.2f}s total  "
+              f"{metrics['render_frame_s']['mean'] * 1000:7.2f}ms/frame  "
+              f"{metrics['encode_s']:6.2f}s encode  "
+              f"{metrics['peak_rss_bytes'] / 2**20:7.1f}MiB  "
+              f"{metrics['output_bytes'] / 1024:8.1f}KiB")
+
+    report = {'environment': environment_info(), 'results': results}
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
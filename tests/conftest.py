@@ -0,0 +1,10 @@
+"""Shared test setup"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the glyph coverage index out of the user's real cache directory"""
+    monkeypatch.setenv('WHEELSPIN_CACHE_DIR', str(tmp_path / 'cache'))
+    return tmp_path / 'cache'
@@ -0,0 +1,68 @@
+"""Test the lazily rendered WheelAnimation sequence"""
+
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wheelspin import WheelAnimation, spin_wheel
+from wheelspin.wheel_generator import WheelGenerator
+
+
+@pytest.fixture
+def animation():
+    """Small animation so frames render quickly"""
+    generator = WheelGenerator(size=120, animation_speed=0.5)
+    return WheelAnimation(["A", "B", "C", "D"], start_rotation=42.0, generator=generator, cache_size=4)
+
+
+def test_length_matches_frame_count(animation):
+    """Test that len() matches the generator's frame calculation"""
+    assert len(animation) == animation.generator.calculate_frames(4)
+
+
+def test_frames_match_create_wheel_frame(animation):
+    """Test that a frame equals the one create_gif would render"""
+    index = 7
+    expected = animation.generator.create_wheel_frame(4, animation.rotation(index), animation.labels)
+    
+    assert animation[index].tobytes() == expected.tobytes()
+
+
+def test_negative_index_and_bounds(animation):
+    """Test negative indexing and out-of-range errors"""
+    assert animation[-1].tobytes() == animation[len(animation) - 1].tobytes()
+    
+    with pytest.raises(IndexError):
+        animation[len(animation)]
+
+
+def test_slicing_renders_only_requested_frames(animation):
+    """Test that slicing returns the selected frames"""
+    thumbnails = animation[::10]
+    
+    assert len(thumbnails) == len(range(0, len(animation), 10))
+    assert all(frame.size == (120, 120) for frame in thumbnails)
+
+
+def test_lru_cache_is_bounded(animation):
+    """Test that the frame cache never exceeds its size"""
+    first = animation[0]
+    
+    assert animation[0] is first, "Cached frame should be reused"
+    
+    for i in range(1, 10):
+        animation[i]
+    
+    assert len(animation._cache) == animation.cache_size
+    assert 0 not in animation._cache, "Least recently used frame should be evicted"
+
+
+def test_spin_result_animation():
+    """Test that a SpinResult exposes its frames without rendering the GIF"""
+    result = spin_wheel(["Yes", "No"], size=120, start_rotation=10.0, animation_speed=0.5)
+    
+    final_frame = result.animation[-1]
+    
+    assert final_frame.size == (120, 120)
+    assert not result.ready, "Accessing frames should not encode the GIF"
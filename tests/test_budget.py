@@ -0,0 +1,77 @@
+"""Test render budgets: cost model, planning and budgeted renders"""
+
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image
+
+from wheelspin import create_spinning_wheel_advanced
+from wheelspin.budget import MIN_BUDGET_FRAMES, CostModel, calibrate, plan_render
+
+
+@pytest.fixture
+def cost_model():
+    """Deterministic cost model: labels are expensive, rotation is cheap"""
+    return CostModel(reference_size=500, full_frame=0.002, per_label=0.001,
+                     fast_frame=0.004, encode_frame=0.006)
+
+
+def test_no_budget_keeps_natural_frames(cost_model):
+    """Test that without a budget the natural frame count is used"""
+    plan = plan_render(100, 500, cost_model=cost_model)
+    
+    assert plan['frames'] == plan['natural_frames'] == 202
+    assert plan['frame_duration_ms'] == 50
+    assert plan['quality_tier'] == 'full'
+
+
+def test_max_frames_caps_and_stretches(cost_model):
+    """Test that capped frames are stretched to keep the spin duration"""
+    plan = plan_render(100, 500, max_frames=101, cost_model=cost_model)
+    
+    assert plan['frames'] == 101
+    assert plan['frame_duration_ms'] == 100
+
+
+def test_time_budget_switches_tier_then_samples(cost_model):
+    """Test that a tight budget picks the cheaper tier and fewer frames"""
+    generous = plan_render(100, 500, max_render_time=100.0, cost_model=cost_model)
+    tight = plan_render(100, 500, max_render_time=1.0, cost_model=cost_model)
+    
+    assert generous['quality_tier'] == 'full' and generous['frames'] == 202
+    assert tight['quality_tier'] == 'fast'
+    assert MIN_BUDGET_FRAMES <= tight['frames'] < 202
+    assert tight['within_budget']
+    assert tight['predicted_seconds'] <= 1.0
+
+
+def test_impossible_budget_reports_miss(cost_model):
+    """Test that an unreachable budget is reported rather than hidden"""
+    plan = plan_render(100, 500, max_render_time=0.001, cost_model=cost_model)
+    
+    assert plan['frames'] == MIN_BUDGET_FRAMES
+    assert not plan['within_budget']
+
+
+def test_calibration_measures_host():
+    """Test that calibration produces usable costs"""
+    model = calibrate(reference_size=100, repeats=2)
+    
+    assert model.frame_seconds(500, 10, 'full') > 0
+    assert model.frame_seconds(500, 10, 'fast') > 0
+
+
+def test_budgeted_render(tmp_path):
+    """Test that a budgeted render honours the planned frame count"""
+    output_file = tmp_path / "budget.gif"
+    
+    winner, info = create_spinning_wheel_advanced(
+        ["A", "B", "C", "D"], str(output_file), size=150, start_rotation=20.0, max_frames=30
+    )
+    
+    assert info['budget']['frames'] == info['frames_generated'] == 30
+    with Image.open(output_file) as gif:
+        assert gif.n_frames == 30
+        assert gif.info['duration'] == 100
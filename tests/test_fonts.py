@@ -0,0 +1,185 @@
+"""Test the glyph coverage index and per-run font fallback"""
+
+import json
+import pytest
+import struct
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import ImageFont
+
+from wheelspin import fonts, wheel_generator
+from wheelspin.fonts import GlyphIndex, build_glyph_index, read_cmap
+from wheelspin.wheel_generator import WheelGenerator
+
+
+def make_font(cmap_subtable, platform=3, encoding=10):
+    """A minimal sfnt file whose only table is a cmap with one subtable"""
+    cmap = struct.pack('>HHHHI', 0, 1, platform, encoding, 12) + cmap_subtable
+    header = struct.pack('>IHHHH', 0x00010000, 1, 16, 0, 0)
+    directory = struct.pack('>4sIII', b'cmap', 0, 12 + 16, len(cmap))
+    return header + directory + cmap
+
+
+def format12(groups):
+    """A format 12 cmap subtable from (start, end, first glyph) groups"""
+    body = b''.join(struct.pack('>III', *group) for group in groups)
+    return struct.pack('>HHIII', 12, 0, 16 + len(body), 0, len(groups)) + body
+
+
+def format4(segments):
+    """A format 4 cmap subtable from (start, end, delta) segments, plus the final 0xFFFF segment"""
+    segments = list(segments) + [(0xFFFF, 0xFFFF, 1)]
+    count = len(segments)
+    body = (b''.join(struct.pack('>H', end) for _, end, _ in segments) + b'\0\0'
+            + b''.join(struct.pack('>H', start) for start, _, _ in segments)
+            + b''.join(struct.pack('>h', delta) for _, _, delta in segments)
+            + b'\0\0' * count)
+    return struct.pack('>HHHHHHH', 4, 14 + len(body), 0, 2 * count, 0, 0, 0) + body
+
+
+@pytest.fixture
+def default_font_bytes():
+    """Pillow's built-in scalable font"""
+    return ImageFont.load_default(12).font_bytes
+
+
+@pytest.fixture
+def index():
+    """Primary font with ASCII, fallback 1 with Cyrillic and Latin, fallback 2 with CJK"""
+    return GlyphIndex(['primary', 'cyrillic', 'cjk'],
+                      [[(0x20, 0x7E)], [(0x20, 0x7E), (0x400, 0x4FF)], [(0x3000, 0x9FFF)]])
+
+
+def test_read_format12():
+    """Test that format 12 groups become merged ranges"""
+    font = make_font(format12([(0x41, 0x5A, 1), (0x5B, 0x60, 27), (0x1F600, 0x1F64F, 40)]))
+    
+    assert read_cmap(font) == [(0x41, 0x60), (0x1F600, 0x1F64F)]
+
+
+def test_read_format4():
+    """Test that format 4 segments are read, skipping code points mapped to the missing glyph"""
+    font = make_font(format4([(0x30, 0x39, 1), (0x41, 0x43, -0x41)]), platform=3, encoding=1)
+    
+    assert read_cmap(font) == [(0x30, 0x39), (0x42, 0x43)]
+
+
+def test_read_collection():
+    """Test that a font collection (TTC) is read through its offset table"""
+    font = make_font(format12([(0x41, 0x42, 1)]))
+    collection = struct.pack('>4sIII', b'ttcf', 0x00010000, 1, 16) + font
+    # The font's table offsets are relative to the file, so shift them
+    collection = collection[:16 + 12 + 8] + struct.pack('>I', 16 + 28) + collection[16 + 12 + 12:]
+    
+    assert read_cmap(collection) == [(0x41, 0x42)]
+
+
+def test_read_real_font(default_font_bytes):
+    """Test that the built-in font's cmap covers ASCII and not CJK"""
+    ranges = read_cmap(default_font_bytes)
+    index = GlyphIndex(['default'], [ranges])
+    
+    assert index.covers(0, ord('A'))
+    assert not index.covers(0, ord('東'))
+
+
+def test_split_runs(index):
+    """Test that labels split into as few runs as possible, preferring the primary font"""
+    assert index.split_runs("Alice") == [("Alice", 0)]
+    assert index.split_runs("Москва") == [("Москва", 1)]
+    assert index.split_runs("Kyiv Київ") == [("Kyiv ", 0), ("Київ", 1)]
+    assert index.split_runs("Київ 2024") == [("Київ ", 1), ("2024", 0)]
+    assert index.split_runs("東京 Tokyo") == [("東京", 2), (" Tokyo", 0)]
+
+
+def test_uncovered_characters_stay_in_run(index):
+    """Test that characters no font has do not break a run"""
+    assert index.split_runs("Hi ☃ there") == [("Hi ☃ there", 0)]
+    assert index.font_for(ord('☃')) == 0
+
+
+def test_index_is_persisted(tmp_path, default_font_bytes, monkeypatch):
+    """Test that a second build reads the saved index instead of the fonts"""
+    fallback = tmp_path / 'fallback.ttf'
+    fallback.write_bytes(make_font(format12([(0x400, 0x4FF, 1)])))
+    built = build_glyph_index(default_font_bytes, [str(fallback)], directory=str(tmp_path))
+    
+    def fail(*args):
+        raise AssertionError("cmap read again")
+    
+    monkeypatch.setattr(fonts, 'read_cmap', fail)
+    loaded = build_glyph_index(default_font_bytes, [str(fallback)], directory=str(tmp_path))
+    
+    assert loaded.fonts == built.fonts
+    assert loaded.split_runs("Hi Москва") == [("Hi ", 0), ("Москва", 1)]
+    
+    fallback.write_bytes(make_font(format12([(0x600, 0x6FF, 1)])))  # changed font: rebuilt
+    with pytest.raises(AssertionError):
+        build_glyph_index(default_font_bytes, [str(fallback)], directory=str(tmp_path))
+
+
+@pytest.mark.parametrize("content", ['[]', '{"version": 1, "indexes": []}', '{"version": 1, "indexes": {"%s": []}}',
+                                     '{"version": 1, "indexes": {"%s": {"fonts": "x", "ranges": [[1]]}}}'])
+def test_malformed_cache_is_rebuilt(tmp_path, default_font_bytes, content):
+    """Test that a cache file of the wrong shape is ignored and replaced"""
+    built = build_glyph_index(default_font_bytes, [], directory=str(tmp_path))
+    path = tmp_path / fonts.INDEX_FILE
+    key = next(iter(json.loads(path.read_text())['indexes']))
+    path.write_text(content.replace('%s', key).replace('"version": 1', f'"version": {fonts.INDEX_VERSION}'))
+    
+    rebuilt = build_glyph_index(default_font_bytes, [], directory=str(tmp_path))
+    
+    assert rebuilt.fonts == built.fonts
+    assert key in json.loads(path.read_text())['indexes']
+
+
+def test_unreadable_fallbacks_are_skipped(tmp_path, default_font_bytes):
+    """Test that fonts without a usable cmap are left out of the index"""
+    broken = tmp_path / 'broken.ttf'
+    broken.write_bytes(b'not a font')
+    index = build_glyph_index(default_font_bytes, [str(broken), str(tmp_path / 'missing.ttf')],
+                              directory=str(tmp_path))
+    
+    assert len(index.fonts) == 1
+
+
+def test_labels_render_with_fallback_runs(tmp_path, default_font_bytes, monkeypatch):
+    """Test that a label is measured and drawn in runs, one font per run"""
+    fallback = tmp_path / 'fallback.ttf'
+    fallback.write_bytes(default_font_bytes)
+    # Pretend the primary font lacks digits, so they come from the fallback
+    index = GlyphIndex(['primary', str(fallback)], [[(0x20, 0x2F), (0x3A, 0x7E)], [(0x20, 0x7E)]])
+    monkeypatch.setattr(wheel_generator, '_glyph_indexes', {})
+    monkeypatch.setattr(wheel_generator, '_ascii_fonts', {})
+    monkeypatch.setattr(wheel_generator, 'glyph_index', lambda source: index)
+    monkeypatch.setattr(wheel_generator, 'covers_ascii', lambda source: False)
+    generator = WheelGenerator(size=200)
+    
+    dims = generator.get_text_dimensions("Room 101", 14)
+    plain = WheelGenerator(size=200)
+    plain.font_fallback = False
+    plain_dims = plain.get_text_dimensions("Room 101", 14)
+    
+    assert [(run, offset > 0) for run, _, offset in dims['runs']] == [("Room ", False), ("101", True)]
+    assert generator._font_cache[(str(fallback), 14)] is dims['runs'][1][1]
+    assert abs(dims['width'] - plain_dims['width']) <= 4  # same font, only hinting differs per run
+    sprite = generator.get_label_sprite("Room 101", 14)
+    assert sprite.getchannel('A').getbbox() is not None
+    assert plain.get_text_dimensions("Alice", 14)['runs'] is None
+
+
+def test_ascii_labels_skip_the_index(monkeypatch):
+    """Test that plain labels are measured without building the fallback index"""
+    def fail(source):
+        raise AssertionError("fallback index built")
+    
+    monkeypatch.setattr(wheel_generator, '_glyph_indexes', {})
+    monkeypatch.setattr(wheel_generator, '_ascii_fonts', {})
+    monkeypatch.setattr(wheel_generator, 'glyph_index', fail)
+    generator = WheelGenerator(size=200)
+    
+    assert generator.get_text_dimensions("Alice", 14)['runs'] is None
+    with pytest.raises(AssertionError):
+        generator.get_text_dimensions("Zoë", 14)
@@ -0,0 +1,102 @@
+"""Test rendering an animation into one raw pixel buffer"""
+
+import io
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image, ImageChops
+
+from wheelspin import SpinResult
+from wheelspin.frame_array import render_frame_array
+from wheelspin.wheel_generator import WheelGenerator
+
+
+@pytest.fixture
+def generator():
+    """Small generator for fast renders"""
+    return WheelGenerator(size=100)
+
+
+@pytest.fixture
+def labels():
+    """Sample labels"""
+    return ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve']
+
+
+def test_rgba_frames_match_rendered_frames(generator, labels):
+    """Test that each RGBA frame in the buffer equals the frame rendered on its own"""
+    frames = render_frame_array(generator, labels, 25.0, 8)
+    
+    assert frames.shape == (8, 100, 100, 4)
+    assert frames.data.shape == (8, 100, 100, 4)
+    for i in (0, 3, 7):
+        assert frames.frame(i).tobytes() == generator.create_animation_frame(labels, 25.0, i, 8).tobytes()
+
+
+def test_rgb_frames_use_background(generator, labels):
+    """Test that RGB frames are composited onto the background color"""
+    frames = render_frame_array(generator, labels, 25.0, 4, mode='RGB', background=(0, 0, 255))
+    
+    assert frames.shape == (4, 100, 100, 3)
+    assert frames.frame(0).getpixel((0, 0)) == (0, 0, 255)
+
+
+def test_palette_frames_share_one_palette(generator, labels):
+    """Test that palette frames index one shared palette and stay close to the originals"""
+    frames = render_frame_array(generator, labels, 25.0, 6, mode='P')
+    
+    assert frames.shape == (6, 100, 100)
+    assert len(frames.palette) == 768
+    assert frames.transparency == frames.data[0, 0, 0]
+    original = generator.create_animation_frame(labels, 25.0, 5, 6).convert('RGB')
+    difference = ImageChops.difference(frames.frame(5).convert('RGB'), original)
+    assert max(high for low, high in difference.getextrema()) <= 16
+
+
+def test_renders_into_preallocated_buffer(generator, labels):
+    """Test that frames are written into a caller's buffer without reallocating"""
+    out = bytearray(3 * 100 * 100 * 4)
+    frames = render_frame_array(generator, labels, 25.0, 3, out=out)
+    
+    assert frames.buffer is out
+    assert bytes(out[:4]) == bytes(frames.frame(0).getpixel((0, 0)))
+
+
+def test_rejects_bad_buffers_and_modes(generator, labels):
+    """Test that wrong-sized, read-only buffers and unknown modes are rejected"""
+    with pytest.raises(ValueError):
+        render_frame_array(generator, labels, 0.0, 3, out=bytearray(10))
+    with pytest.raises(ValueError):
+        render_frame_array(generator, labels, 0.0, 1, out=bytes(100 * 100 * 4))
+    with pytest.raises(ValueError):
+        render_frame_array(generator, labels, 0.0, 1, mode='CMYK')
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="buffer protocol on Python classes needs 3.12")
+def test_buffer_protocol(generator, labels):
+    """Test that memoryview() works on the frame array itself"""
+    frames = render_frame_array(generator, labels, 25.0, 2)
+    
+    assert memoryview(frames).shape == (2, 100, 100, 4)
+
+
+def test_numpy_view_shares_memory(generator, labels):
+    """Test that the NumPy view is zero-copy"""
+    numpy = pytest.importorskip("numpy")
+    frames = render_frame_array(generator, labels, 25.0, 2)
+    array = frames.numpy()
+    
+    assert array.shape == (2, 100, 100, 4) and array.dtype == numpy.uint8
+    array[0, 0, 0, 0] = 7
+    assert frames.buffer[0] == 7
+
+
+def test_spin_result_frames(labels):
+    """Test that SpinResult.frames() covers the whole animation"""
+    result = SpinResult(labels, 40.0, size=100)
+    frames = result.frames()
+    
+    assert len(frames) == result.info['frames_generated']
+    assert frames.frame(-1).tobytes() == Image.open(io.BytesIO(result.still(-1))).convert('RGBA').tobytes()
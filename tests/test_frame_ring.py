@@ -0,0 +1,127 @@
+"""Test rendering in worker processes with the shared memory frame ring"""
+
+import io
+import pickle
+import pytest
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wheelspin import SpinResult
+from wheelspin.frame_ring import FrameRing, render_gif_processes
+from wheelspin.wheel_generator import WheelGenerator
+
+
+class FailingGenerator(WheelGenerator):
+    """Generator whose fourth frame cannot be rendered"""
+
+    def create_animation_frame(self, labels, start_rotation, index, num_frames, angle_table=None):
+        if index == 3:
+            raise RuntimeError("broken frame")
+        return super().create_animation_frame(labels, start_rotation, index, num_frames, angle_table)
+
+
+class StalledGenerator(WheelGenerator):
+    """Generator that never finishes its first frame"""
+
+    def create_animation_frame(self, labels, start_rotation, index, num_frames, angle_table=None):
+        time.sleep(60)
+
+
+@pytest.fixture
+def generator():
+    """Small generator for fast renders"""
+    return WheelGenerator(size=120)
+
+
+@pytest.fixture
+def labels():
+    """Sample labels"""
+    return ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve', 'Frank']
+
+
+def test_ring_round_trip(generator, labels):
+    """Test that a frame read from a slot equals the frame written to it"""
+    frame = generator.create_animation_frame(labels, 10.0, 2, 10)
+    ring = FrameRing(generator.size, 2)
+    try:
+        ring.write(1, frame)
+        copy = ring.read(1, lambda image: image.copy())
+    finally:
+        ring.close()
+    
+    assert copy.tobytes() == frame.tobytes()
+
+
+@pytest.mark.parametrize("processes", [1, 2, 3])
+def test_process_output_is_identical(generator, labels, processes):
+    """Test that rendering in worker processes gives the same GIF as one process"""
+    expected = io.BytesIO()
+    generator.create_gif(labels, 33.0, expected, num_frames=17)
+    
+    parallel = io.BytesIO()
+    stats = render_gif_processes(generator, labels, 33.0, 17, parallel, processes=processes)
+    
+    assert parallel.getvalue() == expected.getvalue()
+    assert stats['frames'] == 17
+    assert stats['slots'] == 2 * processes
+
+
+def test_stats_match_thread_pipeline(generator, labels):
+    """Test that process stats use the run_pipeline() schema so info['pipeline'] is consistent"""
+    stats = render_gif_processes(generator, labels, 0.0, 6, io.BytesIO(), processes=2)
+    generator.create_gif(labels, 0.0, io.BytesIO(), num_frames=6)
+    threaded = generator.last_pipeline_stats
+    
+    assert set(threaded) <= set(stats)
+    assert set(stats['stages']) == set(threaded['stages'])
+    assert stats['bottleneck'] in stats['stages']
+    assert stats['stages']['render']['busy_s'] > 0
+
+
+def test_single_slot_ring(generator, labels):
+    """Test that a ring with fewer slots than workers still completes in order"""
+    expected = io.BytesIO()
+    generator.create_gif(labels, 5.0, expected, num_frames=9)
+    
+    parallel = io.BytesIO()
+    render_gif_processes(generator, labels, 5.0, 9, parallel, processes=3, slots=1)
+    
+    assert parallel.getvalue() == expected.getvalue()
+
+
+def test_worker_error_is_raised(labels):
+    """Test that an exception in a worker process surfaces in the caller"""
+    with pytest.raises(RuntimeError, match="broken frame"):
+        render_gif_processes(FailingGenerator(size=100), labels, 0.0, 8, io.BytesIO(), processes=2)
+
+
+def test_stalled_worker_times_out(labels):
+    """Test that a render which never completes raises TimeoutError instead of hanging"""
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        render_gif_processes(StalledGenerator(size=100), labels, 0.0, 4, io.BytesIO(), processes=1, timeout=1.0)
+    
+    assert time.perf_counter() - start < 30
+
+
+def test_generator_pickles_settings_only(generator):
+    """Test that a pickled generator keeps its settings and drops its caches"""
+    generator.min_font_px = 10
+    generator.get_text_dimensions('Alice', 12)
+    copy = pickle.loads(pickle.dumps(generator))
+    
+    assert copy.size == generator.size
+    assert copy.min_font_px == 10
+    assert copy._metrics_cache == {}
+
+
+def test_spin_result_processes(labels):
+    """Test that SpinResult renders with worker processes and reports them"""
+    result = SpinResult(labels, 42.0, size=120, processes=2)
+    
+    assert result.gif_bytes == SpinResult(labels, 42.0, size=120).gif_bytes
+    assert result.info['pipeline']['processes'] == 2
+    with pytest.raises(ValueError):
+        SpinResult(labels, 42.0, processes=0)
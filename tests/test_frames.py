@@ -5,6 +5,8 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from wheelspin.geometry import CAPPED_SPIN_FRAMES, FRAME_POLICIES, plan_frames, spin_rotation
+from wheelspin.result import SpinResult
 from wheelspin.wheel_generator import WheelGenerator
 
 
@@ -125,4 +127,54 @@ def test_animation_speed_multiplier():
     assert frames_fast > frames_normal, "Faster speed should produce more frames"
     assert frames_slow < frames_normal, "Slower speed should produce fewer frames"
     
-    print(f"\nSpeed test (50 segments): slow={frames_slow}f, normal={frames_normal}f, fast={frames_fast}f")
\ No newline at end of file
+    print(f"\nSpeed test (50 segments): slow={frames_slow}f, normal={frames_normal}f, fast={frames_fast}f")
+
+def test_frame_policies_for_huge_wheel():
+    """Test that log and capped policies shorten long spins, with large-wheel mode resolved as a spin does"""
+    def plan(segments, policy):
+        return SpinResult([f'Entry {i}' for i in range(segments)], 0.0, frame_policy=policy).frame_plan
+    
+    linear, log, capped = (plan(500, policy) for policy in ('linear', 'log', 'capped'))
+    assert linear['frames'] == calculate_expected_frames(500)
+    assert log['frames'] < 300
+    assert capped['frames'] == CAPPED_SPIN_FRAMES
+    assert log['linear_frames'] == linear['frames']
+    
+    # Above the large-wheel threshold the spin is already short, so no policy changes it
+    assert {plan(1000, policy)['frames'] for policy in FRAME_POLICIES} == {calculate_expected_frames(100)}
+    assert plan_frames(1000, large_mode=False, policy='log')['frames'] < 300
+    for policy in FRAME_POLICIES:
+        assert plan(8, policy)['frames'] == 60
+
+
+def test_frame_cap_is_hard_maximum():
+    """Test that frame_cap bounds the frame count under every policy"""
+    for policy in FRAME_POLICIES:
+        assert plan_frames(1000, policy=policy, frame_cap=50)['frames'] == 50
+    
+    with pytest.raises(ValueError):
+        plan_frames(10, frame_cap=0)
+    with pytest.raises(ValueError):
+        plan_frames(10, policy='exponential')
+
+
+def test_compressed_spin_retimes_easing():
+    """Test that a shortened spin uses a steeper ease-out that still ends two turns on"""
+    plan = plan_frames(1000, policy='log')
+    
+    assert plan_frames(8)['easing_power'] == 3.0
+    assert 3.0 < plan['easing_power'] <= 5.0
+    assert spin_rotation(1, 1, 10.0, easing_power=plan['easing_power']) == pytest.approx(730.0)
+    # The last tenth of the spin moves less than with the cubic curve, so it reads as slowing down
+    frames = plan['frames']
+    tail = 2 * 360 - spin_rotation(frames - frames // 10, frames, 0.0, easing_power=plan['easing_power'])
+    assert tail < 2 * 360 - spin_rotation(frames - frames // 10, frames, 0.0)
+
+
+def test_frame_policy_reported_in_info():
+    """Test that SpinResult reports the frame policy and renders with its easing"""
+    result = SpinResult([f"E{i}" for i in range(1000)], 0.0, size=200, frame_policy='log', frame_cap=100)
+    
+    assert result.info['frame_policy']['policy'] == 'log'
+    assert result.info['frames_generated'] == 100
+    assert result._create_generator().easing_power == result.info['frame_policy']['easing_power']
@@ -0,0 +1,65 @@
+"""Test that importing wheelspin stays lightweight"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Generous budget: a bare `import wheelspin` should be far below this
+IMPORT_BUDGET_SECONDS = 0.25
+
+
+def run_python(code):
+    """Run code in a fresh interpreter and return its stripped stdout"""
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                            text=True, cwd=str(REPO_ROOT), check=True)
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_pillow():
+    """Test that importing the package does not import PIL"""
+    output = run_python("import sys, wheelspin; print('PIL' in sys.modules)")
+    
+    assert output == "False", "import wheelspin should not import Pillow"
+
+
+def test_winner_without_pillow():
+    """Test that winners can be computed without loading Pillow"""
+    output = run_python(
+        "import sys, wheelspin\n"
+        "index, name = wheelspin.calculate_winner(10.0, ['A', 'B', 'C', 'D'])\n"
+        "winner, info = wheelspin.pick_winner(['A', 'B', 'C', 'D'], start_rotation=10.0)\n"
+        "print(index, name, winner, 'PIL' in sys.modules)"
+    )
+    
+    assert output == "3 D D False"
+
+
+def test_import_time_budget():
+    """Test that a cold import of the package stays within budget"""
+    output = run_python(
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import wheelspin\n"
+        "print(time.perf_counter() - start)"
+    )
+    elapsed = float(output)
+    
+    assert elapsed < IMPORT_BUDGET_SECONDS, \
+        f"import wheelspin took {elapsed * 1000:.1f}ms (budget {IMPORT_BUDGET_SECONDS * 1000:.0f}ms)"
+    
+    print(f"\nimport wheelspin: {elapsed * 1000:.1f}ms")
+
+
+def test_pick_winner_matches_render():
+    """Test that pick_winner agrees with the rendering generator"""
+    from wheelspin import pick_winner
+    from wheelspin.wheel_generator import WheelGenerator
+    
+    names = ["Alice", "Bob", "Charlie", "Diana", "Eve"]
+    for rotation in [0.0, 45.5, 123.4, 270.0, 359.9]:
+        winner, info = pick_winner(names, start_rotation=rotation)
+        index, name = WheelGenerator().calculate_winner(rotation, names)
+        
+        assert (info['winner_index'], winner) == (index, name)
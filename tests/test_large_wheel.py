@@ -0,0 +1,107 @@
+"""Test large-wheel mode and the compact EntrantIndex"""
+
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wheelspin import EntrantIndex, calculate_winner, spin_wheel
+from wheelspin.geometry import LARGE_WHEEL_THRESHOLD
+from wheelspin.wheel_generator import WheelGenerator
+
+
+@pytest.fixture
+def entrants():
+    """20k raffle entrants"""
+    return EntrantIndex(f"Entrant {i}" for i in range(20000))
+
+
+def test_entrant_index_sequence(entrants):
+    """Test that EntrantIndex behaves like a list of names"""
+    assert len(entrants) == 20000
+    assert entrants[0] == "Entrant 0"
+    assert entrants[-1] == "Entrant 19999"
+    assert entrants[10:13] == ["Entrant 10", "Entrant 11", "Entrant 12"]
+    
+    with pytest.raises(IndexError):
+        entrants[20000]
+
+
+def test_entrant_index_unicode():
+    """Test that non-ASCII names round-trip"""
+    names = ["東京", "Москва", "Zürich", ""]
+    
+    assert list(EntrantIndex(names)) == names
+
+
+def test_large_mode_selection():
+    """Test automatic and explicit large-wheel mode"""
+    generator = WheelGenerator()
+    
+    assert not generator.is_large_wheel(LARGE_WHEEL_THRESHOLD)
+    assert generator.is_large_wheel(LARGE_WHEEL_THRESHOLD + 1)
+    assert WheelGenerator(large_mode=True).is_large_wheel(8)
+    assert not WheelGenerator(large_mode=False).is_large_wheel(20000)
+
+
+def test_large_wheel_frame_count_is_bounded():
+    """Test that spin duration stops growing with entrant count"""
+    generator = WheelGenerator()
+    
+    assert generator.calculate_frames(20000) == generator.calculate_frames(100000)
+    assert generator.calculate_frames(20000) == generator.calculate_frames(100)
+
+
+def test_large_wheel_disk_rendered_once(entrants):
+    """Test that frames reuse the cached disk"""
+    generator = WheelGenerator(size=200)
+    
+    first = generator.create_wheel_frame(len(entrants), 10.0, entrants)
+    disk = generator._large_disk
+    second = generator.create_wheel_frame(len(entrants), 55.0, entrants, highlight=True)
+    
+    assert generator._large_disk is disk, "Disk should not be re-rendered between frames"
+    assert first.size == second.size == (200, 200)
+    assert first.tobytes() != second.tobytes()
+
+
+def test_large_wheel_disk_follows_label_edits(entrants):
+    """Test that editing a label in place redraws the cached disk"""
+    generator = WheelGenerator(size=400)
+    labels = list(entrants)
+    disk = generator.render_large_disk(labels)[0]
+    
+    assert generator.render_large_disk(list(labels))[0] is disk
+    labels[0] = 'Somebody else entirely'
+    assert generator.render_large_disk(labels)[0] is not disk
+
+
+def test_entrant_index_disk_lookup_decodes_nothing(entrants, monkeypatch):
+    """Test that finding the cached disk of an EntrantIndex wheel does not decode entrant names"""
+    generator = WheelGenerator(size=200)
+    disk = generator.render_large_disk(entrants)[0]
+    
+    def fail(self, index):
+        raise AssertionError("entrant decoded")
+    
+    monkeypatch.setattr(EntrantIndex, '__getitem__', fail)
+    assert generator.render_large_disk(entrants)[0] is disk
+    monkeypatch.undo()
+    assert EntrantIndex(list(entrants)).content_key == entrants.content_key
+
+
+def test_large_wheel_winner(entrants):
+    """Test that the winner is resolved arithmetically for a large wheel"""
+    result = spin_wheel(entrants, size=150, start_rotation=123.4)
+    
+    assert result.info['large_mode']
+    assert (result.winner_index, result.winner) == calculate_winner(123.4, entrants)
+    assert result.winner == f"Entrant {result.winner_index}"
+
+
+def test_large_wheel_gif(entrants):
+    """Test rendering a complete large-wheel GIF"""
+    result = spin_wheel(entrants, size=120, start_rotation=5.0, animation_speed=0.25)
+    
+    assert result.gif_bytes[:6] == b"GIF89a"
+    assert result.info['frames_generated'] == 50
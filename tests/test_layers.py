@@ -0,0 +1,133 @@
+"""Test the separately cached slice, label and overlay layers"""
+
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image, ImageChops, ImageDraw
+
+from wheelspin.layers import LayerCache, layer_cache
+from wheelspin.wheel_generator import WheelGenerator
+
+
+@pytest.fixture
+def labels():
+    """Labels of a small wheel"""
+    return ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve']
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with an empty process-wide layer cache"""
+    layer_cache.clear()
+    yield
+    layer_cache.clear()
+
+
+def test_new_colors_reuse_label_layer(labels):
+    """Test that a color theme redraws the slices but not the labels"""
+    WheelGenerator(size=200).render_layers(labels)
+    WheelGenerator(size=200, colors=['#112233', '#445566']).render_layers(labels)
+    
+    stats = layer_cache.stats()
+    assert stats['misses'] == {'slices': 2, 'labels': 1, 'overlay': 1}
+    assert stats['hits']['labels'] == 1
+
+
+def test_new_labels_reuse_slice_layer(labels):
+    """Test that translated labels redraw the labels but not the slices"""
+    generator = WheelGenerator(size=200)
+    generator.render_layers(labels)
+    generator.render_layers(['Alicia', 'Roberto', 'Carlos', 'Diana', 'Eva'])
+    
+    stats = layer_cache.stats()
+    assert stats['misses'] == {'slices': 1, 'labels': 2, 'overlay': 1}
+
+
+def test_pointer_style_only_redraws_overlay(labels):
+    """Test that restyling the pointer touches neither slices nor labels"""
+    generator = WheelGenerator(size=200)
+    _, plain = generator.render_layers(labels)
+    generator.pointer_color = '#ff0000'
+    generator.hub_color = '#00ff00'
+    _, styled = generator.render_layers(labels)
+    
+    assert layer_cache.stats()['misses'] == {'slices': 1, 'labels': 1, 'overlay': 2}
+    assert styled.getpixel((100, 100)) == (0, 255, 0, 255)
+    assert ImageChops.difference(plain.convert('RGB'), styled.convert('RGB')).getbbox()
+
+
+def test_composed_disk_matches_drawn_disk(labels):
+    """Test that slices plus labels look like a disk drawn in one pass"""
+    generator = WheelGenerator(size=200)
+    composed, _ = generator.render_layers(labels)
+    drawn = Image.new('RGBA', (200, 200), generator.transparent_color)
+    generator.draw_disk(ImageDraw.Draw(drawn), len(labels), 0, labels)
+    
+    difference = ImageChops.difference(composed.convert('RGB'), drawn.convert('RGB')).convert('L')
+    assert sum(difference.histogram()[32:]) < 0.01 * 200 * 200
+
+
+def test_large_wheel_layers_shared_across_themes():
+    """Test that large wheels in two color themes share their label layer"""
+    labels = [f"E{i}" for i in range(600)]
+    weights = [1.0] * 600
+    weights[0] = 400.0
+    for colors in (None, ['#101010', '#202020', '#303030']):
+        generator = WheelGenerator(size=200, colors=colors)
+        generator.render_large_disk(labels, generator.build_angle_table(labels, weights))
+    
+    stats = layer_cache.stats()
+    assert stats['misses']['slices'] == 2 and stats['misses']['labels'] == 1
+
+
+def test_cache_drops_least_recently_used():
+    """Test that the cache stays within its byte limit, dropping the oldest entry"""
+    cache = LayerCache(max_bytes=2 * 100)
+    for key in ('a', 'b'):
+        cache.get('slices', key, lambda: Image.new('L', (10, 10)))
+    cache.get('slices', 'a', lambda: None)  # refreshes 'a'
+    cache.get('slices', 'c', lambda: Image.new('L', (10, 10)))
+    
+    assert cache.stats()['entries'] == 2 and cache.stats()['bytes'] == 200
+    assert cache.get('slices', 'a', lambda: None) is not None
+    assert cache.stats()['misses']['slices'] == 3
+
+
+def test_oversized_layer_is_not_kept():
+    """Test that a layer larger than the whole budget is returned but not cached"""
+    cache = LayerCache(max_bytes=100)
+    image = cache.get('labels', 'big', lambda: Image.new('RGBA', (10, 10)))
+    
+    assert image.size == (10, 10)
+    assert cache.stats()['entries'] == 0 and cache.stats()['bytes'] == 0
+
+
+def test_many_segment_frames_compose_from_layers():
+    """Test that frames of wheels with many labels rotate the cached layers, reused across themes"""
+    labels = [f"Entrant {i}" for i in range(40)]
+    themed = WheelGenerator(size=200, colors=['#101010', '#909090'])
+    WheelGenerator(size=200).create_wheel_frame(len(labels), 10.0, labels)
+    frame = themed.create_wheel_frame(len(labels), 10.0, labels)
+    
+    stats = layer_cache.stats()
+    assert stats['misses'] == {'slices': 2, 'labels': 1, 'overlay': 1}
+    assert stats['hits']['overlay'] >= 1
+    drawn = Image.new('RGBA', (200, 200), themed.transparent_color)
+    themed.draw_disk(ImageDraw.Draw(drawn), len(labels), 10.0, labels)
+    themed.draw_overlay(ImageDraw.Draw(drawn), 100, 80)
+    difference = ImageChops.difference(frame.convert('RGB'), drawn.convert('RGB')).convert('L')
+    assert sum(difference.histogram()[96:]) < 0.05 * 200 * 200
+
+
+def test_pasted_overlay_matches_drawn_overlay(labels):
+    """Test that frames get exactly the pixels draw_overlay() would draw"""
+    generator = WheelGenerator(size=200)
+    generator.pointer_color = '#3366ff'
+    pasted = Image.new('RGBA', (200, 200), generator.transparent_color)
+    drawn = pasted.copy()
+    generator.paste_overlay(pasted)
+    generator.draw_overlay(ImageDraw.Draw(drawn), 100, 80)
+    
+    assert pasted.tobytes() == drawn.tobytes()
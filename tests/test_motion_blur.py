@@ -0,0 +1,83 @@
+"""Test motion-blurred animation frames"""
+
+import io
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image, ImageChops
+
+from wheelspin import SpinResult
+from wheelspin.wheel_generator import WheelGenerator
+
+
+@pytest.fixture
+def labels():
+    """Labels of a medium wheel"""
+    return [f"Entrant {i}" for i in range(12)]
+
+
+def test_fast_frames_are_blurred(labels):
+    """Test that fast frames differ from sharp ones and slow final frames do not"""
+    sharp = WheelGenerator(size=200)
+    blurred = WheelGenerator(size=200, motion_blur=True)
+    
+    first = blurred.create_animation_frame(labels, 10.0, 0, 30)
+    assert ImageChops.difference(first, sharp.create_animation_frame(labels, 10.0, 0, 30)).getbbox()
+    last = blurred.create_animation_frame(labels, 10.0, 29, 30)
+    assert not ImageChops.difference(last, sharp.create_animation_frame(labels, 10.0, 29, 30)).getbbox()
+
+
+def test_blurred_frame_keeps_overlay_and_background(labels):
+    """Test that the hub stays sharp and the corners stay transparent"""
+    generator = WheelGenerator(size=200, motion_blur=True)
+    frame = generator.create_blurred_frame(45.0, 40.0, labels)
+    
+    assert frame.mode == 'RGBA' and frame.size == (200, 200)
+    assert frame.getpixel((0, 0))[3] == 0
+    assert frame.getpixel((100, 100)) == (255, 255, 255, 255)
+
+
+def test_blur_disk_is_cached(labels):
+    """Test that the base disk is drawn once per wheel"""
+    generator = WheelGenerator(size=200, motion_blur=True)
+    disk, mask = generator.render_blur_disk(labels)
+    
+    assert generator.render_blur_disk(labels)[0] is disk
+    assert disk.mode == 'RGB' and mask.mode == 'L'
+
+
+def test_blur_disk_is_keyed_by_content(labels):
+    """Test that an equal rebuilt angle table reuses the disk and an edited label redraws it"""
+    generator = WheelGenerator(size=200, motion_blur=True)
+    weights = [1 + i % 3 for i in range(len(labels))]
+    disk = generator.render_blur_disk(labels, generator.build_angle_table(labels, weights))[0]
+    
+    assert generator.render_blur_disk(list(labels), generator.build_angle_table(labels, weights))[0] is disk
+    edited = list(labels)
+    edited[0] = 'Zed'
+    assert generator.render_blur_disk(edited, generator.build_angle_table(labels, weights))[0] is not disk
+
+
+def test_large_wheel_blur_uses_large_disk():
+    """Test that large wheels blur their banded disk"""
+    labels = [f"E{i}" for i in range(800)]
+    generator = WheelGenerator(size=200, motion_blur=True)
+    
+    assert generator.render_blur_disk(labels)[0] is generator.render_large_disk(labels)[0]
+    assert generator.create_animation_frame(labels, 0.0, 0, 40).size == (200, 200)
+
+
+def test_motion_blur_halves_frames(labels):
+    """Test that SpinResult renders half the frames, each twice as long"""
+    sharp = SpinResult(labels, 30.0, size=150)
+    blurred = SpinResult(labels, 30.0, size=150, motion_blur=True)
+    
+    assert blurred.info['motion_blur'] is True
+    assert blurred.info['frames_generated'] == sharp.info['frames_generated'] // 2
+    assert blurred.winner == sharp.winner
+    
+    with Image.open(io.BytesIO(blurred.gif_bytes)) as gif:
+        assert gif.n_frames == blurred.info['frames_generated']
+        assert gif.info['duration'] == 100
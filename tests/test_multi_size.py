@@ -0,0 +1,124 @@
+"""Test multi-resolution output from a single render pass"""
+
+import io
+import pytest
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image
+
+from wheelspin import SpinResult, create_spinning_wheel_sizes, pick_winner, wheel_generator
+from wheelspin.encoding import downscale, encode_gif
+from wheelspin.pipeline import QUEUE_SIZE
+from wheelspin.wheel_generator import WheelGenerator
+
+
+@pytest.fixture
+def segments():
+    """Sample segments"""
+    return ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve', 'Frank']
+
+
+def _last_frame(path):
+    with Image.open(path) as gif:
+        frames = gif.n_frames
+        gif.seek(frames - 1)
+        return frames, gif.convert('RGB')
+
+
+def test_sizes_written_from_one_render(segments, tmp_path):
+    """Test that every output has its size and the same frames and winner"""
+    outputs = {size: str(tmp_path / f'wheel_{size}.gif') for size in (60, 120, 240)}
+    winner, info = create_spinning_wheel_sizes(segments, outputs, start_rotation=77.0)
+    
+    assert winner == pick_winner(segments, start_rotation=77.0)[0]
+    assert info['outputs'] == outputs
+    assert info['size'] == 240
+    for size, path in outputs.items():
+        with Image.open(path) as gif:
+            assert gif.size == (size, size)
+            assert gif.n_frames == info['frames_generated']
+
+
+def test_outputs_match_downscaled_render(segments, tmp_path):
+    """Test that smaller outputs are the full render scaled down"""
+    outputs = {size: str(tmp_path / f'wheel_{size}.gif') for size in (100, 200)}
+    create_spinning_wheel_sizes(segments, outputs, start_rotation=12.0)
+    
+    _, small = _last_frame(outputs[100])
+    _, large = _last_frame(outputs[200])
+    expected = large.resize((100, 100), Image.Resampling.BOX)
+    for point in [(50, 20), (20, 50), (75, 70)]:
+        assert sum(abs(a - b) for a, b in zip(small.getpixel(point), expected.getpixel(point))) < 90
+
+
+def test_label_minimum_scales_with_smallest_output(segments):
+    """Test that labels are sized to stay legible at the smallest output"""
+    result = SpinResult(segments, 0.0, size=400)
+    normal = result._create_generator()
+    scaled = result._create_generator(label_scale=4.0)
+    
+    assert scaled.min_font_px == 4 * normal.min_font_px
+    assert scaled.calculate_dynamic_font_size(190, 60.0, 'outer', 6) >= 32
+
+
+def test_single_size_equals_plain_render(segments, tmp_path):
+    """Test that one output is identical to a normal render"""
+    path = tmp_path / 'only.gif'
+    result = SpinResult(segments, 5.0, size=120)
+    result.save_sizes({120: str(path)})
+    
+    assert path.read_bytes() == SpinResult(segments, 5.0, size=120).gif_bytes
+
+
+def test_invalid_outputs(segments):
+    """Test that empty outputs or a mismatched largest size are rejected"""
+    with pytest.raises(ValueError):
+        create_spinning_wheel_sizes(segments, {})
+    with pytest.raises(ValueError):
+        SpinResult(segments, 0.0, size=200).save_sizes({100: 'small.gif'})
+
+
+def test_rendering_waits_for_slow_encoder(segments, tmp_path, monkeypatch):
+    """Test that frames are not rendered far ahead of an encoder that falls behind"""
+    generator = WheelGenerator(size=100)
+    rendered = []
+    render = generator.create_animation_frame
+    monkeypatch.setattr(generator, 'create_animation_frame', lambda *args: rendered.append(args[2]) or render(*args))
+    ahead = []
+    
+    def slow_encode(frames, output_file, duration):
+        for i, _ in enumerate(frames):
+            time.sleep(0.01)
+            ahead.append(len(rendered) - i)
+    
+    monkeypatch.setattr(wheel_generator, 'encode_gif', slow_encode)
+    generator.create_gifs(segments, 0.0, {100: str(tmp_path / 'a.gif'), 50: str(tmp_path / 'b.gif')}, num_frames=24)
+    
+    assert len(ahead) == 48
+    assert max(ahead) <= QUEUE_SIZE + 2
+
+
+def test_encoder_failure_stops_rendering(segments, tmp_path, monkeypatch):
+    """Test that a failed encoder is reported instead of blocking the renderer"""
+    def failing_encode(frames, output_file, duration):
+        next(iter(frames))
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(wheel_generator, 'encode_gif', failing_encode)
+    with pytest.raises(OSError, match="disk full"):
+        WheelGenerator(size=100).create_gifs(segments, 0.0, {100: str(tmp_path / 'a.gif')}, num_frames=40)
+
+
+def test_encode_gif_accepts_iterators():
+    """Test that frames can be streamed into the encoder"""
+    frames = (downscale(Image.new('RGBA', (40, 40), (255, 0, 0, 255)), 20) for _ in range(3))
+    buffer = io.BytesIO()
+    encode_gif(frames, buffer)
+    
+    buffer.seek(0)
+    with Image.open(buffer) as gif:
+        assert gif.size == (20, 20)
+        assert gif.n_frames == 1  # identical frames are merged by Pillow
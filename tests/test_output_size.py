@@ -0,0 +1,119 @@
+"""Test output size targeting: encoding options and max_bytes fitting"""
+
+import io
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image
+
+from wheelspin import SpinResult, create_spinning_wheel_advanced
+from wheelspin.encoding import encode_gif
+from wheelspin.geometry import MIN_IMAGE_SIZE
+from wheelspin.wheel_generator import WheelGenerator
+
+
+@pytest.fixture
+def frames():
+    """A few consecutive frames of a small wheel"""
+    generator = WheelGenerator(size=120)
+    labels = ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve']
+    return [generator.create_animation_frame(labels, 30.0, i, 20) for i in range(4)]
+
+
+@pytest.mark.parametrize("palette_size,delta", [(None, False), (64, False), (256, True)])
+def test_encode_gif_round_trips(frames, palette_size, delta):
+    """Test that every encoding option produces a readable animation"""
+    buffer = io.BytesIO()
+    encode_gif(frames, buffer, duration=80, palette_size=palette_size, delta=delta)
+    
+    buffer.seek(0)
+    with Image.open(buffer) as gif:
+        assert gif.n_frames == len(frames)
+        assert gif.info['duration'] == 80
+        gif.seek(gif.n_frames - 1)
+        final = gif.convert('RGB')
+    
+    expected = frames[-1].convert('RGB')
+    center = (60, 30)
+    assert sum(abs(a - b) for a, b in zip(final.getpixel(center), expected.getpixel(center))) < 120
+
+
+def test_palette_size_limits_colors(frames):
+    """Test that palette_size bounds the number of colors in each frame"""
+    buffer = io.BytesIO()
+    encode_gif(frames, buffer, palette_size=32)
+    
+    buffer.seek(0)
+    with Image.open(buffer) as gif:
+        assert len(gif.convert('RGB').getcolors(1024)) <= 32
+
+
+def test_max_bytes_fits_limit():
+    """Test that a reachable limit is met and the trade-offs are reported"""
+    segments = ['Alice', 'Bob', 'Charlie', 'Diana']
+    unlimited = SpinResult(segments, 42.0, size=200)
+    limit = len(unlimited.gif_bytes) // 2
+    
+    result = SpinResult(segments, 42.0, size=200, max_bytes=limit)
+    data = result.gif_bytes
+    target = result.info['size_target']
+    
+    assert len(data) <= limit
+    assert target['within_limit']
+    assert target['output_bytes'] == len(data)
+    assert target['tradeoffs']
+    assert 1 <= target['attempts'] <= 3
+    assert result.info['frames_generated'] == target['frames']
+    with Image.open(io.BytesIO(data)) as gif:
+        assert gif.n_frames == target['frames']
+        assert gif.size == (target['size'], target['size'])
+
+
+def test_generous_limit_keeps_quality():
+    """Test that a limit above the natural size changes nothing"""
+    natural = SpinResult(['Yes', 'No'], 10.0, size=150)
+    result = SpinResult(['Yes', 'No'], 10.0, size=150, max_bytes=10_000_000)
+    result.render()
+    target = result.info['size_target']
+    
+    assert target['tradeoffs'] == []
+    assert target['size'] == 150
+    assert target['frames'] == natural.info['frames_generated']
+    assert result.gif_bytes == natural.gif_bytes
+
+
+def test_unreachable_limit_is_reported():
+    """Test that an impossible limit returns the smallest output and says so"""
+    result = SpinResult(['Yes', 'No'], 10.0, size=150, max_bytes=100)
+    result.render()
+    
+    assert not result.info['size_target']['within_limit']
+    assert result.info['size_target']['scale'] < 1.0
+
+
+def test_small_wheel_is_not_scaled_below_minimum():
+    """Test that a tight limit on a small wheel never renders an image too small for a disk"""
+    result = SpinResult(['A', 'B', 'C'], 10.0, size=60, max_bytes=2000)
+    result.render()
+    target = result.info['size_target']
+    
+    assert target['size'] >= MIN_IMAGE_SIZE
+    assert target['output_bytes'] == len(result.gif_bytes)
+
+
+def test_advanced_max_bytes(tmp_path):
+    """Test that create_spinning_wheel_advanced writes the fitted file"""
+    output = tmp_path / 'wheel.gif'
+    winner, info = create_spinning_wheel_advanced(['A', 'B', 'C'], str(output), size=150,
+                                                  start_rotation=5.0, max_bytes=60_000)
+    
+    assert output.stat().st_size == info['size_target']['output_bytes']
+    assert info['winner_name'] == winner
+
+
+def test_invalid_max_bytes():
+    """Test that a non-positive limit is rejected"""
+    with pytest.raises(ValueError):
+        SpinResult(['A', 'B'], 0.0, max_bytes=0)
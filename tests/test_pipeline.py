@@ -0,0 +1,109 @@
+"""Test the pipelined render/quantize/encode path"""
+
+import io
+import pytest
+import sys
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image
+
+from wheelspin import SpinResult, pipeline
+from wheelspin.encoding import encode_gif
+from wheelspin.pipeline import STAGES, run_pipeline
+from wheelspin.wheel_generator import WheelGenerator
+
+
+@pytest.fixture
+def generator():
+    """Small generator for fast renders"""
+    return WheelGenerator(size=120)
+
+
+@pytest.fixture
+def labels():
+    """Sample labels"""
+    return ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve', 'Frank']
+
+
+def test_pipeline_output_is_identical(generator, labels):
+    """Test that the pipelined GIF is byte-identical to encoding all frames at once"""
+    frames = [generator.create_animation_frame(labels, 20.0, i, 30) for i in range(30)]
+    expected = io.BytesIO()
+    encode_gif(frames, expected)
+    
+    pipelined = io.BytesIO()
+    run_pipeline(lambda i: frames[i], 30, pipelined)
+    
+    assert pipelined.getvalue() == expected.getvalue()
+
+
+def test_pipeline_reports_stage_utilization(generator, labels):
+    """Test that every stage reports busy time and the bottleneck is named"""
+    stats = run_pipeline(lambda i: generator.create_animation_frame(labels, 0.0, i, 12), 12, io.BytesIO())
+    
+    assert stats['frames'] == 12
+    assert set(stats['stages']) == set(STAGES)
+    for stage in stats['stages'].values():
+        assert stage['busy_s'] >= 0
+        assert 0 <= stage['utilization'] <= 1.5  # threads can be descheduled while timed
+    assert stats['bottleneck'] in STAGES
+
+
+def test_final_write_is_its_own_stage(monkeypatch):
+    """Test that work the GIF writer does after the last frame is reported as 'write', not 'encode'"""
+    def slow_encode(frames, output_file, duration):
+        for _ in frames:
+            pass
+        time.sleep(0.2)  # like Pillow compressing every frame at the end
+    
+    monkeypatch.setattr(pipeline, 'encode_gif', slow_encode)
+    stats = run_pipeline(lambda i: Image.new('RGBA', (20, 20)), 5, io.BytesIO())
+    
+    assert stats['stages']['write']['busy_s'] >= 0.2
+    assert stats['stages']['encode']['busy_s'] < 0.1
+
+
+def test_render_errors_propagate(generator, labels):
+    """Test that a failing render raises in the caller without hanging"""
+    def render(i):
+        if i == 5:
+            raise RuntimeError("render failed")
+        return generator.create_animation_frame(labels, 0.0, i, 20)
+    
+    with pytest.raises(RuntimeError, match="render failed"):
+        run_pipeline(render, 20, io.BytesIO())
+    assert threading.active_count() < 5
+
+
+def test_backpressure_bounds_rendered_frames(generator, labels, monkeypatch):
+    """Test that rendering never runs far ahead of a slow palette stage"""
+    quantized = []
+    original = pipeline.quantize_adaptive
+    
+    def slow_quantize(frame):
+        time.sleep(0.005)
+        quantized.append(frame)
+        return original(frame)
+    
+    monkeypatch.setattr(pipeline, 'quantize_adaptive', slow_quantize)
+    frame = generator.create_animation_frame(labels, 0.0, 0, 10)
+    ahead = []
+    
+    def render(i):
+        ahead.append(i - len(quantized))
+        return frame.rotate(i)
+    
+    run_pipeline(render, 30, io.BytesIO(), queue_size=2)
+    # One frame in the queue, one being put and one being converted at most
+    assert max(ahead) <= 2 + 2
+
+
+def test_create_gif_uses_pipeline(labels):
+    """Test that SpinResult reports the pipeline statistics of its render"""
+    result = SpinResult(labels, 42.0, size=120)
+    result.render()
+    
+    assert result.info['pipeline']['frames'] == result.info['frames_generated']
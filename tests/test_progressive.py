@@ -0,0 +1,145 @@
+"""Test progressive GIF delivery and the HTTP streaming server"""
+
+import http.client
+import io
+import pytest
+import sys
+import threading
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image, ImageChops
+
+from wheelspin import SpinResult, spin_wheel
+from wheelspin.progressive import iter_gif, iter_spin_gif
+from wheelspin.server import create_server
+from wheelspin.wheel_generator import WheelGenerator
+
+
+@pytest.fixture
+def generator():
+    """Small generator for fast renders"""
+    return WheelGenerator(size=120)
+
+
+@pytest.fixture
+def labels():
+    """Sample labels"""
+    return ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve']
+
+
+@pytest.fixture
+def server():
+    """A spin server on a free local port"""
+    server = create_server(port=0, warm=False)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _opaque_rgb(frame):
+    """RGB of the opaque pixels only, black elsewhere"""
+    mask = frame.getchannel('A').point(lambda value: 255 if value >= 128 else 0)
+    image = Image.new('RGB', frame.size)
+    image.paste(frame.convert('RGB'), mask=mask)
+    return image
+
+
+def test_chunks_form_a_complete_gif(generator, labels):
+    """Test that the chunks decode to every frame of the spin, close to the originals"""
+    data = b''.join(iter_spin_gif(generator, labels, 20.0, 12))
+    gif = Image.open(io.BytesIO(data))
+    
+    assert gif.n_frames == 12
+    assert gif.info['duration'] == 50
+    for i in (0, 11):
+        gif.seek(i)
+        original = generator.create_animation_frame(labels, 20.0, i, 12)
+        difference = ImageChops.difference(_opaque_rgb(gif.convert('RGBA')), _opaque_rgb(original))
+        assert max(high for low, high in difference.getextrema()) <= 24
+
+
+def test_header_after_first_frame(labels):
+    """Test that the header is yielded before the second frame is rendered"""
+    rendered = []
+    
+    def frames():
+        generator = WheelGenerator(size=100)
+        for i in range(5):
+            rendered.append(i)
+            yield generator.create_animation_frame(labels, 0.0, i, 5)
+    
+    chunks = iter_gif(frames())
+    header = next(chunks)
+    
+    assert header.startswith(b'GIF89a')
+    assert len(header) == 13 + 768
+    assert rendered == [0]
+    assert list(chunks)[-1] == b';'
+
+
+def test_no_frames():
+    """Test that an empty animation is rejected"""
+    with pytest.raises(ValueError):
+        next(iter_gif([]))
+
+
+def test_spin_result_iter_gif(labels):
+    """Test that SpinResult.iter_gif() has one chunk per frame plus header and trailer"""
+    result = SpinResult(labels, 42.0, size=100)
+    
+    assert len(list(result.iter_gif())) == result.info['frames_generated'] + 2
+
+
+def test_server_streams_chunked_gif(server, labels):
+    """Test that the server streams the spin with the winner in the headers"""
+    connection = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=30)
+    connection.request('GET', '/spin?labels=' + ','.join(labels) + '&size=100&rotation=42')
+    response = connection.getresponse()
+    body = response.read()
+    expected = spin_wheel(labels, size=100, start_rotation=42.0)
+    
+    assert response.status == 200
+    assert response.getheader('Transfer-Encoding') == 'chunked'
+    assert response.getheader('X-Wheelspin-Winner') == expected.winner
+    assert body == b''.join(expected.iter_gif())
+
+
+def test_server_rejects_bad_requests(server):
+    """Test that missing labels, bad sizes and unknown paths are client errors"""
+    connection = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=30)
+    for path, status in (('/spin', 400), ('/spin?labels=A,B&size=99999', 400), ('/spin?labels=A,B&size=30', 400),
+                         ('/other', 404)):
+        connection.request('GET', path)
+        response = connection.getresponse()
+        response.read()
+        
+        assert response.status == status
+
+
+def test_server_reports_render_failures(server, monkeypatch):
+    """Test that a failed first frame is a 500 and a later failure truncates the transfer"""
+    def fail_at_once(self):
+        raise RuntimeError("render failed")
+        yield
+    
+    def fail_later(self):
+        yield b'GIF89a'
+        raise RuntimeError("render failed")
+    
+    connection = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=30)
+    monkeypatch.setattr(SpinResult, 'iter_gif', fail_at_once)
+    connection.request('GET', '/spin?labels=A,B&size=100')
+    response = connection.getresponse()
+    response.read()
+    assert response.status == 500
+    
+    monkeypatch.setattr(SpinResult, 'iter_gif', fail_later)
+    connection = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=30)
+    connection.request('GET', '/spin?labels=A,B&size=100')
+    response = connection.getresponse()
+    assert response.status == 200
+    with pytest.raises(http.client.IncompleteRead):
+        response.read()
@@ -0,0 +1,52 @@
+"""Test SpinResult: immediate winner, lazily rendered animation"""
+
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wheelspin import spin_wheel, pick_winner, SpinResult
+
+
+def test_winner_available_before_render():
+    """Test that the winner is known without rendering the GIF"""
+    names = ["Alice", "Bob", "Charlie", "Diana"]
+    
+    result = spin_wheel(names, size=200, start_rotation=100.0)
+    
+    assert not result.ready, "Animation should not render until requested"
+    assert result.winner in names
+    assert result.info['winner_name'] == result.winner
+    assert result.info['frames_generated'] > 0
+    
+    expected_winner, _ = pick_winner(names, start_rotation=100.0)
+    assert result.winner == expected_winner
+
+
+def test_lazy_render_produces_gif():
+    """Test that accessing gif_bytes renders a GIF once"""
+    result = spin_wheel(["Yes", "No"], size=150, start_rotation=30.0, animation_speed=0.5)
+    
+    data = result.gif_bytes
+    
+    assert data[:6] in (b"GIF87a", b"GIF89a"), "Should produce GIF data"
+    assert result.ready
+    assert result.gif_bytes is data, "Animation should only be rendered once"
+
+
+def test_background_render(tmp_path):
+    """Test that a background render can be awaited and saved"""
+    result = spin_wheel(["Red", "Blue", "Green"], size=150, start_rotation=200.0,
+                        animation_speed=0.5, background=True)
+    output_file = tmp_path / "background.gif"
+    
+    assert result.wait(timeout=60), "Background render should finish"
+    result.save(str(output_file))
+    
+    assert output_file.read_bytes() == result.gif_bytes
+
+
+def test_empty_segments_raises_error():
+    """Test that an empty wheel is rejected"""
+    with pytest.raises(ValueError, match="cannot be empty"):
+        SpinResult([], 0.0)
@@ -0,0 +1,75 @@
+"""Test WheelSession elimination rounds and cache reuse"""
+
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wheelspin import WheelSession, calculate_winner
+
+
+@pytest.fixture
+def session():
+    """Small session so rounds render quickly"""
+    return WheelSession(["Alice", "Bob", "Charlie", "Diana"], size=150, animation_speed=0.5)
+
+
+def test_eliminate_removes_winner(session):
+    """Test that eliminate() spins and removes the winner"""
+    result = session.eliminate(start_rotation=100.0)
+    
+    assert result.winner == calculate_winner(100.0, ["Alice", "Bob", "Charlie", "Diana"])[1]
+    assert result.winner not in session.segments
+    assert len(session.segments) == 3
+    assert session.rounds == [result]
+
+
+def test_tournament_until_one_remains(session):
+    """Test that a tournament runs one round per eliminated segment"""
+    rounds = session.tournament()
+    
+    assert len(rounds) == 3
+    assert len(session.segments) == 1
+    eliminated = {result.winner for result in rounds}
+    assert eliminated | set(session.segments) == {"Alice", "Bob", "Charlie", "Diana"}
+    assert [result.info['total_segments'] for result in rounds] == [4, 3, 2]
+
+
+def test_rounds_share_generator_caches(session):
+    """Test that later rounds reuse label sprites and metrics"""
+    first = session.eliminate(start_rotation=10.0)
+    first.animation[0]
+    generator = session.generator
+    sprites_after_first = dict(generator._sprite_cache)
+    
+    second = session.spin(start_rotation=20.0)
+    second.animation[0]
+    
+    assert session.generator is generator
+    for key, sprite in sprites_after_first.items():
+        assert generator._sprite_cache[key] is sprite, "Existing sprites should be reused"
+
+
+def test_add_and_remove_segments(session):
+    """Test editing the wheel between rounds"""
+    session.add("Eve")
+    session.remove("Alice")
+    
+    assert session.segments == ["Bob", "Charlie", "Diana", "Eve"]
+    
+    with pytest.raises(ValueError):
+        session.remove("Nobody")
+
+
+def test_weighted_session():
+    """Test that weights follow their segments through eliminations"""
+    session = WheelSession(["A", "B", "C"], size=150, weights=[1, 2, 3])
+    session.add("D", weight=4)
+    session.remove("B")
+    
+    assert session.weights == [1, 3, 4]
+    
+    result = session.eliminate(start_rotation=0.5)
+    
+    assert len(session.weights) == len(session.segments) == 2
+    assert result.info['weighted']
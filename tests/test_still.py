@@ -0,0 +1,70 @@
+"""Test single-frame still export"""
+
+import io
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image, ImageChops
+
+from wheelspin import SpinResult, render_still
+
+
+@pytest.fixture
+def segments():
+    """Sample segments"""
+    return ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve']
+
+
+def test_final_still_matches_last_gif_frame(segments):
+    """Test that the default still is the frame the animation ends on"""
+    result = SpinResult(segments, 123.0, size=160)
+    still = Image.open(io.BytesIO(result.still())).convert('RGB')
+    
+    with Image.open(io.BytesIO(result.gif_bytes)) as gif:
+        gif.seek(gif.n_frames - 1)
+        last = gif.convert('RGB')
+    
+    # The GIF is paletted, so compare after the same quantization
+    difference = ImageChops.difference(still.quantize(256).convert('RGB'), last)
+    assert sum(difference.convert('L').histogram()[32:]) < 0.01 * 160 * 160
+
+
+def test_still_does_not_render_animation(segments):
+    """Test that a still leaves the animation unrendered"""
+    result = SpinResult(segments, 10.0, size=120)
+    data = result.still(0)
+    
+    assert not result.ready
+    assert data.startswith(b'\x89PNG')
+
+
+def test_still_index_out_of_range(segments):
+    """Test that frame indices are checked like a sequence"""
+    result = SpinResult(segments, 10.0, size=120)
+    with pytest.raises(IndexError):
+        result.still(result.info['frames_generated'])
+
+
+@pytest.mark.parametrize("format,magic", [('PNG', b'\x89PNG'), ('webp', b'RIFF')])
+def test_render_still_formats(segments, tmp_path, format, magic):
+    """Test that render_still writes PNG and WebP images of the requested size"""
+    path = tmp_path / f'still.{format.lower()}'
+    data = render_still(segments, 45.0, str(path), size=140, format=format)
+    
+    assert data.startswith(magic)
+    assert path.read_bytes() == data
+    with Image.open(path) as image:
+        assert image.size == (140, 140)
+
+
+def test_render_still_is_deterministic(segments):
+    """Test that repeat calls with cached layout give the same image"""
+    assert render_still(segments, 45.0, size=140) == render_still(segments, 45.0, size=140)
+
+
+def test_render_still_rejects_unknown_format(segments):
+    """Test that only still image formats are accepted"""
+    with pytest.raises(ValueError):
+        render_still(segments, 0.0, size=100, format='GIF')
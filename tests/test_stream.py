@@ -0,0 +1,122 @@
+"""Test raw frame streaming and the command line interface"""
+
+import io
+import json
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wheelspin import SpinResult, cli, server
+from wheelspin.stream import iter_stream, y4m_header
+from wheelspin.wheel_generator import WheelGenerator
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def labels():
+    """Sample labels"""
+    return ['Alice', 'Bob', 'Charlie', 'Diana']
+
+
+def run_cli(*args):
+    """Run the CLI in a fresh interpreter and return its completed process"""
+    return subprocess.run([sys.executable, "-m", "wheelspin", *args], capture_output=True,
+                          cwd=str(REPO_ROOT))
+
+
+def test_rgba_stream_layout(labels):
+    """Test that an rgba stream is a JSON header line followed by every frame"""
+    result = SpinResult(labels, 30.0, size=80)
+    output = io.BytesIO()
+    written = result.stream(output)
+    
+    data = output.getvalue()
+    header_line, frames = data.split(b'\n', 1)
+    header = json.loads(header_line)
+    
+    assert written == len(data)
+    assert header['frames'] == result.info['frames_generated']
+    assert len(header['durations_ms']) == header['frames']
+    assert header['winner'] == {'index': result.winner_index, 'name': result.winner}
+    assert len(frames) == header['frames'] * header['frame_bytes']
+    last = result._create_generator().create_animation_frame(labels, 30.0, header['frames'] - 1, header['frames'])
+    assert frames[-header['frame_bytes']:] == last.tobytes()
+
+
+def test_y4m_stream_layout(labels):
+    """Test that a y4m stream has the stream header and one 4:4:4 frame per frame"""
+    output = io.BytesIO()
+    SpinResult(labels, 30.0, size=80, max_frames=12).stream(output, format='y4m')
+    
+    data = output.getvalue()
+    header, _ = data.split(b'\n', 1)
+    
+    assert header.startswith(b'YUV4MPEG2 W80 H80 F')
+    assert b' C444 ' in header
+    assert data.count(b'FRAME\n') >= 12
+    assert len(data) == len(header) + 1 + 12 * (6 + 80 * 80 * 3)
+
+
+def test_y4m_frame_rate():
+    """Test that the frame rate is reduced from the frame duration"""
+    assert y4m_header(10, 5, 50).startswith(b'YUV4MPEG2 W10 H10 F20:1 ')
+    assert y4m_header(10, 5, 30).startswith(b'YUV4MPEG2 W10 H10 F100:3 ')
+
+
+def test_stream_is_lazy(labels):
+    """Test that the header is available before any frame is rendered"""
+    generator = WheelGenerator(size=80)
+    chunks = iter_stream(generator, labels, 0.0, 10)
+    
+    assert next(chunks).startswith(b'{')
+    assert generator._layout_cache == {}
+
+
+def test_unknown_stream_format(labels):
+    """Test that unknown stream formats are rejected"""
+    with pytest.raises(ValueError):
+        list(iter_stream(WheelGenerator(size=80), labels, 0.0, 2, format='mp4'))
+
+
+def test_cli_streams_rgba(labels):
+    """Test that the CLI writes only the stream to stdout"""
+    completed = run_cli(*labels, '--format', 'rgba', '--size', '60', '--rotation', '10', '--max-frames', '10')
+    header_line, frames = completed.stdout.split(b'\n', 1)
+    header = json.loads(header_line)
+    
+    assert completed.returncode == 0
+    assert len(frames) == header['frames'] * 60 * 60 * 4
+    assert b'Winner: Diana' in completed.stderr
+
+
+def test_cli_batch(tmp_path):
+    """Test that batch mode writes one GIF and one JSON line per wheel"""
+    batch = tmp_path / 'spins.txt'
+    batch.write_text("A, B, C\n\nYes,No\n", encoding='utf-8')
+    completed = run_cli('--batch', str(batch), '--output-dir', str(tmp_path), '--size', '60')
+    lines = [json.loads(line) for line in completed.stdout.decode('utf-8').splitlines()]
+    
+    assert completed.returncode == 0
+    assert len(lines) == 2
+    assert all(Path(line['file']).exists() for line in lines)
+
+
+def test_cli_without_labels():
+    """Test that the CLI reports a missing label list as an error"""
+    completed = run_cli('--no-warmup')
+    
+    assert completed.returncode == 2
+    assert b'No labels given' in completed.stderr
+
+
+@pytest.mark.parametrize("flags, warm", [((), True), (('--no-warmup',), False)])
+def test_cli_serve_honors_no_warmup(monkeypatch, flags, warm):
+    """Test that --serve warms up unless --no-warmup is given"""
+    calls = []
+    monkeypatch.setattr(server, 'serve', lambda *args, **kwargs: calls.append(kwargs))
+    
+    assert cli.main(['--serve', '8123', '--size', '200', *flags]) == 0
+    assert calls == [{'sizes': (200,), 'warm': warm}]
@@ -0,0 +1,113 @@
+"""Test the SVG backend"""
+
+import pytest
+import sys
+from pathlib import Path
+from xml.etree import ElementTree
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wheelspin import SpinResult
+from wheelspin.geometry import spin_rotation
+from wheelspin.svg import CUBIC_EASE_OUT
+
+SVG = '{http://www.w3.org/2000/svg}'
+
+
+@pytest.fixture
+def segments():
+    """Sample segments, including markup characters and a long label"""
+    return ['Alice', 'Bob & <Co>', 'Charlie', 'A very long segment label', 'Eve']
+
+
+def _parse(document):
+    return ElementTree.fromstring(document)
+
+
+def test_svg_has_slices_labels_and_overlay(segments):
+    """Test that every slice and label is drawn with the raster colors and truncation"""
+    result = SpinResult(segments, 33.0, size=300)
+    root = _parse(result.svg())
+    generator = result._create_generator()
+    
+    paths = root.findall(f'.//{SVG}path')
+    assert [path.get('fill') for path in paths] == generator.distribute_colors(len(segments))
+    texts = [text.text for text in root.iter(f'{SVG}text')]
+    layout = generator.calculate_consistent_text_position(130, 360 / len(segments), segments)
+    assert texts == [generator.fit_label(label, layout['font_size'], 130) for label in segments]
+    assert 'Bob & <Co>' in texts
+    assert root.find(f'{SVG}polygon') is not None
+    assert root.get('width') == '300'
+
+
+def test_colors_cannot_break_attributes():
+    """Test that quotes and markup in colors stay inside their attribute"""
+    colors = ['red" onload="alert(1)', "blue'><script>x</script>", '#00ff00']
+    result = SpinResult(['Say "hi"', 'B', 'C'], 10.0, size=200, colors=colors)
+    root = _parse(result.svg())
+    
+    assert [path.get('fill') for path in root.iter(f'{SVG}path')] == colors
+    assert all(element.get('onload') is None for element in root.iter())
+    assert root.find(f'.//{SVG}script') is None
+    assert [text.text for text in root.iter(f'{SVG}text')][0] == 'Say "hi"'
+
+
+def test_font_size_matches_layout(segments):
+    """Test that labels use the font size chosen by the raster layout"""
+    result = SpinResult(segments, 0.0, size=300)
+    generator = result._create_generator()
+    layout = generator.calculate_consistent_text_position(130, 72.0, segments)
+    
+    group = _parse(result.svg()).find(f'.//{SVG}g/{SVG}g')
+    assert group.get('font-size') == str(layout['font_size'])
+
+
+def test_animation_matches_gif_easing():
+    """Test that the CSS curve is the cubic ease-out and stops two turns on"""
+    t = 0.3
+    # x(t) = t for these control points, so the curve is y(t) directly
+    bezier_y = 3 * (1 - t) ** 2 * t + 3 * (1 - t) * t ** 2 + t ** 3
+    assert spin_rotation(30, 100, 0.0) == pytest.approx(bezier_y * 720)
+    
+    result = SpinResult(['A', 'B', 'C'], 50.0, size=200)
+    document = result.svg()
+    assert CUBIC_EASE_OUT in document
+    assert 'rotate(50deg)' in document and 'rotate(770deg)' in document
+    assert f"{50 * result.info['frames_generated']}ms" in document
+
+
+def test_retimed_spin_samples_easing():
+    """Test that a spin with a steeper ease-out is animated with a sampled linear() curve"""
+    result = SpinResult([f"E{i}" for i in range(600)], 0.0, size=200, frame_cap=100)
+    document = result.svg()
+    
+    assert CUBIC_EASE_OUT not in document
+    assert 'linear(0.0000, ' in document and ', 1.0000)' in document
+
+
+def test_static_svg_rests_on_winner(tmp_path):
+    """Test that a static SVG is rotated to the final pose and written to disk"""
+    path = tmp_path / 'wheel.svg'
+    result = SpinResult(['A', 'B', 'C'], 50.0, size=200)
+    document = result.svg(str(path), animate=False)
+    
+    assert path.read_text(encoding='utf-8') == document
+    assert '@keyframes' not in document
+    assert _parse(document).find(f'{SVG}g').get('transform') == 'rotate(50 100 100)'
+
+
+def test_weighted_svg_slices():
+    """Test that weighted slices follow the angle table"""
+    result = SpinResult(['A', 'B'], 0.0, size=200, weights=[3, 1])
+    paths = _parse(result.svg()).findall(f'.//{SVG}path')
+    
+    # The first slice spans 270 degrees, so it takes the large arc
+    assert ' 0 1 1 ' in paths[0].get('d')
+    assert ' 0 0 1 ' in paths[1].get('d')
+
+
+def test_single_segment_is_a_circle():
+    """Test that a one-segment wheel is drawn as a full circle"""
+    root = _parse(SpinResult(['Only'], 0.0, size=100).svg())
+    
+    assert root.find(f'.//{SVG}path') is None
+    assert len(root.findall(f'.//{SVG}circle')) == 2  # disk and hub
@@ -0,0 +1,89 @@
+"""Test sharing one WheelGenerator between many threads"""
+
+import io
+import pytest
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wheelspin.wheel_generator import WheelGenerator
+
+THREADS = 32
+
+
+@pytest.fixture(autouse=True)
+def frequent_thread_switches():
+    """Switch threads far more often than usual so races actually happen"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _jobs():
+    """Frames that exercise every cache: labels, weights, layouts and large wheels"""
+    small = [f"Player {i}" for i in range(12)]
+    other = ['Ärger', 'Ünïcödé', 'Zoë', 'Łukasz', 'Søren', 'Ñandú']
+    large = [f"Entrant {i}" for i in range(700)]
+    weights = [i % 5 + 1 for i in range(len(other))]
+    jobs = []
+    for i in range(THREADS * 3):
+        if i % 4 == 0:
+            jobs.append((large, None, i * 11.0, i % 3 == 0))
+        elif i % 4 == 1:
+            jobs.append((other, weights, i * 7.0, False))
+        else:
+            jobs.append((small[:4 + i % 8], None, i * 5.0, False))
+    return jobs
+
+
+def _render(generator, job):
+    labels, weights, rotation, highlight = job
+    angle_table = generator.build_angle_table(labels, weights)
+    frame = generator.create_wheel_frame(len(labels), rotation, labels, highlight=highlight,
+                                         angle_table=angle_table)
+    return frame.tobytes()
+
+
+def test_parallel_renders_match_serial():
+    """Test that 32 threads sharing one generator render byte-identical frames"""
+    jobs = _jobs()
+    serial = WheelGenerator(size=160)
+    expected = [_render(serial, job) for job in jobs]
+    
+    shared = WheelGenerator(size=160)
+    shared.cache_limit = 16  # force evictions while other threads read the caches
+    barrier = threading.Barrier(THREADS)
+    
+    def worker(offset):
+        barrier.wait()
+        results = {}
+        for index in range(offset, len(jobs), THREADS):
+            results[index] = _render(shared, jobs[index])
+        return results
+    
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        outputs = {}
+        for results in pool.map(worker, range(THREADS)):
+            outputs.update(results)
+    
+    assert len(outputs) == len(jobs)
+    for index, data in outputs.items():
+        assert data == expected[index], f"frame {index} differs from the serial render"
+
+
+def test_parallel_gifs_report_their_own_stats():
+    """Test that concurrent create_gif calls keep separate pipeline statistics"""
+    generator = WheelGenerator(size=100)
+    labels = ['A', 'B', 'C', 'D']
+    
+    def worker(frames):
+        generator.create_gif(labels, 0.0, io.BytesIO(), num_frames=frames)
+        return generator.last_pipeline_stats['frames']
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        counts = list(pool.map(worker, [5 + i for i in range(16)]))
+    
+    assert counts == [5 + i for i in range(16)]
@@ -0,0 +1,105 @@
+"""Test client-side playback export: layers, timeline and sprite sheet"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image, ImageChops
+
+from wheelspin import SpinResult, pick_winner
+from wheelspin.geometry import spin_rotation
+from wheelspin.timeline import build_timeline
+
+
+@pytest.fixture
+def segments():
+    """Sample segments"""
+    return ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve']
+
+
+def _on_white(image):
+    background = Image.new('RGBA', image.size, 'white')
+    return Image.alpha_composite(background, image).convert('RGB')
+
+
+def test_timeline_uses_gif_easing(segments):
+    """Test that rotations follow the same easing as the animation"""
+    timeline = build_timeline(segments, 40.0, 60, 300)
+    
+    assert timeline['frames'] == len(timeline['rotations']) == 60
+    assert timeline['rotations'][0] == 40.0
+    assert timeline['rotations'][30] == pytest.approx(spin_rotation(30, 60, 40.0), abs=1e-4)
+    assert timeline['final_rotation'] % 360 == pytest.approx(40.0)
+    assert timeline['winner']['name'] == pick_winner(segments, start_rotation=40.0)[0]
+    
+    retimed = build_timeline(segments, 40.0, 60, 300, easing_power=4.5)
+    assert retimed['easing'] == 'power-out' and retimed['easing_power'] == 4.5
+    assert retimed['rotations'][30] == pytest.approx(spin_rotation(30, 60, 40.0, easing_power=4.5), abs=1e-4)
+
+
+def test_timeline_weighted_slices(segments):
+    """Test that weighted slices and the winner come from the angle table"""
+    result = SpinResult(segments, 200.0, size=120, weights=[5, 1, 1, 1, 1])
+    timeline = build_timeline(segments, 200.0, 20, 120, angle_table=result.angle_table,
+                              colors=['#000000'] * len(segments))
+    
+    assert timeline['winner']['index'] == result.winner_index
+    assert timeline['slices'][0]['end_angle'] == pytest.approx(200.0)
+    assert timeline['slices'][-1]['end_angle'] == 360
+
+
+def test_export_writes_layers_and_json(segments, tmp_path):
+    """Test that the export writes disk, overlay and a readable timeline"""
+    result = SpinResult(segments, 75.0, size=160)
+    timeline = result.export_timeline(str(tmp_path))
+    
+    saved = json.loads((tmp_path / 'timeline.json').read_text(encoding='utf-8'))
+    assert saved == json.loads(json.dumps(timeline))
+    assert saved['winner'] == {'index': result.winner_index, 'name': result.winner}
+    assert len(saved['slices']) == len(segments)
+    assert not (tmp_path / 'sprites.png').exists()
+    assert not result.ready  # no GIF was rendered
+
+
+def test_layers_compose_into_frame(segments, tmp_path):
+    """Test that rotating the disk and adding the overlay reproduces a frame"""
+    result = SpinResult(segments, 75.0, size=160)
+    timeline = result.export_timeline(str(tmp_path))
+    
+    disk = Image.open(tmp_path / 'disk.png')
+    overlay = Image.open(tmp_path / 'overlay.png')
+    index = 45
+    rotated = disk.rotate(-timeline['rotations'][index], resample=Image.BICUBIC, center=tuple(timeline['center']))
+    composed = _on_white(Image.alpha_composite(rotated, overlay))
+    expected = _on_white(result.animation[index])
+    
+    # Rotating a raster differs from drawing at an angle only along edges
+    difference = ImageChops.difference(composed, expected).convert('L')
+    assert sum(difference.histogram()[96:]) < 0.05 * 160 * 160
+
+
+def test_sprite_sheet_holds_every_frame(segments, tmp_path):
+    """Test that the sprite sheet grid matches the timeline metadata"""
+    result = SpinResult(segments, 10.0, size=120, max_frames=10)
+    timeline = result.export_timeline(str(tmp_path), sprite_sheet=True, sprite_size=60)
+    sheet_info = timeline['sprite_sheet']
+    
+    assert sheet_info == {'frame_size': 60, 'columns': 4, 'rows': 3}
+    with Image.open(tmp_path / 'sprites.png') as sheet:
+        assert sheet.size == (4 * 60, 3 * 60)
+        last = sheet.crop((1 * 60, 2 * 60, 2 * 60, 3 * 60)).convert('RGB')
+    expected = result.animation[9].resize((60, 60), Image.Resampling.BOX).convert('RGB')
+    assert ImageChops.difference(last, expected).getbbox() is None
+
+
+def test_large_wheel_timeline_skips_slices(tmp_path):
+    """Test that large wheels export without a per-entrant slice list"""
+    entrants = [f"Entrant {i}" for i in range(800)]
+    result = SpinResult(entrants, 3.0, size=200)
+    timeline = result.export_timeline(str(tmp_path))
+    
+    assert 'slices' not in timeline
+    assert timeline['segments'] == 800
+    assert timeline['highlight_from_frame'] == timeline['frames'] - 15
@@ -0,0 +1,56 @@
+"""Test pixel-width label truncation"""
+
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wheelspin.wheel_generator import WheelGenerator
+
+
+@pytest.fixture
+def generator():
+    """Generator at the default size"""
+    return WheelGenerator(size=500)
+
+
+def test_short_label_unchanged(generator):
+    """Test that a label that fits is returned as is"""
+    assert generator.truncate_to_width("Alice", 200, 14) == "Alice"
+
+
+def test_long_label_fits_width(generator):
+    """Test that a cut label ends in an ellipsis and measures within the width"""
+    label = "A very long segment label that cannot fit"
+    fitted = generator.truncate_to_width(label, 120, 14)
+    
+    assert fitted.endswith("...")
+    assert label.startswith(fitted[:-3])
+    assert generator.get_text_dimensions(fitted, 14)['width'] <= 120
+
+
+def test_wide_characters_cut_earlier(generator):
+    """Test that wide characters are cut by pixels, not by character count"""
+    narrow = generator.truncate_to_width("i" * 40, 100, 14)
+    wide = generator.truncate_to_width("W" * 40, 100, 14)
+    
+    assert len(wide) < len(narrow)
+    assert generator.get_text_dimensions(wide, 14)['width'] <= 100
+
+
+def test_fit_label_uses_radial_space(generator):
+    """Test that fit_label cuts to the label length between hub and rim"""
+    label = "Supercalifragilisticexpialidocious and more"
+    space = generator.calculate_segment_space(200, 30)['label_length']
+    fitted = generator.fit_label(label, 14, 200)
+    
+    assert generator.get_text_dimensions(fitted, 14)['width'] <= space
+    assert generator.fit_label(label, 14, 400) == label or len(generator.fit_label(label, 14, 400)) > len(fitted)
+
+
+def test_advances_and_results_cached(generator):
+    """Test that glyph advances and fitted labels are cached"""
+    generator.truncate_to_width("Cached label text", 50, 14)
+    
+    assert ('C', 14) in generator._advance_cache
+    assert ("Cached label text", 14, 50) in generator._fit_cache
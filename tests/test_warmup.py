@@ -0,0 +1,119 @@
+"""Test warm-up and the process-wide font and generator caches"""
+
+import gc
+import os
+import pytest
+import sys
+import threading
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wheelspin import budget, fonts, render_still, spin_wheel, warmup
+from wheelspin.wheel_generator import WheelGenerator, shared_generator
+
+
+@pytest.fixture
+def labels():
+    return ['Alice', 'Bob', 'Charlie', 'Diana']
+
+
+def test_warmup_reports_what_it_loaded():
+    """Test that warmup() opens every label font size and reports timings"""
+    summary = warmup(sizes=(120,), calibrate=False)
+    generator = shared_generator(120, ('#eeb312', '#d61126', '#346ae9', '#019b26', '#9b59b6', '#e67e22'), 11)
+    
+    assert summary['sizes'] == [120]
+    assert summary['font_sizes'] == list(range(generator.min_font_px, generator.max_font_px + 1))
+    assert summary['seconds'] >= 0
+    for font_px in summary['font_sizes']:
+        assert font_px in generator._font_cache
+
+
+def test_fonts_are_shared_between_generators():
+    """Test that a font opened by one generator is reused by another"""
+    first = WheelGenerator(size=100)
+    second = WheelGenerator(size=200)
+    
+    assert first._load_font(13) is second._load_font(13)
+
+
+def test_shared_generator_is_reused():
+    """Test that the same configuration returns the same generator"""
+    colors = ('#ff0000', '#00ff00')
+    
+    assert shared_generator(150, colors, 11) is shared_generator(150, colors, 11)
+    assert shared_generator(150, colors, 11) is not shared_generator(160, colors, 11)
+    assert shared_generator(150, list(colors), 11) is shared_generator(size=150, colors=colors, font_size=11,
+                                                                      large_mode=None)
+
+
+def test_warmed_generator_is_used_by_spins(labels):
+    """Test that spin_wheel() and render_still() use the generator warmup() prepared"""
+    warmup(sizes=(140,), sample_labels=labels, calibrate=False)
+    warmed = shared_generator(140, ('#eeb312', '#d61126', '#346ae9', '#019b26', '#9b59b6', '#e67e22'), 11)
+    misses = shared_generator.cache_info().misses
+    
+    assert spin_wheel(labels, size=140, start_rotation=10.0)._create_generator() is warmed
+    render_still(labels, rotation=10.0, size=140)
+    assert shared_generator.cache_info().misses == misses
+    assert warmed._sprite_cache  # filled by warmup(), reused by the spin
+
+
+def test_warmup_accepts_font_size_iterator():
+    """Test that a generator of font sizes is used for every image size"""
+    summary = warmup(sizes=(100, 110), fonts=(px for px in (12, 14)), calibrate=False)
+    
+    assert summary['font_sizes'] == [12, 14]
+
+
+def test_warm_output_matches_cold_output(labels):
+    """Test that warming up does not change what is rendered"""
+    cold = WheelGenerator(size=150).create_animation_frame(labels, 30.0, 5, 10)
+    warmup(sizes=(150,), sample_labels=labels, calibrate=False)
+    result = spin_wheel(labels, size=150, start_rotation=30.0)
+    
+    assert result._create_generator().create_animation_frame(labels, 30.0, 5, 10).tobytes() == cold.tobytes()
+    assert render_still(labels, rotation=30.0, size=150) == render_still(labels, rotation=30.0, size=150)
+
+
+def test_freeze_moves_objects_out_of_the_collector():
+    """Test that freeze=True leaves the loaded state in the permanent generation"""
+    try:
+        warmup(sizes=(100,), calibrate=False, freeze=True)
+        
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="needs os.fork")
+@pytest.mark.filterwarnings("ignore:.*use of fork\\(\\) may lead to deadlocks:DeprecationWarning")
+def test_forked_child_can_take_shared_locks():
+    """Test that locks held by another thread at fork time are usable in the child"""
+    generator = shared_generator(130, ('#ff0000', '#00ff00'), 11)
+    locks = [lambda: generator._lock, lambda: fonts._index_lock, lambda: budget._cost_model_lock]
+    holding = threading.Event()
+    release = threading.Event()
+    
+    def hold():
+        held = [lock() for lock in locks]
+        for lock in held:
+            lock.acquire()
+        holding.set()
+        release.wait()
+        for lock in held:
+            lock.release()
+    
+    thread = threading.Thread(target=hold)
+    thread.start()
+    holding.wait()
+    try:
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if all(lock().acquire(timeout=5) for lock in locks) else 1)
+        _, status = os.waitpid(pid, 0)
+    finally:
+        release.set()
+        thread.join()
+    
+    assert os.waitstatus_to_exitcode(status) == 0
@@ -0,0 +1,81 @@
+"""Test weighted segments: proportional slices and bisect winner lookup"""
+
+import pytest
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wheelspin import EntrantIndex, calculate_winner, pick_winner, spin_wheel
+from wheelspin.geometry import build_angle_table
+from wheelspin.wheel_generator import WheelGenerator
+
+
+def test_angle_table_is_proportional():
+    """Test that slice angles are proportional to weights"""
+    table = build_angle_table([1, 2, 1])
+    
+    assert table == [0.0, 90.0, 270.0, 360.0]
+
+
+@pytest.mark.parametrize("weights", [[], [1, 0, 2], [1, -1]])
+def test_invalid_weights(weights):
+    """Test that empty or non-positive weights are rejected"""
+    with pytest.raises(ValueError):
+        build_angle_table(weights)
+
+
+def test_weights_must_match_segments():
+    """Test that a weight is required for every segment"""
+    with pytest.raises(ValueError, match="one entry per segment"):
+        pick_winner(["A", "B", "C"], start_rotation=0.0, weights=[1, 2])
+
+
+def test_weighted_winner_matches_duplicated_entries():
+    """Test that weights pick the same winner as duplicating entries"""
+    labels = ["A", "B", "C"]
+    weights = [1, 3, 2]
+    duplicated = [label for label, weight in zip(labels, weights) for _ in range(weight)]
+    table = build_angle_table(weights)
+    
+    for step in range(720):
+        rotation = step * 0.5 + 0.25  # stay clear of exact slice boundaries
+        _, expected = calculate_winner(rotation, duplicated)
+        _, winner = calculate_winner(rotation, labels, angle_table=table)
+        
+        assert winner == expected, f"Mismatch at rotation {rotation}"
+
+
+def test_weighted_frame_renders_proportional_slices():
+    """Test that a weighted frame is drawn from the angle table"""
+    generator = WheelGenerator(size=200, colors=['#ff0000', '#0000ff'])
+    labels = ["", ""]
+    table = build_angle_table([3, 1])
+    
+    frame = generator.create_wheel_frame(2, 0, labels, angle_table=table)
+    
+    # Red slice covers 0-270 degrees, blue 270-360 (angles run clockwise from 3 o'clock)
+    assert frame.getpixel((100, 160))[:3] == (255, 0, 0), "Bottom should be in the heavy slice"
+    assert frame.getpixel((130, 60))[:3] == (0, 0, 255), "Upper right should be in the light slice"
+
+
+def test_weighted_spin_result():
+    """Test weighted spins end to end"""
+    result = spin_wheel(["Rare", "Common"], size=150, start_rotation=10.0,
+                        animation_speed=0.5, weights=[1, 9])
+    
+    assert result.info['weighted']
+    assert result.winner == "Common"
+    assert result.gif_bytes[:6] == b"GIF89a"
+
+
+def test_weighted_large_wheel():
+    """Test weighted slices in large-wheel mode"""
+    entrants = EntrantIndex(f"E{i}" for i in range(2000))
+    weights = [100] + [1] * 1999
+    generator = WheelGenerator(size=150)
+    table = build_angle_table(weights)
+    
+    frame = generator.create_wheel_frame(2000, 0.0, entrants, highlight=True, angle_table=table)
+    
+    assert frame.size == (150, 150)
+    assert calculate_winner(-1.0, entrants, angle_table=table)[1] == "E0"
@@ -4,6 +4,11 @@ WheelSpin - A library for creating animated spinning wheel GIFs
 Main functions:
 - create_spinning_wheel(): Simple wheel creation
 - create_spinning_wheel_advanced(): Advanced options
+- create_spinning_wheel_sizes(): One render, several output sizes
+- spin_wheel(): Winner immediately, animation rendered on demand
+- render_still(): A single frame as PNG/WebP, no animation
+- pick_winner(): Decide a winner without rendering
+- warmup(): Preload fonts and caches before serving (or forking)
 - quick_spin(): Quick spin with defaults
 - decision_wheel(): Decision-making wheel
 """
@@ -11,17 +16,37 @@ Main functions:
 from .wheelspin_lib import (
     create_spinning_wheel,
     create_spinning_wheel_advanced,
+    create_spinning_wheel_sizes,
+    spin_wheel,
+    render_still,
+    pick_winner,
     quick_spin,
     decision_wheel,
     __version__,
     __author__
 )
+from .geometry import calculate_winner
+from .result import SpinResult
+from .animation import WheelAnimation
+from .entrants import EntrantIndex
+from .session import WheelSession
+from .warmup import warmup
 
 __all__ = [
     'create_spinning_wheel',
     'create_spinning_wheel_advanced', 
+    'create_spinning_wheel_sizes',
+    'spin_wheel',
+    'SpinResult',
+    'WheelAnimation',
+    'EntrantIndex',
+    'WheelSession',
+    'render_still',
+    'pick_winner',
+    'calculate_winner',
     'quick_spin',
     'decision_wheel',
+    'warmup',
     '__version__',
     '__author__'
 ]
\ No newline at end of file
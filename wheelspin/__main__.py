@@ -0,0 +1,7 @@
+"""Run the command line interface: python -m wheelspin"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+WheelAnimation - Random-access, lazily rendered animation frames
+"""
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import List, Optional
+
+from .entrants import as_segments
+from .geometry import spin_rotation
+
+
+class WheelAnimation(Sequence):
+    """
+    The frames of a spin as a lazy sequence.
+
+    Supports len(), indexing (including negative indices), slicing and
+    iteration. Each frame is rendered on first access from the same easing
+    curve create_gif() uses, and the most recently used frames are kept in a
+    small LRU cache. Weighted wheels pass the same weights as create_gif(),
+    and num_frames overrides the generator's frame count the same way.
+
+    Example:
+        >>> animation = WheelAnimation(['Alice', 'Bob', 'Charlie'], start_rotation=42.0)
+        >>> len(animation)
+        60
+        >>> animation[-1].save('final.png')
+        >>> thumbnails = animation[::15]
+    """
+
+    def __init__(self, labels: List[str], start_rotation: float, generator=None, cache_size: int = 8,
+                 weights: Optional[List[float]] = None, num_frames: Optional[int] = None):
+        if not labels:
+            raise ValueError("Segments list cannot be empty")
+
+        if generator is None:
+            from .wheel_generator import WheelGenerator
+            generator = WheelGenerator()
+
+        self.labels = as_segments(labels)
+        self.start_rotation = start_rotation
+        self.generator = generator
+        self.cache_size = cache_size
+        self.angle_table = generator.build_angle_table(self.labels, weights)
+        self._num_frames = num_frames or generator.calculate_frames(len(self.labels))
+        self._cache = OrderedDict()  # frame index -> rendered frame, least recently used first
+
+    def __len__(self) -> int:
+        return self._num_frames
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._render(i) for i in range(*index.indices(self._num_frames))]
+
+        if index < 0:
+            index += self._num_frames
+        if not 0 <= index < self._num_frames:
+            raise IndexError("animation frame index out of range")
+        return self._render(index)
+
+    def __iter__(self):
+        for i in range(self._num_frames):
+            yield self._render(i)
+
+    def rotation(self, index: int) -> float:
+        """Rotation angle of the wheel in the given frame"""
+        return spin_rotation(index, self._num_frames, self.start_rotation, self.generator.circle_degrees,
+                             self.generator.easing_power)
+
+    def _render(self, index: int):
+        frame = self._cache.get(index)
+        if frame is not None:
+            self._cache.move_to_end(index)
+            return frame
+
+        frame = self.generator.create_animation_frame(self.labels, self.start_rotation, index, self._num_frames,
+                                                      self.angle_table)
+        if self.cache_size > 0:
+            self._cache[index] = frame
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return frame
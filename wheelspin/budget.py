@@ -0,0 +1,167 @@
+"""
+Render budgets - choose frame count and quality tier to fit a time budget
+
+The cost model is calibrated once per process by timing a few small renders
+on the host, then scaled by image area and label count.
+"""
+
+import io
+import os
+import threading
+import time
+from typing import Optional
+
+from .geometry import is_large_wheel, plan_frames
+
+# 'full' draws every slice and label per frame; 'fast' renders the disk once
+# and rotates it per frame, so frame cost no longer depends on labels
+QUALITY_TIERS = ('full', 'fast')
+
+# Never sample a spin with fewer frames than this to meet a time budget
+MIN_BUDGET_FRAMES = 20
+
+# Frame duration (ms) of an unsampled animation
+BASE_FRAME_DURATION = 50
+
+_cost_model = None
+_cost_model_lock = threading.Lock()
+
+
+def _reset_cost_model_lock():
+    """Unlock calibration in a forked child, whose copy of the lock may have been held by another thread"""
+    global _cost_model_lock
+    _cost_model_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_cost_model_lock)
+
+
+class CostModel:
+    """Per-frame render and encode costs measured on this host"""
+
+    def __init__(self, reference_size: int, full_frame: float, per_label: float,
+                 fast_frame: float, encode_frame: float):
+        self.reference_size = reference_size
+        self.full_frame = full_frame  # seconds per 'full' frame without labels
+        self.per_label = per_label  # seconds per label per 'full' frame
+        self.fast_frame = fast_frame  # seconds per 'fast' (rotated disk) frame
+        self.encode_frame = encode_frame  # seconds to encode one frame
+
+    def __repr__(self) -> str:
+        return (f"CostModel(full={self.full_frame * 1000:.2f}ms + {self.per_label * 1000:.3f}ms/label, "
+                f"fast={self.fast_frame * 1000:.2f}ms, encode={self.encode_frame * 1000:.2f}ms "
+                f"at {self.reference_size}px)")
+
+    def frame_seconds(self, size: int, labels: int, tier: str) -> float:
+        """Predicted render plus encode time of one frame"""
+        scale = (size / self.reference_size) ** 2
+        if tier == 'fast':
+            render = self.fast_frame
+        else:
+            render = self.full_frame + labels * self.per_label
+        return (render + self.encode_frame) * scale
+
+    def predict(self, size: int, labels: int, tier: str, frames: int) -> float:
+        """Predicted total time to render and encode an animation"""
+        total = frames * self.frame_seconds(size, labels, tier)
+        if tier == 'fast':
+            # The disk itself is drawn once, like a single full frame
+            total += (self.full_frame + labels * self.per_label) * (size / self.reference_size) ** 2
+        return total
+
+
+def _time_frames(generator, labels, repeats: int) -> float:
+    start = time.perf_counter()
+    for i in range(repeats):
+        generator.create_wheel_frame(len(labels), i * 7.0, labels)
+    return (time.perf_counter() - start) / repeats
+
+
+def _time_encode(frames) -> float:
+    start = time.perf_counter()
+    frames[0].save(io.BytesIO(), format='GIF', append_images=frames[1:], save_all=True,
+                   duration=BASE_FRAME_DURATION, transparency=0, disposal=2)
+    return time.perf_counter() - start
+
+
+def calibrate(reference_size: int = 300, repeats: int = 4) -> CostModel:
+    """Measure per-frame costs on this host (takes a few tens of milliseconds)"""
+    from .wheel_generator import WheelGenerator
+
+    few = [f"L{i}" for i in range(4)]
+    many = [f"L{i}" for i in range(24)]
+
+    full = WheelGenerator(size=reference_size)
+    full.create_wheel_frame(len(many), 0, many)  # load fonts and fill caches first
+    few_time = _time_frames(full, few, repeats)
+    many_time = _time_frames(full, many, repeats)
+    per_label = max(0.0, (many_time - few_time) / (len(many) - len(few)))
+    full_frame = max(0.0, few_time - len(few) * per_label)
+
+    fast = WheelGenerator(size=reference_size, large_mode=True)
+    fast.create_wheel_frame(len(many), 0, many)
+    fast_frame = _time_frames(fast, many, repeats)
+
+    # Encode cost per frame, excluding the fixed per-file overhead
+    frames = [full.create_wheel_frame(len(few), i * 7.0, few) for i in range(3 * repeats)]
+    _time_encode(frames[:2])  # initialize the GIF plugin first
+    encode_short = _time_encode(frames[:repeats])
+    encode_long = _time_encode(frames)
+    encode_frame = max(0.0, (encode_long - encode_short) / (2 * repeats))
+
+    return CostModel(reference_size, full_frame, per_label, fast_frame, encode_frame)
+
+
+def get_cost_model() -> CostModel:
+    """The process-wide cost model, calibrated on first use"""
+    global _cost_model
+    with _cost_model_lock:
+        if _cost_model is None:
+            _cost_model = calibrate()
+        return _cost_model
+
+
+def plan_render(segments: int, size: int = 500, animation_speed: float = 1.0,
+                large_mode: Optional[bool] = None, max_render_time: Optional[float] = None,
+                max_frames: Optional[int] = None, cost_model: Optional[CostModel] = None,
+                frame_policy: str = 'linear', frame_cap: Optional[int] = None) -> dict:
+    """
+    Choose frame count, frame sampling and quality tier for a render budget.
+
+    max_frames caps the frame count directly. max_render_time (seconds) is met
+    by switching to the cheaper tier first and then sampling fewer frames (never
+    below MIN_BUDGET_FRAMES). Frames are stretched so the spin keeps its
+    natural duration, which is the one frame_policy and frame_cap give (see
+    geometry.plan_frames). Returns the chosen parameters and the prediction.
+    """
+    large = is_large_wheel(segments, large_mode)
+    natural_frames = plan_frames(segments, animation_speed, large, frame_policy, frame_cap)['frames']
+    frames = natural_frames if max_frames is None else max(1, min(natural_frames, max_frames))
+    tier = 'fast' if large else 'full'
+    # Large wheels only draw the labels that fit, which is bounded by the image size
+    labels = min(segments, 64)
+
+    predicted = None
+    if max_render_time is not None:
+        model = cost_model or get_cost_model()
+        if (tier == 'full' and model.predict(size, labels, tier, frames) > max_render_time
+                and model.predict(size, labels, 'fast', frames) < model.predict(size, labels, tier, frames)):
+            tier = 'fast'
+        if model.predict(size, labels, tier, frames) > max_render_time:
+            fixed = model.predict(size, labels, tier, 0)
+            affordable = int((max_render_time - fixed) / model.frame_seconds(size, labels, tier))
+            frames = max(min(MIN_BUDGET_FRAMES, frames), min(frames, affordable))
+        predicted = model.predict(size, labels, tier, frames)
+
+    return {
+        'frames': frames,
+        'natural_frames': natural_frames,
+        'frame_step': natural_frames / frames,
+        'frame_duration_ms': int(round(BASE_FRAME_DURATION * natural_frames / frames)),
+        'quality_tier': tier,
+        'max_render_time': max_render_time,
+        'max_frames': max_frames,
+        'predicted_seconds': predicted,
+        'within_budget': predicted is None or predicted <= max_render_time
+    }
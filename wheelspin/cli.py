@@ -0,0 +1,150 @@
+"""
+Command line interface
+
+    wheelspin Alice Bob Charlie -o wheel.gif
+    wheelspin Alice Bob Charlie --format rgba | consumer
+    wheelspin Alice Bob Charlie --format y4m | ffmpeg -i - wheel.mp4
+    wheelspin --batch spins.txt --output-dir out/
+    wheelspin --serve 8000
+
+Raw formats stream to stdout (or -o) frame by frame; the winner and
+progress go to stderr so they never mix with the frames. Batch mode reads
+one wheel per line (labels separated by commas), writes one GIF per line
+and prints one JSON line per spin. --serve streams spins over HTTP (see
+server).
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+from typing import List, Optional
+
+from .geometry import FRAME_POLICIES
+from .stream import STREAM_FORMATS
+from .wheelspin_lib import __version__, spin_wheel
+
+
+def _parse_weights(text: Optional[str]) -> Optional[List[float]]:
+    if text is None:
+        return None
+    return [float(weight) for weight in text.split(',')]
+
+
+def _parse_color(text: str):
+    from PIL import ImageColor
+
+    return ImageColor.getrgb(text)[:3]
+
+
+def _spin(labels, args):
+    return spin_wheel(labels, size=args.size, start_rotation=args.rotation, animation_speed=args.speed,
+                      weights=_parse_weights(args.weights), max_frames=args.max_frames,
+                      frame_policy=args.frame_policy, frame_cap=args.frame_cap, motion_blur=args.motion_blur)
+
+
+def _open_output(path: Optional[str], stdout):
+    if path is None or path == '-':
+        return contextlib.nullcontext(stdout.buffer)
+    return open(path, 'wb')
+
+
+def _run_single(args, stdout) -> int:
+    labels = args.labels
+    if args.labels_file:
+        with open(args.labels_file, encoding='utf-8') as f:
+            labels = labels + [line.strip() for line in f if line.strip()]
+    if not labels:
+        raise ValueError("No labels given")
+
+    result = _spin(labels, args)
+    print(f"Winner: {result.winner} (#{result.winner_index})", file=sys.stderr)
+
+    if args.format == 'gif':
+        output = args.output or 'wheel.gif'
+        if output == '-':
+            stdout.buffer.write(result.gif_bytes)
+            stdout.buffer.flush()
+        else:
+            result.save(output)
+            print(f"Saved {output}", file=sys.stderr)
+        return 0
+
+    with _open_output(args.output, stdout) as output:
+        result.stream(output, args.format, _parse_color(args.background))
+    return 0
+
+
+def _run_batch(args, stdout) -> int:
+    os.makedirs(args.output_dir, exist_ok=True)
+    with open(args.batch, encoding='utf-8') as f:
+        wheels = [[label.strip() for label in line.split(',') if label.strip()] for line in f]
+    for number, labels in enumerate((labels for labels in wheels if labels), start=1):
+        result = _spin(labels, args)
+        output = result.save(os.path.join(args.output_dir, f"wheel-{number:04d}.gif"))
+        print(json.dumps({'file': output, 'winner': result.winner, 'winner_index': result.winner_index},
+                         ensure_ascii=False), file=stdout, flush=True)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='wheelspin', description="Spin a wheel and render the animation")
+    parser.add_argument('labels', nargs='*', help="Segment labels")
+    parser.add_argument('--labels-file', help="Read more labels from a file, one per line")
+    parser.add_argument('-o', '--output', help="Output file; '-' is stdout (default: wheel.gif, stdout for raw)")
+    parser.add_argument('-f', '--format', default='gif', choices=('gif',) + STREAM_FORMATS,
+                        help="gif, or raw frames streamed as they render: rgba (JSON header line "
+                             "+ RGBA frames) or y4m")
+    parser.add_argument('--size', type=int, default=500, help="Image size in pixels")
+    parser.add_argument('--rotation', type=float, help="Starting rotation in degrees (random if omitted)")
+    parser.add_argument('--speed', type=float, default=1.0, help="Animation speed multiplier")
+    parser.add_argument('--weights', help="Comma-separated slice weights, one per label")
+    parser.add_argument('--max-frames', type=int, help="Cap on the number of frames")
+    parser.add_argument('--frame-policy', default='linear', choices=FRAME_POLICIES,
+                        help="How the spin length grows with the number of labels")
+    parser.add_argument('--frame-cap', type=int, help="Hard maximum spin length in frames (shortens the spin)")
+    parser.add_argument('--motion-blur', action='store_true',
+                        help="Half the frames, with fast ones blurred along the rotation")
+    parser.add_argument('--background', default='#ffffff', help="Background color for y4m (no alpha)")
+    parser.add_argument('--batch', help="Render one GIF per line of this file (comma-separated labels)")
+    parser.add_argument('--output-dir', default='.', help="Directory for batch output")
+    parser.add_argument('--serve', metavar='[HOST:]PORT', help="Serve GET /spin over HTTP on this port")
+    parser.add_argument('--no-warmup', action='store_true', help="Skip preloading fonts and caches")
+    parser.add_argument('--version', action='version', version=f"%(prog)s {__version__}")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    stdout = sys.stdout
+    if args.serve:
+        from .server import serve
+
+        host, _, port = args.serve.rpartition(':')
+        serve(host or '127.0.0.1', int(port), sizes=(args.size,), warm=not args.no_warmup)
+        return 0
+    try:
+        # Progress messages from the renderer go to stderr, never into the output stream
+        with contextlib.redirect_stdout(sys.stderr):
+            # A raw stream sends its header before anything renders, so warming
+            # up first would only delay it
+            if not args.no_warmup and (args.batch or args.format == 'gif'):
+                from .warmup import warmup
+
+                warmup(sizes=(args.size,), sample_labels=args.labels or None, calibrate=False)
+            if args.batch:
+                return _run_batch(args, stdout)
+            return _run_single(args, stdout)
+    except BrokenPipeError:
+        # The consumer stopped reading; not an error for a stream. Point stdout
+        # at devnull so the interpreter's final flush does not fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), stdout.fileno())
+        return 0
+    except (ValueError, OSError) as error:
+        print(f"wheelspin: error: {error}", file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+EntrantIndex - Compact, array-backed storage for very large entrant lists
+"""
+
+from array import array
+from collections.abc import Sequence
+from typing import Iterable
+
+
+class EntrantIndex(Sequence):
+    """
+    An immutable sequence of entrant names stored in one UTF-8 buffer.
+
+    A list of 100k short strings costs tens of megabytes of object overhead;
+    here every name is packed into a single bytes object plus an array of
+    offsets, and a name is only decoded when it is looked up. Rendering and
+    winner selection only ever touch the handful of entrants they display.
+
+    Example:
+        >>> entrants = EntrantIndex(line.strip() for line in open('raffle.txt'))
+        >>> len(entrants), entrants[0]
+    """
+
+    def __init__(self, names: Iterable[str]):
+        data = bytearray()
+        offsets = array('Q', [0])
+        for name in names:
+            data += str(name).encode('utf-8')
+            offsets.append(len(data))
+        self._data = bytes(data)
+        self._offsets = offsets
+        self._content_key = ('entrants', self._data, offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("entrant index out of range")
+        return self._data[self._offsets[index]:self._offsets[index + 1]].decode('utf-8')
+
+    def __repr__(self) -> str:
+        return f"EntrantIndex({len(self)} entrants)"
+
+    @property
+    def content_key(self) -> tuple:
+        """
+        Equal for indexes with the same names in the same order. Built from
+        the packed buffers without decoding a name, and the same object on
+        every call, so comparing it with itself is immediate.
+        """
+        return self._content_key
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the packed names and offsets"""
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
+
+
+def as_segments(segments):
+    """Copy plain iterables into a list, but keep an EntrantIndex as-is"""
+    if isinstance(segments, EntrantIndex):
+        return segments
+    return list(segments)
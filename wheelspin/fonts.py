@@ -0,0 +1,358 @@
+"""
+Fonts - Glyph coverage index for per-character font fallback
+
+No single font covers every script and symbol a label may contain. The
+coverage index reads the character map (cmap table) of the primary font
+and of each installed fallback font once, records which code points each
+one has, and saves the result in the cache directory so later processes
+skip the parsing. Labels are split into runs of characters drawn with the
+same font: the primary font where it has the glyph, otherwise the first
+fallback that does. Lookups are memoized, so the rendering hot path pays
+one dict lookup per character, and only for labels that are not plain
+ASCII.
+"""
+
+import hashlib
+import io
+import json
+import os
+import struct
+import threading
+from bisect import bisect_right
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
+
+# Fallback fonts in order of preference, tried for characters the primary
+# font lacks. Missing files are skipped. Bitmap-only color emoji fonts
+# (Apple Color Emoji, Noto Color Emoji) only render at fixed sizes and are
+# left out; the monochrome emoji and symbol fonts are used instead.
+FALLBACK_FONTS = [
+    # Linux
+    "/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/truetype/noto/NotoSansArabic-Regular.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSansHebrew-Regular.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSansDevanagari-Regular.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSansThai-Regular.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSansSymbols-Regular.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSansSymbols2-Regular.ttf",
+    "/usr/share/fonts/truetype/noto/NotoEmoji-Regular.ttf",
+    "/usr/share/fonts/truetype/ancient-scripts/Symbola_hint.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/unifont/unifont.ttf",
+    # macOS
+    "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",
+    "/System/Library/Fonts/Hiragino Sans GB.ttc",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "/System/Library/Fonts/Apple Symbols.ttf",
+    # Windows
+    "C:/Windows/Fonts/arialuni.ttf",
+    "C:/Windows/Fonts/msyh.ttc",
+    "C:/Windows/Fonts/YuGothM.ttc",
+    "C:/Windows/Fonts/malgun.ttf",
+    "C:/Windows/Fonts/seguisym.ttf",
+    "C:/Windows/Fonts/seguiemj.ttf",
+]
+
+INDEX_VERSION = 1
+INDEX_FILE = f"glyph-coverage-v{INDEX_VERSION}.json"
+
+# Preferred cmap subtables: (platform, encoding), full Unicode first
+_CMAP_PREFERENCE = [(3, 10), (0, 6), (0, 4), (3, 1), (0, 3), (0, 2), (0, 1), (0, 0)]
+
+Ranges = List[Tuple[int, int]]  # sorted, disjoint, inclusive code point ranges
+
+
+def _read(f: BinaryIO, offset: int, size: int) -> bytes:
+    f.seek(offset)
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated font file")
+    return data
+
+
+def _merge(ranges: Ranges) -> Ranges:
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _format4_ranges(f: BinaryIO, offset: int) -> Ranges:
+    length = struct.unpack('>H', _read(f, offset + 2, 2))[0]
+    table = _read(f, offset, length)
+    segments = struct.unpack('>H', table[6:8])[0] // 2
+    ends = struct.unpack(f'>{segments}H', table[14:14 + 2 * segments])
+    base = 16 + 2 * segments
+    starts = struct.unpack(f'>{segments}H', table[base:base + 2 * segments])
+    deltas = struct.unpack(f'>{segments}h', table[base + 2 * segments:base + 4 * segments])
+    range_base = base + 4 * segments
+    range_offsets = struct.unpack(f'>{segments}H', table[range_base:range_base + 2 * segments])
+
+    ranges = []
+    for i in range(segments):
+        start, end = starts[i], min(ends[i], 0xFFFE)
+        for code in range(start, end + 1):
+            if range_offsets[i] == 0:
+                glyph = (code + deltas[i]) & 0xFFFF
+            else:
+                position = range_base + 2 * i + range_offsets[i] + 2 * (code - start)
+                glyph = struct.unpack('>H', table[position:position + 2])[0] if position + 2 <= length else 0
+                if glyph:
+                    glyph = (glyph + deltas[i]) & 0xFFFF
+            if glyph:
+                if ranges and ranges[-1][1] == code - 1:
+                    ranges[-1] = (ranges[-1][0], code)
+                else:
+                    ranges.append((code, code))
+    return ranges
+
+
+def _format12_ranges(f: BinaryIO, offset: int) -> Ranges:
+    groups = struct.unpack('>I', _read(f, offset + 12, 4))[0]
+    data = _read(f, offset + 16, 12 * groups)
+    ranges = []
+    for i in range(groups):
+        start, end, glyph = struct.unpack('>III', data[12 * i:12 * i + 12])
+        if glyph == 0:  # the first code point maps to the missing glyph
+            start += 1
+        if start <= end:
+            ranges.append((start, end))
+    return ranges
+
+
+def read_cmap(source: Union[str, bytes], font_index: int = 0) -> Ranges:
+    """
+    Code points a TrueType/OpenType font (or one font of a collection) has
+    glyphs for, as merged ranges. source is a path or the font file's bytes.
+    Only the header and the cmap table are read.
+    """
+    f = io.BytesIO(source) if isinstance(source, bytes) else open(source, 'rb')
+    with f:
+        start = 0
+        if _read(f, 0, 4) == b'ttcf':
+            count = struct.unpack('>I', _read(f, 8, 4))[0]
+            if not 0 <= font_index < count:
+                raise ValueError("Font index out of range")
+            start = struct.unpack('>I', _read(f, 12 + 4 * font_index, 4))[0]
+
+        tables = struct.unpack('>H', _read(f, start + 4, 2))[0]
+        directory = _read(f, start + 12, 16 * tables)
+        cmap = None
+        for i in range(tables):
+            tag, _, offset, _ = struct.unpack('>4sIII', directory[16 * i:16 * i + 16])
+            if tag == b'cmap':
+                cmap = offset
+        if cmap is None:
+            raise ValueError("Font has no cmap table")
+
+        subtables = struct.unpack('>H', _read(f, cmap + 2, 2))[0]
+        records = _read(f, cmap + 4, 8 * subtables)
+        encodings = {}
+        for i in range(subtables):
+            platform, encoding, offset = struct.unpack('>HHI', records[8 * i:8 * i + 8])
+            subtable = cmap + offset
+            encodings.setdefault((platform, encoding), (struct.unpack('>H', _read(f, subtable, 2))[0], subtable))
+
+        for key in _CMAP_PREFERENCE:
+            if key in encodings:
+                table_format, subtable = encodings[key]
+                if table_format == 12:
+                    return _merge(_format12_ranges(f, subtable))
+                if table_format == 4:
+                    return _merge(_format4_ranges(f, subtable))
+        raise ValueError("Font has no Unicode cmap in format 4 or 12")
+
+
+class GlyphIndex:
+    """
+    Which fonts cover which code points.
+
+    fonts[0] is the primary font; the others are fallbacks in order of
+    preference. Each entry of ranges lists the code points of one font.
+    """
+
+    def __init__(self, fonts: Sequence[str], ranges: Sequence[Ranges]):
+        self.fonts = list(fonts)
+        self._starts = [[start for start, _ in font_ranges] for font_ranges in ranges]
+        self._ends = [[end for _, end in font_ranges] for font_ranges in ranges]
+        self._ranges = [list(font_ranges) for font_ranges in ranges]
+        self._best = {}  # code point -> font index, filled on first lookup
+        self.primary_ascii = self.covers(0, 0x20) and all(self.covers(0, code) for code in range(0x21, 0x7F))
+
+    def covers(self, font: int, code: int) -> bool:
+        """Whether font has a glyph for code point code"""
+        position = bisect_right(self._starts[font], code) - 1
+        return position >= 0 and code <= self._ends[font][position]
+
+    def font_for(self, code: int) -> int:
+        """The preferred font for a code point; the primary font if none has it"""
+        best = self._best.get(code)
+        if best is None:
+            best = next((font for font in range(len(self.fonts)) if self.covers(font, code)), 0)
+            self._best[code] = best
+        return best
+
+    def split_runs(self, text: str) -> List[Tuple[str, int]]:
+        """
+        Split text into (substring, font index) runs. Letters and digits
+        use the primary font whenever it has them; spaces, punctuation and
+        characters of the same script stay in the current run, so mixed
+        labels break into as few runs as possible.
+        """
+        if self.primary_ascii and text.isascii():
+            return [(text, 0)]
+        runs = []
+        current = None
+        begin = 0
+        for position, char in enumerate(text):
+            code = ord(char)
+            if current is not None and self.covers(current, code):
+                if current == 0 or not char.isalnum() or not self.covers(0, code):
+                    continue
+                font = 0  # back to the primary font after a fallback run
+            else:
+                font = self.font_for(code)
+                if current is not None and not self.covers(font, code):
+                    continue  # no font has it: keep the current run rather than splitting
+            if current is not None:
+                runs.append((text[begin:position], current))
+            current = font
+            begin = position
+        if current is not None:
+            runs.append((text[begin:], current))
+        return runs
+
+    def to_json(self) -> dict:
+        return {'version': INDEX_VERSION, 'fonts': self.fonts, 'ranges': self._ranges}
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'GlyphIndex':
+        """Rebuild an index saved by to_json(); ValueError if data is not one"""
+        try:
+            fonts = data['fonts']
+            ranges = [[(int(start), int(end)) for start, end in font_ranges] for font_ranges in data['ranges']]
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"Malformed glyph index: {error!r}") from None
+        if not isinstance(fonts, list) or len(fonts) != len(ranges) or not all(isinstance(f, str) for f in fonts):
+            raise ValueError("Malformed glyph index: fonts do not match ranges")
+        return cls(fonts, ranges)
+
+
+def covers_ascii(source: Union[str, bytes]) -> bool:
+    """
+    Whether a font has every printable ASCII character. Only its own cmap
+    is read, which is far cheaper than building the index with every
+    fallback font; False if the cmap cannot be read.
+    """
+    try:
+        return GlyphIndex([''], [read_cmap(source)]).primary_ascii
+    except (OSError, ValueError, struct.error):
+        return False
+
+
+def cache_dir() -> str:
+    """Where the coverage index is kept: $WHEELSPIN_CACHE_DIR, else the user cache directory"""
+    configured = os.environ.get('WHEELSPIN_CACHE_DIR')
+    if configured:
+        return configured
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'wheelspin')
+
+
+def _fingerprint(source: Union[str, bytes]) -> str:
+    """Identifies a font file's current contents cheaply (path, size, mtime)"""
+    if isinstance(source, bytes):
+        return 'bytes:' + hashlib.sha1(source).hexdigest()
+    stat = os.stat(source)
+    return f"{os.path.abspath(source)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _saved_indexes(path: str) -> dict:
+    """The indexes saved in path by key; empty if the file is missing, from another version or malformed"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(saved, dict) or saved.get('version') != INDEX_VERSION:
+        return {}
+    indexes = saved.get('indexes')
+    return indexes if isinstance(indexes, dict) else {}
+
+
+def build_glyph_index(primary: Union[str, bytes], fallbacks: Optional[Sequence[str]] = None,
+                      directory: Optional[str] = None) -> GlyphIndex:
+    """
+    The coverage index for primary plus the installed fallback fonts, read
+    from directory (default cache_dir()) when the same font files were
+    indexed before, otherwise built and saved there. Fonts whose cmap
+    cannot be read are left out. An unwritable cache only costs the saving.
+    """
+    fallbacks = FALLBACK_FONTS if fallbacks is None else fallbacks
+    sources = [primary] + [path for path in fallbacks if path != primary and os.path.isfile(path)]
+    fingerprints = [_fingerprint(source) for source in sources]
+    key = hashlib.sha1('\n'.join(fingerprints).encode('utf-8')).hexdigest()[:16]
+    path = os.path.join(directory or cache_dir(), INDEX_FILE)
+
+    indexes = _saved_indexes(path)
+    if key in indexes:
+        try:
+            return GlyphIndex.from_json(indexes[key])
+        except ValueError:
+            pass  # a damaged entry is rebuilt and overwritten below
+
+    fonts, ranges = [], []
+    for source, fingerprint in zip(sources, fingerprints):
+        try:
+            font_ranges = read_cmap(source)
+        except (OSError, ValueError, struct.error):
+            if source is primary:
+                font_ranges = []  # unreadable primary: fallbacks still help
+            else:
+                continue
+        fonts.append(source if isinstance(source, str) else fingerprint)
+        ranges.append(font_ranges)
+    index = GlyphIndex(fonts, ranges)
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        indexes[key] = index.to_json()
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'indexes': indexes}, f)
+        os.replace(temporary, path)  # atomic, so concurrent processes never read half a file
+    except OSError:
+        pass
+    return index
+
+
+_indexes: Dict[str, GlyphIndex] = {}  # primary font fingerprint -> index, for this process
+_index_lock = threading.Lock()
+
+
+def _reset_index_lock():
+    """Give a forked child its own index lock; one another thread held at the fork stays locked forever"""
+    global _index_lock
+    _index_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_index_lock)
+
+
+def glyph_index(primary: Union[str, bytes]) -> GlyphIndex:
+    """The process-wide coverage index for a primary font (built or loaded once)"""
+    key = primary if isinstance(primary, str) else hashlib.sha1(primary).hexdigest()
+    index = _indexes.get(key)
+    if index is None:
+        with _index_lock:
+            index = _indexes.get(key)
+            if index is None:
+                index = _indexes[key] = build_glyph_index(primary)
+    return index
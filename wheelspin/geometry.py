@@ -0,0 +1,154 @@
+"""
+Geometry - Pure wheel math shared by rendering and winner selection
+
+Nothing in this module imports Pillow, so the winner of a spin can be
+decided without loading any rendering machinery.
+"""
+
+import math
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+CIRCLE_DEGREES = 360
+
+# Wheels with more segments than this render in large-wheel mode by default
+LARGE_WHEEL_THRESHOLD = 500
+# In large-wheel mode the spin lasts as long as it would for this many segments
+LARGE_WHEEL_FRAME_SEGMENTS = 100
+
+# How the spin length grows with the segment count (see plan_frames)
+FRAME_POLICIES = ('linear', 'log', 'capped')
+# 'capped' never renders more frames than this (12 s at 50 ms), scaled by animation speed
+CAPPED_SPIN_FRAMES = 240
+# 'log' adds this share of the base spin per doubling of the segment count
+LOG_FRAME_GROWTH = 0.5
+# Ease-out power of an uncompressed spin, and the most a compressed spin is retimed to
+EASING_POWER = 3.0
+MAX_EASING_POWER = 5.0
+
+
+def is_large_wheel(segments: int, large_mode: Optional[bool] = None) -> bool:
+    """Whether a wheel renders in large-wheel mode (auto above LARGE_WHEEL_THRESHOLD)"""
+    if large_mode is None:
+        return segments > LARGE_WHEEL_THRESHOLD
+    return large_mode
+
+
+def calculate_frames(segments: int, animation_speed: float = 1.0, large_mode: bool = False) -> int:
+    """Calculate number of animation frames based on segment count"""
+    if large_mode:
+        segments = min(segments, LARGE_WHEEL_FRAME_SEGMENTS)
+    base_frames = 60
+    base_segments = 8
+    frame_multiplier = max(1.0, segments / base_segments * 0.27)
+    return int(base_frames * frame_multiplier * animation_speed)
+
+
+def plan_frames(segments: int, animation_speed: float = 1.0, large_mode: bool = False,
+                policy: str = 'linear', frame_cap: Optional[int] = None) -> dict:
+    """
+    Frame count and easing of a spin under a frame policy.
+
+    'linear' is calculate_frames(). 'log' grows the spin with the logarithm
+    of the segment count and 'capped' stops it at CAPPED_SPIN_FRAMES; neither
+    is ever longer than 'linear'. frame_cap is a hard maximum for any policy.
+    Frames keep their duration, so a shorter count is a shorter spin; the
+    ease-out power rises with the compression so a larger share of the
+    frames shows the final deceleration.
+    """
+    if policy not in FRAME_POLICIES:
+        raise ValueError(f"Unknown frame policy {policy!r}; use one of {', '.join(FRAME_POLICIES)}")
+    if frame_cap is not None and frame_cap < 1:
+        raise ValueError("frame_cap must be at least 1")
+
+    linear_frames = calculate_frames(segments, animation_speed, large_mode)
+    frames = linear_frames
+    if policy == 'log':
+        doublings = math.log2(max(segments, 8) / 8)
+        frames = min(frames, int(60 * (1 + LOG_FRAME_GROWTH * doublings) * animation_speed))
+    elif policy == 'capped':
+        frames = min(frames, int(CAPPED_SPIN_FRAMES * animation_speed))
+    if frame_cap is not None:
+        frames = min(frames, frame_cap)
+    frames = max(1, frames)
+
+    easing_power = EASING_POWER
+    if frames < linear_frames:
+        easing_power = min(MAX_EASING_POWER, EASING_POWER + math.log2(linear_frames / frames) / 2)
+    return {
+        'policy': policy,
+        'frames': frames,
+        'linear_frames': linear_frames,
+        'frame_cap': frame_cap,
+        'easing_power': round(easing_power, 4)
+    }
+
+
+def spin_rotation(frame_index: int, num_frames: int, start_rotation: float,
+                  circle_degrees: float = CIRCLE_DEGREES, easing_power: float = EASING_POWER) -> float:
+    """Rotation of the wheel in a given animation frame (ease-out, cubic by default, two turns)"""
+    progress = frame_index / num_frames
+    eased_progress = 1 - (1 - progress) ** easing_power
+    return start_rotation + (eased_progress * 2 * circle_degrees)
+
+
+def build_angle_table(weights: Sequence[float], circle_degrees: float = CIRCLE_DEGREES,
+                      segments: Optional[int] = None) -> List[float]:
+    """
+    Cumulative slice boundaries for weighted segments.
+
+    Slice i spans [table[i], table[i + 1]) degrees; the table has one more
+    entry than there are weights and runs from 0 to circle_degrees. Pass
+    segments to check there is exactly one weight per segment.
+    """
+    if not weights:
+        raise ValueError("Weights list cannot be empty")
+    if segments is not None and len(weights) != segments:
+        raise ValueError("Weights must have one entry per segment")
+    if any(weight <= 0 for weight in weights):
+        raise ValueError("Weights must be positive")
+
+    total = float(sum(weights))
+    table = [0.0]
+    table.extend(circle_degrees * partial / total for partial in accumulate(weights))
+    table[-1] = float(circle_degrees)  # no floating point drift at the seam
+    return table
+
+
+def calculate_winner(start_rotation: float, segments: Sequence[str],
+                     circle_degrees: float = CIRCLE_DEGREES,
+                     angle_table: Optional[Sequence[float]] = None) -> Tuple[int, str]:
+    """Calculate which segment ends under the pointer (at 0 degrees)"""
+    relative_angle = (0 - start_rotation) % circle_degrees  # Pointer at 0 degrees
+    if angle_table is not None:
+        segment_index = min(bisect_right(angle_table, relative_angle) - 1, len(segments) - 1)
+    else:
+        angle_per_segment = circle_degrees / len(segments)
+        segment_index = int(relative_angle / angle_per_segment) % len(segments)
+
+    return segment_index, segments[segment_index]
+
+
+# Smallest image size with room for a disk (its radius is size // 2 - 20)
+MIN_IMAGE_SIZE = 42
+
+
+def pointer_geometry(size: int) -> Dict[str, object]:
+    """
+    Positions of the static overlay in an image of the given size: the disk
+    center and radius, the hub radius and the triangle pointer at 3 o'clock
+    (its tip touches the disk at 0 degrees, where the winner is read).
+    """
+    center = size // 2
+    radius = size // 2 - 20
+    tip_x = center + radius * 0.95
+    base_x = size * 0.99
+    half_height = (size - tip_x) / 2
+    return {
+        'center': center,
+        'radius': radius,
+        'hub_radius': radius / 10,
+        'pointer': [(tip_x, center), (base_x, center - half_height), (base_x, center + half_height)]
+    }
@@ -0,0 +1,91 @@
+"""
+Layers - Slices, labels and overlay rendered and cached independently
+
+A wheel at rest is three layers: the colored slices, the labels on a
+transparent background, and the static hub and pointer. Each layer is
+cached under a key made only of its own inputs, so a wheel in another color
+theme reuses its label layer, a translated wheel reuses its slice layer and
+a restyled pointer redraws only the overlay. The cache is process-wide
+because a theme is usually a different generator.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+LAYERS = ('slices', 'labels', 'overlay')
+
+
+def image_bytes(image) -> int:
+    """Pixel memory of an image: width * height * bands"""
+    return image.width * image.height * len(image.getbands())
+
+
+class LayerCache:
+    """
+    Rendered layers by (layer, key), least recently used dropped first once
+    their pixels exceed max_bytes. A layer larger than max_bytes on its own
+    is rendered but not kept. Cached images are shared: copy one before
+    drawing on it.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes  # 500px RGBA is 1 MB per layer, 2000px is 16 MB
+        self.bytes = 0
+        self._entries = OrderedDict()  # (layer, key) -> image, least recently used first
+        self._lock = threading.Lock()
+        self.hits = dict.fromkeys(LAYERS, 0)
+        self.misses = dict.fromkeys(LAYERS, 0)
+
+    def get(self, layer: str, key: Hashable, render: Callable):
+        """The image of layer for key, rendered by render() on a miss"""
+        entry = (layer, key)
+        with self._lock:
+            image = self._entries.get(entry)
+            if image is not None:
+                self._entries.move_to_end(entry)
+                self.hits[layer] += 1
+                return image
+            self.misses[layer] += 1
+
+        # Rendered outside the lock so other wheels are not held up; a
+        # concurrent miss on the same key renders the same image twice
+        image = render()
+        size = image_bytes(image)
+        if size > self.max_bytes:
+            return image
+        with self._lock:
+            previous = self._entries.pop(entry, None)
+            if previous is not None:
+                self.bytes -= image_bytes(previous)
+            self._entries[entry] = image
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, dropped = self._entries.popitem(last=False)
+                self.bytes -= image_bytes(dropped)
+        return image
+
+    def stats(self) -> dict:
+        """Entry count, cached bytes and per-layer hits and misses"""
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self.bytes, 'hits': dict(self.hits),
+                    'misses': dict(self.misses)}
+
+    def clear(self):
+        """Drop every cached layer and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+            self.hits = dict.fromkeys(LAYERS, 0)
+            self.misses = dict.fromkeys(LAYERS, 0)
+
+    def _reset_lock(self):
+        self._lock = threading.Lock()
+
+
+layer_cache = LayerCache()
+
+if hasattr(os, 'register_at_fork'):
+    # A lock held by another thread at fork time would never be released in the child
+    os.register_at_fork(after_in_child=layer_cache._reset_lock)
@@ -0,0 +1,159 @@
+"""
+Output size targeting - fit an animation under a byte limit in one pass
+
+A handful of sample frames are rendered and encoded to measure bytes per
+frame and how much each knob (dimensions, palette size, delta frames)
+shrinks it. The best-looking combination predicted to fit is rendered; if
+the prediction misses, a bounded search steps further down the ladder.
+"""
+
+import io
+from typing import Callable, List, Optional, Tuple
+
+from .encoding import encode_gif
+from .geometry import MIN_IMAGE_SIZE
+
+# Candidate settings, best quality first. Dimensions are given up last,
+# frame count before that, palette size first (wheels use few colors anyway).
+SCALES = (1.0, 0.85, 0.7, 0.55, 0.4)
+FRAME_FACTORS = (1.0, 0.75, 0.5, 0.35)
+PALETTE_SIZES = (None, 128, 64, 32)  # None = Pillow's default conversion
+
+SAMPLE_FRAMES = 4
+MIN_FRAMES = 10
+MAX_ATTEMPTS = 3
+SAFETY_MARGIN = 0.9  # aim below the limit to absorb prediction error
+
+
+def _encoded_size(frames, palette_size=None, delta=False) -> int:
+    buffer = io.BytesIO()
+    encode_gif(frames, buffer, palette_size=palette_size, delta=delta)
+    return len(buffer.getvalue())
+
+
+def _scales(size: int) -> List[float]:
+    """The SCALES that keep the image at least MIN_IMAGE_SIZE (the full size is always kept)"""
+    return [scale for scale in SCALES if scale == 1.0 or _scaled_size(size, scale) >= MIN_IMAGE_SIZE]
+
+
+def _scaled_size(size: int, scale: float) -> int:
+    return max(1, int(size * scale))
+
+
+def _render_frames(generator, labels, start_rotation, indices, num_frames, angle_table):
+    return [generator.create_animation_frame(labels, start_rotation, i, num_frames, angle_table)
+            for i in indices]
+
+
+def measure_size_model(make_generator: Callable, size: int, labels, start_rotation: float,
+                       num_frames: int, angle_table: Optional[List[float]] = None) -> dict:
+    """Measure bytes per frame and the relative effect of each size knob"""
+    step = max(1, (num_frames - 1) // SAMPLE_FRAMES)
+    indices = [min(num_frames - 1, k * step) for k in range(SAMPLE_FRAMES)]
+    pair_indices = [indices[1], min(num_frames - 1, indices[1] + 1)]
+
+    generator = make_generator(size)
+    samples = _render_frames(generator, labels, start_rotation, indices, num_frames, angle_table)
+    base = _encoded_size(samples)
+
+    palette_ratio = {None: 1.0}
+    for palette_size in PALETTE_SIZES[1:]:
+        palette_ratio[palette_size] = _encoded_size(samples, palette_size) / base
+
+    scale_ratio = {1.0: 1.0}
+    for scale in _scales(size)[1:]:
+        scaled = make_generator(_scaled_size(size, scale))
+        scaled_samples = _render_frames(scaled, labels, start_rotation, indices, num_frames, angle_table)
+        scale_ratio[scale] = _encoded_size(scaled_samples) / base
+
+    pair = _render_frames(generator, labels, start_rotation, pair_indices, num_frames, angle_table)
+    delta_ratio = _encoded_size(pair, 256, delta=True) / _encoded_size(pair)
+
+    return {
+        'bytes_per_frame': base / len(samples),
+        'palette_ratio': palette_ratio,
+        'scale_ratio': scale_ratio,
+        'delta_ratio': delta_ratio
+    }
+
+
+def candidate_settings(num_frames: int, size_model: dict):
+    """Yield (scale, frames, palette_size, delta, predicted_bytes), best quality first"""
+    deltas = (False, True) if size_model['delta_ratio'] < 1.0 else (False,)
+    for scale in size_model['scale_ratio']:  # only the scales that were measured
+        for factor in FRAME_FACTORS:
+            frames = max(min(MIN_FRAMES, num_frames), int(round(num_frames * factor)))
+            for palette_size in PALETTE_SIZES:
+                for delta in deltas:
+                    predicted = (frames * size_model['bytes_per_frame'] * size_model['scale_ratio'][scale]
+                                 * size_model['palette_ratio'][palette_size]
+                                 * (size_model['delta_ratio'] if delta else 1.0))
+                    yield scale, frames, palette_size, delta, predicted
+
+
+def render_to_size(make_generator: Callable, size: int, labels, start_rotation: float,
+                   max_bytes: int, num_frames: int, duration: int = 50,
+                   angle_table: Optional[List[float]] = None) -> Tuple[bytes, dict]:
+    """
+    Render a GIF that fits in max_bytes, trading off quality as little as possible.
+
+    make_generator(size) must return a WheelGenerator for the given image size.
+    Returns the GIF bytes and a report of the chosen settings and trade-offs.
+    """
+    size_model = measure_size_model(make_generator, size, labels, start_rotation, num_frames, angle_table)
+    candidates = list(candidate_settings(num_frames, size_model))
+
+    correction = 1.0  # actual / predicted from the previous attempt
+    rendered = {}  # (scale, frames) -> frames, so palette-only retries skip rendering
+    position = 0
+    attempts = 0
+    data = None
+    while attempts < MAX_ATTEMPTS:
+        # First candidate predicted to fit, or the smallest one when nothing does
+        chosen = len(candidates) - 1
+        for i in range(position, len(candidates)):
+            if candidates[i][4] * correction <= max_bytes * SAFETY_MARGIN:
+                chosen = i
+                break
+        scale, frames, palette_size, delta, predicted = candidates[chosen]
+        attempts += 1
+
+        key = (scale, frames)
+        if key not in rendered:
+            generator = make_generator(_scaled_size(size, scale))
+            rendered[key] = _render_frames(generator, labels, start_rotation, range(frames), frames, angle_table)
+        buffer = io.BytesIO()
+        frame_duration = int(round(duration * num_frames / frames))
+        encode_gif(rendered[key], buffer, duration=frame_duration, palette_size=palette_size, delta=delta)
+        data = buffer.getvalue()
+
+        if len(data) <= max_bytes or chosen == len(candidates) - 1:
+            break
+        correction = len(data) / predicted
+        position = chosen + 1
+
+    output_size = _scaled_size(size, scale)
+    tradeoffs = []
+    if scale != 1.0:
+        tradeoffs.append(f"size {size}px -> {output_size}px")
+    if frames != num_frames:
+        tradeoffs.append(f"frames {num_frames} -> {frames}")
+    if palette_size is not None:
+        tradeoffs.append(f"palette 256 -> {palette_size} colors")
+    if delta:
+        tradeoffs.append("delta frames")
+
+    return data, {
+        'max_bytes': max_bytes,
+        'predicted_bytes': int(predicted),
+        'output_bytes': len(data),
+        'within_limit': len(data) <= max_bytes,
+        'attempts': attempts,
+        'size': output_size,
+        'scale': scale,
+        'frames': frames,
+        'frame_duration_ms': frame_duration,
+        'palette_size': palette_size or 256,
+        'delta': delta,
+        'tradeoffs': tradeoffs
+    }
@@ -0,0 +1,165 @@
+"""
+Pipeline - Overlap rendering, palette conversion and GIF encoding
+
+Rendering and palette conversion each run in their own thread, and the
+caller feeds Pillow's GIF writer; the stages hand frames on through bounded
+queues, so frame N+1 renders while frame N is converted, and a full queue
+makes the stage before it wait (backpressure). Pillow releases the GIL
+while drawing and converting, so these overlap on multi-core hosts.
+
+The GIF writer only prepares frames as they arrive (it compares each with
+the previous one); it compresses and writes all of them after the last
+frame, so that work cannot overlap rendering. It is reported as a separate
+'write' stage. The GIF is byte-identical to encode_gif() on the same frames.
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, List
+
+from PIL import Image
+
+from .encoding import encode_gif
+
+# 'encode' is the GIF writer taking frames in, 'write' its compression after the last one
+STAGES = ('render', 'quantize', 'encode', 'write')
+
+# Frames buffered between two stages
+QUEUE_SIZE = 4
+
+_DONE = object()  # end of frames marker passed down the pipeline
+
+
+class _Stage:
+    """Busy and waiting time of one stage"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.busy = 0.0
+        self.waiting = 0.0
+
+
+def quantize_adaptive(frame: Image.Image) -> Image.Image:
+    """Convert an RGBA frame to a palette exactly as Pillow's GIF writer would"""
+    return frame.convert('P', palette=Image.Palette.ADAPTIVE)
+
+
+def _put(target: queue.Queue, item, stop: threading.Event) -> bool:
+    """Put item, waiting while the queue is full; False if the pipeline stopped"""
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=0.05)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(source: queue.Queue, stop: threading.Event):
+    """Take the next item, or the end marker if the pipeline stopped"""
+    while not stop.is_set():
+        try:
+            return source.get(timeout=0.05)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+def run_pipeline(render_frame: Callable[[int], Image.Image], num_frames: int, output_file,
+                 duration: int = 50, queue_size: int = QUEUE_SIZE) -> Dict[str, object]:
+    """
+    Render frames 0..num_frames-1 with render_frame(i) and encode them as a GIF.
+
+    Returns per-stage statistics: busy seconds, utilization (busy / wall
+    time) and the bottleneck, the stage with the most busy time. 'write' is
+    the time from the last frame reaching the GIF writer to the end.
+    """
+    stages = {name: _Stage(name) for name in STAGES}
+    rendered = queue.Queue(maxsize=queue_size)
+    quantized = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    errors: List[BaseException] = []
+    frames_done = []  # when the GIF writer had received every frame
+
+    def render():
+        stage = stages['render']
+        try:
+            for i in range(num_frames):
+                start = time.perf_counter()
+                frame = render_frame(i)
+                stage.busy += time.perf_counter() - start
+                start = time.perf_counter()
+                if not _put(rendered, frame, stop):
+                    return
+                stage.waiting += time.perf_counter() - start
+        except BaseException as error:  # re-raised by run_pipeline
+            errors.append(error)
+            stop.set()
+        finally:
+            _put(rendered, _DONE, stop)
+
+    def quantize():
+        stage = stages['quantize']
+        try:
+            while True:
+                start = time.perf_counter()
+                frame = _get(rendered, stop)
+                stage.waiting += time.perf_counter() - start
+                if frame is _DONE:
+                    break
+                start = time.perf_counter()
+                paletted = quantize_adaptive(frame)
+                stage.busy += time.perf_counter() - start
+                start = time.perf_counter()
+                if not _put(quantized, paletted, stop):
+                    return
+                stage.waiting += time.perf_counter() - start
+        except BaseException as error:
+            errors.append(error)
+            stop.set()
+        finally:
+            _put(quantized, _DONE, stop)
+
+    def encoder_input():
+        stage = stages['encode']
+        while True:
+            start = time.perf_counter()
+            frame = _get(quantized, stop)
+            stage.waiting += time.perf_counter() - start
+            if frame is _DONE:
+                frames_done.append(time.perf_counter())
+                return
+            yield frame
+
+    workers = [threading.Thread(target=render, daemon=True), threading.Thread(target=quantize, daemon=True)]
+    wall_start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    try:
+        encode_gif(encoder_input(), output_file, duration=duration)
+    except StopIteration:
+        errors.append(ValueError("Animation has no frames"))  # unless a stage failed first
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        for worker in workers:
+            worker.join()
+    if errors:
+        raise errors[0]
+
+    end = time.perf_counter()
+    wall = end - wall_start
+    stages['write'].busy = end - frames_done[0]
+    stages['encode'].busy = max(0.0, frames_done[0] - wall_start - stages['encode'].waiting)
+    return {
+        'frames': num_frames,
+        'wall_s': wall,
+        'stages': {
+            name: {'busy_s': stage.busy, 'utilization': stage.busy / wall if wall else 0.0}
+            for name, stage in stages.items()
+        },
+        'bottleneck': max(stages.values(), key=lambda stage: stage.busy).name
+    }
+
@@ -0,0 +1,76 @@
+"""
+Progressive GIF - Yield GIF bytes while the frames are still rendering
+
+Pillow's GIF writer needs every frame before it writes the first byte. GIF
+itself is sequential, though: a header with one global palette, then one
+self-contained block per frame. The global palette is built from the first
+frame (every frame of a spin shows the same wheel, only rotated), so the
+header goes out after a single frame has rendered and each later frame is
+sent as soon as it is encoded. Time to first byte is one frame's render
+time instead of the whole animation's.
+"""
+
+import struct
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from PIL import GifImagePlugin, Image
+
+GIF_TRAILER = b';'
+
+
+def global_palette(frame: Image.Image, palette_size: int = 256) -> Tuple[Image.Image, int]:
+    """
+    A palette image with the colors of frame, leaving the last index free
+    for transparency. Returns it and the transparent index.
+    """
+    transparent_index = palette_size - 1
+    reference = frame.convert('RGB').quantize(colors=transparent_index, method=Image.Quantize.FASTOCTREE,
+                                              dither=Image.Dither.NONE)
+    return reference, transparent_index
+
+
+def map_to_palette(frame: Image.Image, reference: Image.Image, transparent_index: int) -> Image.Image:
+    """Map an RGBA frame onto the global palette; pixels under half opacity become transparent"""
+    paletted = frame.convert('RGB').quantize(palette=reference, dither=Image.Dither.NONE)
+    transparent = frame.getchannel('A').point(lambda value: 255 if value < 128 else 0)
+    paletted.paste(transparent_index, mask=transparent)
+    return paletted
+
+
+def gif_header(size: Tuple[int, int], palette: List[int]) -> bytes:
+    """GIF89a signature, screen descriptor and a 256-entry global color table"""
+    color_table = bytes(palette[:768]).ljust(768, b'\0')
+    # 0xF7: global color table present, 8 bits per channel, 2^(7+1) entries
+    return b'GIF89a' + struct.pack('<HHBBB', size[0], size[1], 0xF7, 0, 0) + color_table
+
+
+def iter_gif(frames: Iterable[Image.Image], duration: int = 50) -> Iterator[bytes]:
+    """
+    Encode RGBA frames as an animated GIF, one chunk at a time.
+
+    Yields the header and global palette once the first frame arrives, then
+    one chunk per frame (graphic control extension, image descriptor and
+    LZW data) and finally the trailer. Concatenated, the chunks are a
+    complete GIF that plays once, like create_gif().
+    """
+    frames = iter(frames)
+    try:
+        first = next(frames)
+    except StopIteration:
+        raise ValueError("Animation has no frames") from None
+
+    reference, transparent_index = global_palette(first)
+    yield gif_header(first.size, reference.getpalette())
+    for frame in chain([first], frames):
+        paletted = map_to_palette(frame, reference, transparent_index)
+        yield b''.join(GifImagePlugin.getdata(paletted, duration=duration, disposal=2,
+                                              transparency=transparent_index))
+    yield GIF_TRAILER
+
+
+def iter_spin_gif(generator, labels: List[str], start_rotation: float, num_frames: int, duration: int = 50,
+                  angle_table: Optional[List[float]] = None) -> Iterator[bytes]:
+    """iter_gif() over the frames of a spin, each rendered only when the previous chunk was taken"""
+    return iter_gif((generator.create_animation_frame(labels, start_rotation, i, num_frames, angle_table)
+                     for i in range(num_frames)), duration)
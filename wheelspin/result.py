@@ -0,0 +1,367 @@
+"""
+SpinResult - Outcome of a spin with a lazily rendered animation
+"""
+
+import io
+import math
+import os
+import threading
+from typing import Dict, List, Optional
+
+from .budget import plan_render
+from .entrants import as_segments
+from .geometry import build_angle_table, calculate_winner, is_large_wheel, plan_frames, spin_rotation
+
+
+class SpinResult:
+    """
+    The winner of a spin, available immediately, plus its animation.
+
+    The winner only depends on the starting rotation, so it is decided when
+    the result is created. The GIF is rendered the first time gif_bytes (or
+    save()) is accessed, or in a background thread started at creation when
+    background=True. Passing a shared WheelGenerator reuses its font, layout
+    and sprite caches.
+
+    frame_policy ('linear', 'log' or 'capped') and frame_cap set how long the
+    spin is (see geometry.plan_frames); shorter spins are retimed to a
+    steeper ease-out. The outcome is reported in info['frame_policy'].
+
+    With motion_blur the spin is rendered with half the frames, each shown
+    twice as long, and fast frames are blurred along their rotation so the
+    motion stays smooth (see WheelGenerator.create_blurred_frame).
+
+    With max_render_time (seconds) or max_frames the frame count, sampling
+    and quality tier are chosen up front by plan_render() and reported in
+    info['budget'].
+
+    With max_bytes the GIF is fitted under that many bytes by reducing palette
+    size, frame count and then dimensions as needed (see output_size); the
+    chosen settings are reported in info['size_target'] after rendering.
+
+    With processes the frames are rendered by that many worker processes and
+    passed back through shared memory; info['pipeline'] then reports the
+    stage statistics of that render. The workers re-import the main module,
+    so a script must render under ``if __name__ == '__main__':``.
+
+    export_timeline() writes the disk, overlay and a JSON timeline so clients
+    can animate the spin themselves.
+    svg() returns the wheel as vector shapes with a CSS spin animation.
+    still() renders a single frame, by default the final pose, as PNG or WebP.
+    frames() renders every frame into one raw pixel buffer; stream() writes
+    raw RGBA or Y4M frames to a pipe as they render, and iter_gif() yields
+    the GIF progressively.
+    save_sizes() writes the animation at several sizes from a single render
+    at self.size, the largest of them.
+    """
+
+    def __init__(self, segments: List[str], start_rotation: float, size: int = 500,
+                 colors: Optional[List[str]] = None, font_size: int = 11,
+                 animation_speed: float = 1.0, large_mode: Optional[bool] = None,
+                 weights: Optional[List[float]] = None, max_render_time: Optional[float] = None,
+                 max_frames: Optional[int] = None, max_bytes: Optional[int] = None,
+                 processes: Optional[int] = None, frame_policy: str = 'linear',
+                 frame_cap: Optional[int] = None, motion_blur: bool = False, generator=None,
+                 background: bool = False):
+        if not segments:
+            raise ValueError("Segments list cannot be empty")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if processes is not None and processes < 1:
+            raise ValueError("processes must be at least 1")
+
+        self.segments = as_segments(segments)
+        self.start_rotation = start_rotation
+        self.size = size
+        self.colors = colors or ['#eeb312', '#d61126', '#346ae9', '#019b26']
+        self.font_size = font_size
+        self.animation_speed = animation_speed
+        self.large_mode = is_large_wheel(len(self.segments), large_mode)
+        self._large_mode_option = large_mode  # as given, so the shared generator key matches other callers
+
+        self.max_bytes = max_bytes
+        self.processes = processes
+        self.weights = list(weights) if weights is not None else None
+        self.angle_table = None
+        if self.weights is not None:
+            self.angle_table = build_angle_table(self.weights, segments=len(self.segments))
+
+        self.winner_index, self.winner = calculate_winner(start_rotation, self.segments,
+                                                          angle_table=self.angle_table)
+
+        self.frame_plan = plan_frames(len(self.segments), animation_speed, self.large_mode, frame_policy, frame_cap)
+        self.easing_power = self.frame_plan['easing_power']
+        self.motion_blur = motion_blur
+        self.plan = None
+        num_frames = self.frame_plan['frames']
+        if max_render_time is not None or max_frames is not None:
+            self.plan = plan_render(len(self.segments), size, animation_speed, self.large_mode,
+                                    max_render_time=max_render_time, max_frames=max_frames,
+                                    frame_policy=frame_policy, frame_cap=frame_cap)
+            num_frames = self.plan['frames']
+        if motion_blur:
+            num_frames = max(1, num_frames // 2)
+        self.info = {
+            'winner_index': self.winner_index,
+            'winner_name': self.winner,
+            'start_rotation': start_rotation,
+            'total_segments': len(self.segments),
+            'frames_generated': num_frames,
+            'size': size,
+            'animation_speed': animation_speed,
+            'large_mode': self.large_mode,
+            'weighted': self.weights is not None,
+            'frame_policy': self.frame_plan,
+            'motion_blur': motion_blur,
+            'budget': self.plan,
+            'size_target': None,
+            'pipeline': None,
+            'colors_used': self.colors[:len(self.segments)]
+        }
+
+        self._generator = generator
+        self._lock = threading.Lock()
+        self._gif_bytes = None
+        self._error = None
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(target=self._render_in_background, daemon=True)
+            self._thread.start()
+
+    def __repr__(self) -> str:
+        state = 'rendered' if self.ready else 'pending'
+        return f"SpinResult(winner={self.winner!r}, index={self.winner_index}, {state})"
+
+    @property
+    def ready(self) -> bool:
+        """True once the animation has been rendered"""
+        return self._gif_bytes is not None
+
+    @property
+    def gif_bytes(self) -> bytes:
+        """The animated GIF, rendered on first access"""
+        if self._thread is not None:
+            self._thread.join()
+        return self.render()
+
+    @property
+    def animation(self):
+        """The spin as a lazily rendered WheelAnimation (frames on demand)"""
+        from .animation import WheelAnimation
+
+        return WheelAnimation(self.segments, self.start_rotation, generator=self._create_generator(),
+                              weights=self.weights, num_frames=self.info['frames_generated'])
+
+    def render(self) -> bytes:
+        """Render the animation if needed and return the GIF bytes"""
+        with self._lock:
+            if self._error is not None:
+                raise self._error
+            if self._gif_bytes is None:
+                self._gif_bytes = self._render_gif()
+            return self._gif_bytes
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a background render; returns True if the animation is ready"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.ready
+
+    def save(self, output_file: str) -> str:
+        """Write the animated GIF to output_file and return the path"""
+        with open(output_file, 'wb') as f:
+            f.write(self.gif_bytes)
+        return output_file
+
+    def still(self, index: int = -1, output_file: Optional[str] = None, format: str = 'PNG') -> bytes:
+        """
+        One frame of the animation as a PNG or WebP, without rendering the rest.
+        The default is the final resting frame, exactly as it ends the GIF.
+        """
+        num_frames = self.info['frames_generated']
+        if index < 0:
+            index += num_frames
+        if not 0 <= index < num_frames:
+            raise IndexError("animation frame index out of range")
+
+        generator = self._create_generator()
+        rotation = spin_rotation(index, num_frames, self.start_rotation, generator.circle_degrees,
+                                 generator.easing_power)
+        return generator.render_still(self.segments, rotation, output_file, format, weights=self.weights,
+                                      highlight=index >= num_frames - generator.highlight_frames)
+
+    def frames(self, mode: str = 'RGBA', out=None):
+        """
+        Every frame of the animation as raw pixels in one buffer, without a
+        GIF round trip (see frame_array.render_frame_array). out may be a
+        preallocated buffer, such as a NumPy uint8 array, to render into.
+        """
+        from .frame_array import render_frame_array
+
+        return render_frame_array(self._create_generator(), self.segments, self.start_rotation,
+                                  self.info['frames_generated'], self.angle_table, mode, out)
+
+    def iter_gif(self):
+        """
+        The GIF in chunks yielded while frames render: header and global
+        palette after the first frame, then one chunk per frame (see
+        progressive.iter_gif). The bytes differ from gif_bytes, which uses
+        a palette per frame.
+        """
+        from .progressive import iter_spin_gif
+
+        return iter_spin_gif(self._create_generator(), self.segments, self.start_rotation,
+                             self.info['frames_generated'], self._frame_duration(), self.angle_table)
+
+    def stream(self, output, format: str = 'rgba', background=(255, 255, 255)) -> int:
+        """
+        Write the animation's raw frames to a binary file object (stdout, a
+        pipe) as they render, see stream.iter_stream. Returns bytes written.
+        """
+        from .stream import iter_stream, write_stream
+
+        chunks = iter_stream(self._create_generator(), self.segments, self.start_rotation,
+                             self.info['frames_generated'], self._frame_duration(), self.angle_table,
+                             format, background, winner={'index': self.winner_index, 'name': self.winner})
+        return write_stream(output, chunks)
+
+    def export_timeline(self, output_dir: str, sprite_sheet: bool = False,
+                        sprite_size: Optional[int] = None) -> dict:
+        """
+        Export the spin for client-side playback instead of a GIF.
+
+        Writes disk.png (the wheel at rotation 0), overlay.png (hub and
+        pointer) and timeline.json (see timeline.build_timeline) to
+        output_dir. With sprite_sheet=True every frame is also rendered into
+        sprites.png, downscaled to sprite_size if given. Returns the timeline.
+        """
+        from .encoding import encode_still
+        from .timeline import build_timeline, write_timeline
+
+        os.makedirs(output_dir, exist_ok=True)
+        generator = self._create_generator()
+        num_frames = self.info['frames_generated']
+        large = generator.is_large_wheel(len(self.segments))
+
+        timeline = build_timeline(self.segments, self.start_rotation, num_frames, self.size,
+                                  self._frame_duration(), self.angle_table,
+                                  colors=None if large else generator.distribute_colors(len(self.segments)),
+                                  highlight_frames=generator.highlight_frames if large else 0,
+                                  easing_power=generator.easing_power)
+
+        disk, overlay = generator.render_layers(self.segments, self.angle_table)
+        files = {'disk': 'disk.png', 'overlay': 'overlay.png'}
+        encode_still(disk, os.path.join(output_dir, files['disk']))
+        encode_still(overlay, os.path.join(output_dir, files['overlay']))
+
+        if sprite_sheet:
+            sheet, columns = generator.create_sprite_sheet(self.segments, self.start_rotation, num_frames,
+                                                           self.angle_table, sprite_size)
+            files['sprite_sheet'] = 'sprites.png'
+            encode_still(sheet, os.path.join(output_dir, files['sprite_sheet']))
+            timeline['sprite_sheet'] = {
+                'frame_size': sprite_size or self.size,
+                'columns': columns,
+                'rows': math.ceil(num_frames / columns)
+            }
+
+        timeline['files'] = files
+        write_timeline(timeline, os.path.join(output_dir, 'timeline.json'))
+        return timeline
+
+    def svg(self, output_file: Optional[str] = None, animate: bool = True) -> str:
+        """
+        The spin as an SVG document with a CSS animation (see svg.build_svg).
+        With animate=False the wheel is drawn at rest on the winner.
+        Writes output_file if given and returns the SVG text.
+        """
+        from .svg import build_svg
+
+        duration_ms = self._frame_duration() * self.info['frames_generated'] if animate else None
+        document = build_svg(self._create_generator(), self.segments, self.start_rotation,
+                             self.angle_table, duration_ms)
+        if output_file is not None:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(document)
+        return document
+
+    def save_sizes(self, outputs: Dict[int, str]) -> Dict[int, str]:
+        """
+        Write the animation at several sizes from one render pass.
+
+        outputs maps image size to file; the largest size must be self.size.
+        Label minimums are raised so text stays legible at the smallest size.
+        """
+        if not outputs:
+            raise ValueError("Outputs cannot be empty")
+        if max(outputs) != self.size or min(outputs) <= 0:
+            raise ValueError("Output sizes must be positive and the largest must equal the result size")
+
+        generator = self._create_generator(label_scale=self.size / min(outputs))
+        self.info['frames_generated'] = generator.create_gifs(self.segments, self.start_rotation, outputs,
+                                                              weights=self.weights,
+                                                              num_frames=self.info['frames_generated'],
+                                                              duration=self._frame_duration())
+        return outputs
+
+    def _render_in_background(self):
+        try:
+            self.render()
+        except Exception as error:  # re-raised on access from the caller's thread
+            self._error = error
+
+    def _frame_duration(self) -> int:
+        duration = self.plan['frame_duration_ms'] if self.plan is not None else 50
+        return duration * 2 if self.motion_blur else duration
+
+    def _create_generator(self, size: Optional[int] = None, label_scale: float = 1.0):
+        """The shared generator if it fits, else a new one (label_scale raises pixel minimums)"""
+        if (self._generator is not None and size in (None, self._generator.size) and label_scale == 1.0
+                and self._generator.easing_power == self.easing_power
+                and self._generator.motion_blur == self.motion_blur):
+            return self._generator
+
+        from .wheel_generator import WheelGenerator, shared_generator
+
+        fast_tier = self.plan is not None and self.plan['quality_tier'] == 'fast'
+        customized = (fast_tier and not self.large_mode) or label_scale != 1.0
+        if not customized:
+            # Plain configurations share the process-wide generator and its caches
+            return shared_generator(size or self.size, self.colors, self.font_size, self.animation_speed,
+                                    self._large_mode_option, self.easing_power, self.motion_blur)
+        generator = WheelGenerator(
+            size=size or self.size,
+            colors=self.colors,
+            font_size=self.font_size,
+            animation_speed=self.animation_speed,
+            large_mode=self.large_mode or fast_tier,
+            easing_power=self.easing_power,
+            motion_blur=self.motion_blur
+        )
+        if fast_tier and not self.large_mode:
+            generator.highlight_frames = 0  # rotated disk only, no large-wheel highlight
+        generator.min_font_px = math.ceil(generator.min_font_px * label_scale)
+        generator.min_label_px = math.ceil(generator.min_label_px * label_scale)
+        return generator
+
+    def _render_gif(self) -> bytes:
+        duration = self._frame_duration()
+        if self.max_bytes is not None:
+            from .output_size import render_to_size
+
+            data, report = render_to_size(self._create_generator, self.size, self.segments, self.start_rotation,
+                                          self.max_bytes, self.info['frames_generated'], duration,
+                                          self.angle_table)
+            self.info['size_target'] = report
+            self.info['frames_generated'] = report['frames']
+            return data
+
+        generator = self._create_generator()
+        buffer = io.BytesIO()
+        self.info['frames_generated'] = generator.create_gif(self.segments, self.start_rotation, buffer,
+                                                             weights=self.weights,
+                                                             num_frames=self.info['frames_generated'],
+                                                             duration=duration,
+                                                             processes=self.processes)
+        self.info['pipeline'] = generator.last_pipeline_stats
+        return buffer.getvalue()
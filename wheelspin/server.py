@@ -0,0 +1,135 @@
+"""
+Server - Stream spins over HTTP while they render
+
+    GET /spin?labels=Alice,Bob,Charlie&size=400&rotation=42
+
+responds with the GIF using chunked transfer encoding: the header and
+global palette go out after the first frame renders, then every frame as
+it is encoded (see progressive.iter_gif). The winner is known before any
+rendering and is sent in the X-Wheelspin-Winner (URL-quoted) and
+X-Wheelspin-Winner-Index headers. The first frame is encoded before the
+status line goes out, so a render that fails outright is still an error
+response; a failure later in the stream closes the connection without the
+final chunk, so the client sees a truncated transfer. warmup() runs before
+the server accepts requests.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import chain
+from typing import Iterable
+from urllib.parse import parse_qs, quote, urlparse
+
+from .geometry import MIN_IMAGE_SIZE
+from .wheelspin_lib import spin_wheel
+
+MAX_SIZE = 2000  # largest image size a request may ask for
+
+
+def _parse_spin(query: str) -> dict:
+    """spin_wheel() arguments from a query string; raises ValueError for bad input"""
+    params = parse_qs(query)
+    labels = params.get('label', [])
+    for value in params.get('labels', []):
+        labels += [label.strip() for label in value.split(',') if label.strip()]
+    if not labels:
+        raise ValueError("No labels given")
+
+    size = int(params.get('size', ['500'])[0])
+    if not MIN_IMAGE_SIZE <= size <= MAX_SIZE:
+        raise ValueError(f"size must be between {MIN_IMAGE_SIZE} and {MAX_SIZE}")
+    rotation = params.get('rotation')
+    weights = params.get('weights')
+    frame_cap = params.get('frame_cap')
+    return {
+        'segments': labels,
+        'size': size,
+        'start_rotation': float(rotation[0]) if rotation else None,
+        'weights': [float(weight) for weight in weights[0].split(',')] if weights else None,
+        'frame_policy': params.get('frame_policy', ['linear'])[0],
+        'frame_cap': int(frame_cap[0]) if frame_cap else None
+    }
+
+
+class SpinRequestHandler(BaseHTTPRequestHandler):
+    """Handles GET /spin by streaming the animation as it renders"""
+
+    protocol_version = 'HTTP/1.1'  # chunked transfer encoding needs 1.1
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != '/spin':
+            self._send_error(404, "Not found")
+            return
+        try:
+            result = spin_wheel(**_parse_spin(url.query))
+            chunks = result.iter_gif()
+            first = next(chunks)  # header and first frame, before committing to a 200
+        except ValueError as error:
+            self._send_error(400, str(error))
+            return
+        except Exception as error:
+            self.log_error("Render failed: %r", error)
+            self._send_error(500, "Render failed")
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/gif')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('Cache-Control', 'no-store')
+        self.send_header('X-Wheelspin-Winner', quote(result.winner))
+        self.send_header('X-Wheelspin-Winner-Index', str(result.winner_index))
+        self.end_headers()
+        self._write_chunks(chain([first], chunks))
+
+    def _write_chunks(self, chunks: Iterable[bytes]):
+        try:
+            for chunk in chunks:
+                self.wfile.write(b'%X\r\n%s\r\n' % (len(chunk), chunk))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True  # the client went away
+            return
+        except Exception as error:
+            # Too late for an error status: end the connection without the last
+            # chunk so the client sees an incomplete transfer, not a valid GIF
+            self.log_error("Render failed mid-stream: %r", error)
+            self.close_connection = True
+            return
+        self.wfile.write(b'0\r\n\r\n')
+        self.wfile.flush()
+
+    def _send_error(self, status: int, message: str):
+        body = (message + '\n').encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # quiet by default, like the library
+
+    def log_error(self, format, *args):
+        super().log_message(format, *args)  # failures still go to stderr
+
+
+def create_server(host: str = '127.0.0.1', port: int = 8000, sizes: Iterable[int] = (500,),
+                  warm: bool = True) -> ThreadingHTTPServer:
+    """Warm up for the given image sizes and return a server ready for serve_forever()"""
+    if warm:
+        from .warmup import warmup
+
+        warmup(sizes=sizes, calibrate=False)
+    return ThreadingHTTPServer((host, port), SpinRequestHandler)
+
+
+def serve(host: str = '127.0.0.1', port: int = 8000, sizes: Iterable[int] = (500,), warm: bool = True):
+    """Serve spins until interrupted (after warming up, unless warm is False)"""
+    server = create_server(host, port, sizes, warm)
+    print(f"Serving spins on http://{host}:{server.server_address[1]}/spin")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,121 @@
+"""
+WheelSession - Repeated spins of a changing wheel with shared caches
+"""
+
+import random
+from typing import List, Optional
+
+from .result import SpinResult
+
+
+class WheelSession:
+    """
+    A wheel that is spun repeatedly while segments are added or removed.
+
+    Every round renders with the same WheelGenerator, so fonts, text metrics,
+    label sprites and color distributions survive between rounds. When the
+    segments change only the layout decisions that depend on the whole wheel
+    (inner/outer placement, color distribution) are recomputed; every label
+    that was already on the wheel is reused from the caches.
+
+    Example:
+        >>> session = WheelSession(['Alice', 'Bob', 'Charlie', 'Diana'])
+        >>> rounds = session.tournament()        # eliminate until one remains
+        >>> for number, result in enumerate(rounds, 1):
+        ...     result.save(f'round_{number}.gif')
+        >>> len(session.segments)
+        1
+    """
+
+    def __init__(self, segments: List[str], size: int = 500, colors: Optional[List[str]] = None,
+                 font_size: int = 11, animation_speed: float = 1.0,
+                 weights: Optional[List[float]] = None, large_mode: Optional[bool] = None):
+        if not segments:
+            raise ValueError("Segments list cannot be empty")
+        if weights is not None and len(weights) != len(segments):
+            raise ValueError("Weights must have one entry per segment")
+
+        self.segments = list(segments)
+        self.weights = list(weights) if weights is not None else None
+        self.size = size
+        self.colors = colors or ['#eeb312', '#d61126', '#346ae9', '#019b26', '#9b59b6', '#e67e22']
+        self.font_size = font_size
+        self.animation_speed = animation_speed
+        self.large_mode = large_mode
+        self.rounds: List[SpinResult] = []
+        self._generator = None
+
+    def __repr__(self) -> str:
+        return f"WheelSession({len(self.segments)} segments, {len(self.rounds)} rounds)"
+
+    @property
+    def generator(self):
+        """The WheelGenerator shared by every round (created on first use)"""
+        if self._generator is None:
+            from .wheel_generator import WheelGenerator
+
+            self._generator = WheelGenerator(
+                size=self.size,
+                colors=self.colors,
+                font_size=self.font_size,
+                animation_speed=self.animation_speed,
+                large_mode=self.large_mode
+            )
+        return self._generator
+
+    def add(self, segment: str, weight: Optional[float] = None):
+        """Add a segment; the weight defaults to 1 on weighted wheels"""
+        if weight is not None and self.weights is None:
+            self.weights = [1.0] * len(self.segments)
+        if self.weights is not None:
+            self.weights.append(1.0 if weight is None else weight)
+        self.segments.append(segment)
+
+    def remove(self, segment: str):
+        """Remove the first occurrence of a segment (ValueError if missing)"""
+        self._remove_index(self.segments.index(segment))
+
+    def spin(self, start_rotation: Optional[float] = None) -> SpinResult:
+        """Spin the wheel as it is now and record the round"""
+        if not self.segments:
+            raise ValueError("Segments list cannot be empty")
+
+        if start_rotation is None:
+            start_rotation = random.uniform(0, 360)
+
+        result = SpinResult(
+            self.segments,
+            start_rotation,
+            size=self.size,
+            colors=self.colors,
+            font_size=self.font_size,
+            animation_speed=self.animation_speed,
+            large_mode=self.large_mode,
+            weights=self.weights,
+            generator=self.generator
+        )
+        self.rounds.append(result)
+        return result
+
+    def eliminate(self, start_rotation: Optional[float] = None) -> SpinResult:
+        """Spin, then remove the winning segment from the wheel"""
+        result = self.spin(start_rotation)
+        self._remove_index(result.winner_index)
+        return result
+
+    def tournament(self) -> List[SpinResult]:
+        """
+        Eliminate winners until one segment remains.
+
+        Returns one SpinResult per round; each renders its animation lazily
+        through the shared generator.
+        """
+        results = []
+        while len(self.segments) > 1:
+            results.append(self.eliminate())
+        return results
+
+    def _remove_index(self, index: int):
+        del self.segments[index]
+        if self.weights is not None:
+            del self.weights[index]
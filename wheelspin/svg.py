@@ -0,0 +1,129 @@
+"""
+SVG - The wheel as vector shapes with a CSS spin animation
+
+Slices, labels, hub and pointer are written as SVG elements using the same
+colors, truncation, font sizes and label positions as the raster frames.
+The spin is a single CSS rotation: cubic-bezier(1/3, 1, 2/3, 1) is exactly
+the cubic ease-out 1 - (1 - t)^3 used by spin_rotation(), so the wheel
+stops on the same winner as the GIF. Spins retimed to another ease-out
+power (see geometry.plan_frames) use a sampled CSS linear() curve instead.
+"""
+
+import math
+from typing import List, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+from .geometry import EASING_POWER, pointer_geometry
+
+# CSS timing function equal to the cubic ease-out of spin_rotation()
+CUBIC_EASE_OUT = 'cubic-bezier(0.3333, 1, 0.6667, 1)'
+
+# Points sampled along an ease-out curve that no cubic-bezier() matches
+EASING_SAMPLES = 32
+
+FONT_FAMILY = 'DejaVu Sans, Arial, Helvetica, sans-serif'
+
+
+def _number(value: float) -> str:
+    return f"{value:.2f}".rstrip('0').rstrip('.')
+
+
+def _attribute(value) -> str:
+    """An attribute value escaped and quoted, so quotes in user-supplied colors cannot end it"""
+    return quoteattr(str(value))
+
+
+def _timing_function(easing_power: float) -> str:
+    """CSS timing function of spin_rotation()'s ease-out with the given power"""
+    if easing_power == EASING_POWER:
+        return CUBIC_EASE_OUT
+    points = (1 - (1 - i / EASING_SAMPLES) ** easing_power for i in range(EASING_SAMPLES + 1))
+    return f"linear({', '.join(f'{point:.4f}' for point in points)})"
+
+
+def _slice_path(center: float, radius: float, start_angle: float, end_angle: float) -> str:
+    """Pie slice from start_angle to end_angle (degrees, clockwise from 3 o'clock)"""
+    start = math.radians(start_angle)
+    end = math.radians(end_angle)
+    large_arc = 1 if end_angle - start_angle > 180 else 0
+    return (f"M{_number(center)} {_number(center)}"
+            f"L{_number(center + radius * math.cos(start))} {_number(center + radius * math.sin(start))}"
+            f"A{_number(radius)} {_number(radius)} 0 {large_arc} 1 "
+            f"{_number(center + radius * math.cos(end))} {_number(center + radius * math.sin(end))}Z")
+
+
+def build_svg(generator, labels: List[str], start_rotation: float,
+              angle_table: Optional[List[float]] = None, duration_ms: Optional[int] = None) -> str:
+    """
+    The wheel as an SVG document.
+
+    With duration_ms the disk spins two turns from start_rotation and stops
+    at the winning pose; without it the wheel is drawn at rest at
+    start_rotation (the same pose, since two turns change nothing). The
+    generator supplies colors, fonts and label layout.
+    """
+    size = generator.size
+    geometry = pointer_geometry(size)
+    center = geometry['center']
+    radius = geometry['radius']
+    segments = len(labels)
+    angle_per_segment = generator.circle_degrees / segments
+
+    slice_angles = None
+    if angle_table is not None:
+        slice_angles = [angle_table[i + 1] - angle_table[i] for i in range(segments)]
+    position = generator.calculate_consistent_text_position(radius, angle_per_segment, labels, slice_angles)
+    colors = generator.distribute_colors(segments)
+    # Like large-wheel frames, skip labels on slices too narrow to read
+    min_label_angle = math.degrees(generator.min_label_px / (radius * 0.85))
+
+    shapes = []
+    for i in range(segments):
+        start_angle = angle_table[i] if angle_table is not None else i * angle_per_segment
+        end_angle = angle_table[i + 1] if angle_table is not None else (i + 1) * angle_per_segment
+        if segments == 1:
+            shapes.append(f'<circle cx="{center}" cy="{center}" r="{radius}" fill={_attribute(colors[i])}/>')
+        else:
+            shapes.append(f'<path d="{_slice_path(center, radius, start_angle, end_angle)}" fill={_attribute(colors[i])}/>')
+
+    texts = []
+    for i in range(segments):
+        start_angle = angle_table[i] if angle_table is not None else i * angle_per_segment
+        end_angle = angle_table[i + 1] if angle_table is not None else (i + 1) * angle_per_segment
+        if generator.is_large_wheel(segments) and end_angle - start_angle < min_label_angle:
+            continue
+        display_label = generator.fit_label(labels[i], position['font_size'], radius)
+        # Same radius as draw_segment_label: text ends at 95% of the radius
+        text_width = generator.get_text_dimensions(display_label, position['font_size'])['width']
+        text_radius = max(radius * 0.95 - text_width * 0.5, radius * 0.3)
+        texts.append(f'<text x="{_number(center + text_radius)}" y="{center}" '
+                     f'transform="rotate({_number((start_angle + end_angle) / 2)} {center} {center})">'
+                     f'{escape(display_label)}</text>')
+
+    pointer = ' '.join(f"{_number(x)},{_number(y)}" for x, y in geometry['pointer'])
+
+    if duration_ms is not None:
+        style = (f'@keyframes wheelspin-spin{{from{{transform:rotate({_number(start_rotation)}deg)}}'
+                 f'to{{transform:rotate({_number(start_rotation + 2 * generator.circle_degrees)}deg)}}}}'
+                 f'.wheelspin-disk{{transform-origin:{center}px {center}px;'
+                 f'animation:wheelspin-spin {duration_ms}ms {_timing_function(generator.easing_power)} forwards}}')
+        disk_attributes = 'class="wheelspin-disk"'
+    else:
+        style = ''
+        disk_attributes = f'transform="rotate({_number(start_rotation)} {center} {center})"'
+
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 {size} {size}">'
+        + (f'<style>{style}</style>' if style else '')
+        + f'<g {disk_attributes}>'
+        + ''.join(shapes)
+        + f'<g font-family="{FONT_FAMILY}" font-size="{position["font_size"]}" fill="black" '
+          f'text-anchor="middle" dominant-baseline="central">'
+        + ''.join(texts)
+        + '</g></g>'
+        + f'<circle cx="{center}" cy="{center}" r="{_number(geometry["hub_radius"])}" '
+          f'fill={_attribute(generator.hub_color)}/>'
+        + f'<polygon points="{pointer}" fill={_attribute(generator.pointer_color)} '
+          f'stroke={_attribute(generator.pointer_outline)} stroke-width="1"/>'
+        + '</svg>'
+    )
@@ -0,0 +1,71 @@
+"""
+Timeline - Describe a spin as data so clients can animate it themselves
+
+A browser can rotate one image far more cheaply than the server can encode
+an animated GIF. The timeline lists the rotation of every frame from the
+same easing curve create_gif() uses, so client and server agree on where
+the wheel stops and who wins.
+"""
+
+import json
+from typing import List, Optional, Sequence
+
+from .geometry import CIRCLE_DEGREES, EASING_POWER, calculate_winner, pointer_geometry, spin_rotation
+
+TIMELINE_VERSION = 1
+
+
+def build_timeline(labels: Sequence[str], start_rotation: float, num_frames: int, size: int,
+                   duration: int = 50, angle_table: Optional[List[float]] = None,
+                   colors: Optional[List[str]] = None, highlight_frames: int = 0,
+                   easing_power: float = EASING_POWER) -> dict:
+    """
+    The spin as a JSON-serializable dict.
+
+    Rotations are in degrees clockwise, applied to the disk image about its
+    center; the pointer reads the slice at 0 degrees (3 o'clock). Slice
+    boundaries are included unless the wheel is large enough to skip them.
+    """
+    winner_index, winner = calculate_winner(start_rotation, labels, CIRCLE_DEGREES, angle_table)
+    geometry = pointer_geometry(size)
+
+    timeline = {
+        'version': TIMELINE_VERSION,
+        'size': size,
+        'center': [geometry['center'], geometry['center']],
+        'radius': geometry['radius'],
+        'hub_radius': geometry['hub_radius'],
+        'pointer': {'angle': 0, 'points': [list(point) for point in geometry['pointer']]},
+        'start_rotation': start_rotation,
+        'final_rotation': start_rotation + 2 * CIRCLE_DEGREES,
+        'easing': 'cubic-out' if easing_power == EASING_POWER else 'power-out',
+        'easing_power': easing_power,  # rotation = start + (1 - (1 - i / frames) ** power) * 720
+        'frames': num_frames,
+        'frame_duration_ms': duration,
+        'total_duration_ms': duration * num_frames,
+        'rotations': [round(spin_rotation(i, num_frames, start_rotation, CIRCLE_DEGREES, easing_power), 4)
+                      for i in range(num_frames)],
+        'highlight_from_frame': max(0, num_frames - highlight_frames) if highlight_frames else None,
+        'winner': {'index': winner_index, 'name': winner},
+        'segments': len(labels)
+    }
+
+    if colors is not None:
+        angle_per_segment = CIRCLE_DEGREES / len(labels)
+        timeline['slices'] = [
+            {
+                'label': labels[i],
+                'start_angle': angle_table[i] if angle_table is not None else i * angle_per_segment,
+                'end_angle': angle_table[i + 1] if angle_table is not None else (i + 1) * angle_per_segment,
+                'color': colors[i]
+            }
+            for i in range(len(labels))
+        ]
+    return timeline
+
+
+def write_timeline(timeline: dict, output_file: str) -> str:
+    """Write a timeline as JSON and return the path"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(timeline, f, ensure_ascii=False, indent=1)
+    return output_file
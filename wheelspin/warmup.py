@@ -0,0 +1,93 @@
+"""
+Warm-up - Load process-wide state before the first request needs it
+
+The first render in a fresh process probes the filesystem for fonts,
+loads the glyph coverage index for font fallback, initializes Pillow's
+image plugins and encoders, measures every label and
+(for render budgets) calibrates the cost model. warmup() does all of that
+up front. Called in a parent process before it forks its workers, the
+loaded state is shared with every worker copy-on-write; the locks around
+it are recreated in each child, so forking while another thread renders
+is safe.
+"""
+
+import gc
+import io
+import time
+from typing import Iterable, List, Optional
+
+# Labels measured when no sample is given; they warm the drawing and
+# encoding paths even if the real labels differ
+DEFAULT_SAMPLE_LABELS = ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve', 'Frank', 'Grace', 'Heidi']
+
+
+def warmup(sizes: Iterable[int] = (500,), fonts: Optional[Iterable[int]] = None,
+           sample_labels: Optional[List[str]] = None, colors: Optional[List[str]] = None,
+           font_size: int = 11, calibrate: bool = True, freeze: bool = False) -> dict:
+    """
+    Preload fonts, Pillow plugins, generators and the render cost model.
+
+    Args:
+        sizes: Image sizes to prepare a shared generator for
+        fonts: Font sizes in pixels to open (default: every size labels can use)
+        sample_labels: Labels to measure and render ahead of time
+        colors: Segment colors of the generators to prepare (spin_wheel's default if None)
+        font_size: Base font size of the generators to prepare
+        calibrate: Also calibrate the render budget cost model
+        freeze: Move everything loaded so far out of the garbage collector's
+            reach (gc.freeze), so forked workers do not copy those pages
+            when the collector runs. Use it in the parent just before forking.
+
+    Returns:
+        dict: What was loaded and how long it took
+    """
+    from PIL import Image
+
+    from .encoding import encode_gif, encode_still
+    from .wheel_generator import shared_generator
+
+    start = time.perf_counter()
+    Image.init()
+
+    labels = list(sample_labels or DEFAULT_SAMPLE_LABELS)
+    if colors is None:
+        colors = ['#eeb312', '#d61126', '#346ae9', '#019b26', '#9b59b6', '#e67e22']
+
+    sizes = list(sizes)
+    fonts = list(fonts) if fonts is not None else None  # reused for every size
+    font_sizes = []
+    glyph_index = None
+    for size in sizes:
+        # The same generator spin_wheel(), SpinResult and render_still() use with these settings
+        generator = shared_generator(size, colors, font_size)
+        font_sizes = fonts if fonts is not None else list(range(generator.min_font_px,
+                                                                  generator.max_font_px + 1))
+        for font_px in font_sizes:
+            generator._load_font(font_px)
+        glyph_index = generator._glyph_index(generator._load_font())
+
+        # Render both ends of a spin so metrics, sprites and layout are cached,
+        # then encode them once in every output format
+        frames = [generator.create_animation_frame(labels, 0.0, i, 2) for i in range(2)]
+        encode_gif(frames, io.BytesIO())
+        encode_still(frames[-1], format='PNG')
+        encode_still(frames[-1], format='WEBP')
+
+    cost_model = None
+    if calibrate:
+        from .budget import get_cost_model
+        cost_model = get_cost_model()
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+    return {
+        'sizes': sizes,
+        'font_sizes': font_sizes,
+        'fallback_fonts': len(glyph_index.fonts) - 1 if glyph_index is not None else 0,
+        'sample_labels': len(labels),
+        'cost_model': repr(cost_model) if cost_model is not None else None,
+        'frozen': freeze,
+        'seconds': time.perf_counter() - start
+    }
@@ -4,31 +4,139 @@ WheelGenerator - Core implementation for spinning wheel generation
 
 from PIL import Image, ImageDraw, ImageFont
 import math
+import os
 import platform
-from typing import List, Tuple, Optional
+import queue
+import threading
+import weakref
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .encoding import downscale, encode_gif, encode_still
+from .entrants import EntrantIndex
+from .layers import layer_cache
+from .geometry import (EASING_POWER, build_angle_table, calculate_frames, calculate_winner, is_large_wheel,
+                       pointer_geometry, spin_rotation)
+from .fonts import covers_ascii, glyph_index
+from .frame_ring import render_gif_processes
+from .pipeline import QUEUE_SIZE, run_pipeline
+
+# Segment colors when none are given
+DEFAULT_COLORS = ('#eeb312', '#d61126', '#346ae9', '#019b26')
+
+# Fonts are opened once per process and shared by every generator (see
+# warmup()). FreeType faces are not safe to use from several threads at
+# once, so every use of a font is serialized on this lock.
+_fonts = {}  # font size -> primary font, (path, size) -> fallback font
+_font_lock = threading.RLock()
+_glyph_indexes = {}  # primary font -> its glyph coverage index
+_ascii_fonts = {}  # primary font -> whether it has every printable ASCII character
+_generators = weakref.WeakSet()  # every live generator, so a forked child can reset their locks
+
+
+def _reset_locks():
+    """A forked child starts with one thread; a lock held elsewhere at fork time would never be released"""
+    global _font_lock
+    _font_lock = threading.RLock()
+    for generator in list(_generators):
+        generator._lock = threading.RLock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_locks)
 
 
 class WheelGenerator:
-    """Core wheel generation class"""
+    """
+    Core wheel generation class.
     
-    def __init__(self, size: int = 500, colors: List[str] = None, font_size: int = 11, animation_speed: float = 1.0):
+    One generator can be shared by many threads: cache lookups are plain dict
+    reads, cache updates happen under a per-generator lock and font use on
+    cache misses under a process-wide one, so concurrent renders match serial
+    ones byte for byte.
+    """
+    
+    def __init__(self, size: int = 500, colors: List[str] = None, font_size: int = 11, animation_speed: float = 1.0,
+                 large_mode: Optional[bool] = None, easing_power: float = EASING_POWER,
+                 motion_blur: bool = False):
         self.size = size
-        self.colors = colors or ['#eeb312', '#d61126', '#346ae9', '#019b26']
+        self.colors = colors or list(DEFAULT_COLORS)
         self.font_size = font_size
         self.animation_speed = animation_speed
+        self.large_mode = large_mode  # None = automatic based on segment count
+        self.easing_power = easing_power  # Ease-out power of the spin (see geometry.plan_frames)
+        self.motion_blur = motion_blur  # Blur fast animation frames along their rotation
+        self.blur_samples = 3  # Motion blur: sub-rotations averaged per blurred frame
+        self.blur_min_px = 10  # Motion blur: frames moving less than this at the rim stay sharp
         self.transparent_color = (255, 0, 255, 0)
         self.circle_degrees = 360
-        self._font_cache = {}  # Cache loaded fonts
+        self.min_band_px = 6  # Large wheels: narrower slices are merged into bands of this width
+        self.min_label_px = 12  # Large wheels: narrower slices are drawn without labels
+        self.highlight_frames = 15  # Large wheels: final frames that highlight the entrant at the pointer
+        self.min_font_px = 8  # Smallest label font size; raised when frames are downscaled afterwards
+        self.max_font_px = 28  # Largest label font size
+        self.font_fallback = True  # Draw characters the primary font lacks in a fallback font (see fonts)
+        self.hub_color = 'white'  # Fill of the center hub
+        self.pointer_color = 'white'  # Fill of the triangle pointer
+        self.pointer_outline = 'black'  # Outline of the triangle pointer
+        # Wheels with at least this many segments rotate their cached slice and label
+        # layers per frame; below it drawing the slices and labels is cheaper
+        self.compose_min_segments = 32
+        self._font_cache = _fonts  # Loaded fonts, shared by all generators in the process
+        # Content-keyed caches reused across frames and across spins of the same generator
+        self.cache_limit = 4096  # Max entries per cache; oldest entries are dropped first
+        self._metrics_cache = {}  # (text, font size) -> text dimensions
+        self._sprite_cache = {}  # (text, font size) -> unrotated label image
+        self._layout_cache = {}  # (radius, angle, labels, slice angles) -> text position
+        self._color_cache = {}  # segment count -> color distribution
+        self._advance_cache = {}  # (character, font size) -> advance width
+        self._fit_cache = {}  # (text, font size, max width) -> text cut to fit
+        self._large_disk = None  # (wheel key, disk, mask) of the last large wheel
+        self._blur_disk = None  # (wheel key, disk, mask) of the last motion-blurred wheel
+        self._frame_disk = None  # (slice layer, label layer, premultiplied disk) of the last composed wheel
+        self._overlay_patch = None  # (style key, cropped overlay layer, position)
+        self._mask = None  # circle the disk fills, for this size
+        self._lock = threading.RLock()  # Guards cache updates
+        self._local = threading.local()  # Per-thread results, such as the last pipeline stats
+        _generators.add(self)
+    
+    def __getstate__(self):
+        """Settings only; caches, locks and fonts are rebuilt where the generator is unpickled"""
+        return {name: value for name, value in self.__dict__.items() if not name.startswith('_')}
+    
+    def __setstate__(self, state):
+        self.__init__()
+        self.__dict__.update(state)
+    
+    @property
+    def last_pipeline_stats(self) -> Optional[dict]:
+        """Stage utilization of this thread's last pipelined create_gif()"""
+        return getattr(self._local, 'pipeline_stats', None)
+    
+    def _remember(self, cache: dict, key, value):
+        """Store value in one of the content caches, dropping the oldest entry when full"""
+        with self._lock:
+            if len(cache) >= self.cache_limit:
+                del cache[next(iter(cache))]
+            cache[key] = value
+        return value
     
     def distribute_colors(self, num_segments: int) -> List[str]:
         """
         Basic color distribution - simply cycles through available colors.
         """
+        cached = self._color_cache.get(num_segments)
+        if cached is not None:
+            return cached
+        
         colors = [self.colors[i % len(self.colors)] for i in range(num_segments)]
         if colors[0] == colors[-1] and num_segments > 1:
             # Swap last color with second to last to avoid adjacent duplicates
             colors[-1], colors[-2] = colors[-2], colors[-1]
-        return colors
+        return self._remember(self._color_cache, num_segments, colors)
 
     def truncate_text(self, text: str, max_length: int = 17) -> str:
         """
@@ -38,6 +146,52 @@ class WheelGenerator:
             return text
         return text[:max_length-3].rstrip() + "..."
 
+    def _glyph_advance(self, char: str, font_size: int) -> float:
+        """Advance width of one character in the font that draws it (cached)"""
+        cache_key = (char, font_size)
+        cached = self._advance_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        font = self._load_font(font_size)
+        runs = self._text_runs(char, font_size, font)
+        if runs is not None:
+            font = runs[0][1]
+        with _font_lock:
+            advance = font.getlength(char)
+        return self._remember(self._advance_cache, cache_key, advance)
+    
+    def truncate_to_width(self, text: str, max_width: float, font_size: int) -> str:
+        """
+        Cut text with an ellipsis so it is at most max_width pixels wide.
+        
+        The cut is found by binary search over prefix sums of cached glyph
+        advances, then checked once against the real measurement (kerning
+        and bearings can make the text slightly wider than its advances).
+        """
+        cache_key = (text, font_size, max_width)
+        cached = self._fit_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        widths = list(accumulate(self._glyph_advance(char, font_size) for char in text))
+        if not widths or (widths[-1] <= max_width and
+                          self.get_text_dimensions(text, font_size)['width'] <= max_width):
+            return self._remember(self._fit_cache, cache_key, text)
+        
+        ellipsis = "..."
+        budget = max_width - sum(self._glyph_advance(char, font_size) for char in ellipsis)
+        length = bisect_right(widths, budget)
+        fitted = text[:length].rstrip() + ellipsis
+        while length > 0 and self.get_text_dimensions(fitted, font_size)['width'] > max_width:
+            length -= 1
+            fitted = text[:length].rstrip() + ellipsis
+        return self._remember(self._fit_cache, cache_key, fitted)
+    
+    def fit_label(self, text: str, font_size: int, radius: float) -> str:
+        """A label as drawn on the wheel: cut to the radial space between hub and rim"""
+        return self.truncate_to_width(text, self.calculate_segment_space(radius, 0)['label_length'], font_size)
+    
     def _load_font(self, size: int = None, debug: bool = False) -> ImageFont.FreeTypeFont:
         """
         Load a font that supports Unicode characters.
@@ -48,9 +202,15 @@ class WheelGenerator:
             size = self.font_size
         
         cache_key = size
-        if cache_key in self._font_cache:
-            return self._font_cache[cache_key]
+        font = self._font_cache.get(cache_key)
+        if font is not None:
+            return font
         
+        with _font_lock:
+            return self._font_cache.get(cache_key) or self._open_font(size, debug)
+    
+    def _open_font(self, size: int, debug: bool = False) -> ImageFont.FreeTypeFont:
+        """Find and open the first available font (called under the lock)"""
         # List of fonts to try, in order of preference
         # These fonts have good Unicode support (emoji will render as black/white symbols)
         font_options = [
@@ -101,9 +261,72 @@ class WheelGenerator:
         if debug:
             print(f"🎨 Final font: {font_used}")
         
-        self._font_cache[cache_key] = font
+        self._font_cache[size] = font
         return font
     
+    def _load_fallback_font(self, path: str, size: int) -> ImageFont.FreeTypeFont:
+        """Open a fallback font from the glyph index (cached process-wide)"""
+        font = self._font_cache.get((path, size))
+        if font is not None:
+            return font
+        with _font_lock:
+            font = self._font_cache.get((path, size))
+            if font is None:
+                font = self._font_cache[(path, size)] = ImageFont.truetype(path, size)
+            return font
+    
+    @staticmethod
+    def _font_source(font):
+        """The path of a font, or its bytes for fonts loaded from memory like Pillow's default"""
+        source = getattr(font, 'path', None)
+        if not isinstance(source, str):
+            source = getattr(font, 'font_bytes', None)
+        return source
+    
+    def _glyph_index(self, font):
+        """The coverage index for a primary font, or None if its character map cannot be read"""
+        index = _glyph_indexes.get(font)
+        if index is None and font not in _glyph_indexes:
+            source = self._font_source(font)
+            index = _glyph_indexes[font] = glyph_index(source) if source else None
+        return index
+    
+    def _covers_ascii(self, font) -> bool:
+        """Whether a primary font has every printable ASCII character, without building its index"""
+        covered = _ascii_fonts.get(font)
+        if covered is None:
+            index = _glyph_indexes.get(font)
+            source = self._font_source(font)
+            covered = _ascii_fonts[font] = (index.primary_ascii if index is not None
+                                            else bool(source) and covers_ascii(source))
+        return covered
+    
+    def _text_runs(self, text: str, size: int, font) -> Optional[List[Tuple[str, ImageFont.FreeTypeFont]]]:
+        """Text split into runs with the font for each, or None if the primary font has every glyph"""
+        if not self.font_fallback or (text.isascii() and self._covers_ascii(font)):
+            return None  # plain labels never build the fallback index
+        index = self._glyph_index(font)
+        if index is None:
+            return None
+        runs = index.split_runs(text)
+        if len(runs) == 1 and runs[0][1] == 0:
+            return None
+        return [(run, font if i == 0 else self._load_fallback_font(index.fonts[i], size)) for run, i in runs]
+    
+    def _draw_text(self, draw, xy: Tuple[float, float], text: str, text_dims: dict, anchor: str = 'mm'):
+        """Draw text measured by get_text_dimensions() at xy, anchored 'mm' or 'rm'"""
+        runs = text_dims.get('runs')
+        with _font_lock:
+            if not runs:
+                draw.text(xy, text, fill='black', font=text_dims['font'], anchor=anchor)
+                return
+            # Runs share one baseline; place their combined box like the anchor would
+            left, top, right, bottom = text_dims['bbox']
+            x = xy[0] - ((left + right) / 2 if anchor[0] == 'm' else right)
+            y = xy[1] - (top + bottom) / 2
+            for run, font, offset in runs:
+                draw.text((x + offset, y), run, fill='black', font=font, anchor='ls')
+    
     def calculate_dynamic_font_size(self, radius: int, angle_per_segment: float, 
                                    position_name: str, num_segments: int) -> int:
         """Calculate dynamic font size based on available space and positioning"""
@@ -133,26 +356,65 @@ class WheelGenerator:
         dynamic_size = int(base_size * size_factor * position_factor * segment_factor)
         
         # Ensure reasonable bounds
-        return max(8, min(dynamic_size, 28))
+        return max(self.min_font_px, min(dynamic_size, max(self.max_font_px, self.min_font_px)))
     
     def get_text_dimensions(self, text: str, font_size: int = None) -> dict:
-        """Get the dimensions of text when rendered"""
-        temp_img = Image.new('RGBA', (1, 1), (0, 0, 0, 0))
-        temp_draw = ImageDraw.Draw(temp_img)
-        
+        """Get the dimensions of text when rendered (cached per text and size)"""
         # Use provided font size or default
         size_to_use = font_size if font_size is not None else self.font_size
+        cache_key = (text, size_to_use)
+        cached = self._metrics_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        temp_img = Image.new('RGBA', (1, 1), (0, 0, 0, 0))
+        temp_draw = ImageDraw.Draw(temp_img)
         font = self._load_font(size_to_use)
+        runs = self._text_runs(text, size_to_use, font)
         
-        bbox = temp_draw.textbbox((0, 0), text, font=font)
+        placed = None
+        with _font_lock:
+            if runs is None:
+                bbox = temp_draw.textbbox((0, 0), text, font=font)
+            else:
+                # One font per run, laid out along a shared baseline
+                placed, boxes, x = [], [], 0.0
+                for run, run_font in runs:
+                    placed.append((run, run_font, x))
+                    boxes.append(temp_draw.textbbox((x, 0), run, font=run_font, anchor='ls'))
+                    x += run_font.getlength(run)
+                bbox = (math.floor(min(box[0] for box in boxes)), math.floor(min(box[1] for box in boxes)),
+                        math.ceil(max(box[2] for box in boxes)), math.ceil(max(box[3] for box in boxes)))
         width = bbox[2] - bbox[0]
         height = bbox[3] - bbox[1]
         
-        return {
+        return self._remember(self._metrics_cache, cache_key, {
             'width': width,
             'height': height,
-            'font': font
-        }
+            'font': font,
+            'runs': placed,  # (text, font, x offset) per run, None when one font draws it all
+            'bbox': bbox
+        })
+    
+    def get_label_sprite(self, text: str, font_size: int) -> Image.Image:
+        """Render a label once, unrotated, centered on a transparent canvas (cached)"""
+        cache_key = (text, font_size)
+        cached = self._sprite_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        text_dims = self.get_text_dimensions(text, font_size)
+        # Square canvas with room for ascenders/descenders around the 'mm' anchor
+        temp_size = max(text_dims['width'], text_dims['height'] * 2) + 8
+        temp_size += temp_size % 2
+        temp_img = Image.new('RGBA', (temp_size, temp_size), (0, 0, 0, 0))
+        temp_draw = ImageDraw.Draw(temp_img)
+        
+        # Draw text at center of temp image
+        temp_center = temp_size // 2
+        self._draw_text(temp_draw, (temp_center, temp_center), text, text_dims)
+        
+        return self._remember(self._sprite_cache, cache_key, temp_img)
     
     def calculate_segment_space(self, radius: int, angle_per_segment: float, text_radius_ratio: float = 0.65) -> dict:
         """Calculate available space for text in a wheel segment"""
@@ -160,27 +422,43 @@ class WheelGenerator:
         angle_rad = math.radians(angle_per_segment)
         arc_length = text_radius * angle_rad
         radial_space = radius * 0.3
+        # Labels run along the radius and end at 95% of it; past the hub is the most they can use
+        label_length = radius * 0.95 - radius * 0.15
         
         return {
             'arc_length': arc_length,
             'radial_space': radial_space,
+            'label_length': label_length,
             'text_radius': text_radius,
             'angle_degrees': angle_per_segment
         }
     
-    def calculate_consistent_text_position(self, radius: int, angle_per_segment: float, labels: List[str]) -> dict:
-        """Calculate consistent text position for all labels with dynamic font sizing"""
+    def calculate_consistent_text_position(self, radius: int, angle_per_segment: float, labels: List[str],
+                                           slice_angles: Optional[List[float]] = None) -> dict:
+        """
+        Calculate consistent text position for all labels with dynamic font sizing.
+        For weighted wheels slice_angles gives each label's own slice angle.
+        Results are cached, so unchanged wheels skip re-measuring every frame.
+        """
+        cache_key = (radius, angle_per_segment, tuple(labels),
+                     tuple(slice_angles) if slice_angles is not None else None,
+                     self.min_font_px, self.max_font_px)
+        cached = self._layout_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         needs_outer = False
         num_segments = len(labels)
         
         # Try inner positioning first with dynamic font size
         inner_font_size = self.calculate_dynamic_font_size(radius, angle_per_segment, 'inner', num_segments)
         
-        for label in labels:
+        for i, label in enumerate(labels):
             # Use truncated text for space calculations
-            display_label = self.truncate_text(label, 17)
+            display_label = self.fit_label(label, inner_font_size, radius)
             text_dims = self.get_text_dimensions(display_label, inner_font_size)
-            inner_space = self.calculate_segment_space(radius, angle_per_segment, 0.65)
+            label_angle = slice_angles[i] if slice_angles is not None else angle_per_segment
+            inner_space = self.calculate_segment_space(radius, label_angle, 0.65)
             
             text_fits_inner = (text_dims['width'] <= inner_space['arc_length'] * 0.8 and
                               text_dims['height'] <= inner_space['radial_space'])
@@ -197,26 +475,31 @@ class WheelGenerator:
         
         space = self.calculate_segment_space(radius, angle_per_segment, position_ratio)
         
-        return {
+        return self._remember(self._layout_cache, cache_key, {
             'text_radius_ratio': position_ratio,
             'text_radius': space['text_radius'],
             'position': position_name,
             'font_size': final_font_size,
             'consistent': True
-        }
+        })
     
     def draw_segment_label(self, draw, center: int, radius: int, angle: float, label: str, 
                           angle_per_segment: float, consistent_position: dict):
         """Draw a text label on a wheel segment using calculated position (inner/outer)"""
+        rotated_text, paste_x, paste_y = self.place_segment_label(center, radius, angle, label, consistent_position)
+        draw._image.paste(rotated_text, (paste_x, paste_y), rotated_text)
+    
+    def place_segment_label(self, center: int, radius: int, angle: float, label: str,
+                            consistent_position: dict) -> Tuple[Image.Image, int, int]:
+        """The rotated sprite of a segment label and the top-left corner it goes at"""
         angle_rad = math.radians(angle)
         
-        # Truncate text to 17 characters max with ellipsis
-        display_label = self.truncate_text(label, 17)
-        
         # Use dynamic font size from consistent position calculation
         dynamic_font_size = consistent_position['font_size']
+        
+        # Cut the label with an ellipsis where it would run into the hub
+        display_label = self.fit_label(label, dynamic_font_size, radius)
         text_dims = self.get_text_dimensions(display_label, dynamic_font_size)
-        font = text_dims['font']
         text_width = text_dims['width']
         
         # Calculate positioning so text ends at wheel boundary (with margin)
@@ -236,56 +519,100 @@ class WheelGenerator:
         text_x = center + text_radius * math.cos(angle_rad)
         text_y = center + text_radius * math.sin(angle_rad)
         
-        # Create temporary image for rotated text with adequate size
-        temp_size = max(300, int(text_width * 1.5), 100)
-        temp_img = Image.new('RGBA', (temp_size, temp_size), (0, 0, 0, 0))
-        temp_draw = ImageDraw.Draw(temp_img)
-        
-        # Draw text at center of temp image
-        temp_center = temp_size // 2
-        temp_draw.text((temp_center, temp_center), display_label, fill='black', font=font, anchor='mm')
-        
+        # Rotate the cached, unrotated label sprite into place
+        sprite = self.get_label_sprite(display_label, dynamic_font_size)
         rotation_angle = -angle
-        rotated_text = temp_img.rotate(rotation_angle, expand=True)
+        rotated_text = sprite.rotate(rotation_angle, expand=True)
         
         paste_x = int(text_x - rotated_text.width / 2)
         paste_y = int(text_y - rotated_text.height / 2)
-        
-        draw._image.paste(rotated_text, (paste_x, paste_y), rotated_text)
+        return rotated_text, paste_x, paste_y
     
     def draw_triangle_pointer(self, draw, center: int, radius: int):
         """Draw a triangle pointer at the 3 o'clock position"""
-        leftest_point = center + radius * 0.95
-        rightest_point = self.size * 0.99
-        triangle_y = center
-        size = self.size - leftest_point
-        
-        triangle_points = [
-            (leftest_point, triangle_y),
-            (rightest_point, triangle_y - size / 2),
-            (rightest_point, triangle_y + size / 2)
-        ]
+        triangle_points = pointer_geometry(self.size)['pointer']
         
-        draw.polygon(triangle_points, fill='white', outline='black', width=1)
+        draw.polygon(triangle_points, fill=self.pointer_color, outline=self.pointer_outline, width=1)
     
-    def create_wheel_frame(self, segments: int, rotation_angle: float, labels: List[str]) -> Image.Image:
-        """Create a single frame of the wheel"""
+    def draw_overlay(self, draw, center: int, radius: int):
+        """Draw the static parts on top of the disk: center hub and pointer"""
+        draw.ellipse([center-radius/10, center-radius/10, center+radius/10, center+radius/10], 
+                     fill=self.hub_color)
+        
+        self.draw_triangle_pointer(draw, center, radius)
+    
+    def create_wheel_frame(self, segments: int, rotation_angle: float, labels: List[str],
+                           highlight: bool = False, angle_table: Optional[List[float]] = None) -> Image.Image:
+        """
+        Create a single frame of the wheel.
+        angle_table (from build_angle_table) gives weighted slice boundaries;
+        highlight only applies to large wheels.
+        """
+        if self.is_large_wheel(segments):
+            return self.create_large_wheel_frame(rotation_angle, labels, highlight, angle_table)
+        if segments >= self.compose_min_segments and len(labels) == segments:
+            return self.create_composed_frame(rotation_angle, labels, angle_table)
+        
         img = Image.new('RGBA', (self.size, self.size), self.transparent_color)
-        draw = ImageDraw.Draw(img)
+        self.draw_disk(ImageDraw.Draw(img), segments, rotation_angle, labels, angle_table)
         
+        # Center circle and triangle pointer from the cached overlay layer
+        self.paste_overlay(img)
+        
+        return img
+    
+    def create_composed_frame(self, rotation_angle: float, labels: List[str],
+                              angle_table: Optional[List[float]] = None) -> Image.Image:
+        """
+        A frame composed from the cached layers: the slice and label layers
+        rotated together, then the overlay. Rotating is cheaper than drawing
+        once a wheel has many labels (see compose_min_segments).
+        """
+        slices = self.slice_layer(len(labels), angle_table)
+        label_layer = self.label_layer(labels, angle_table)
+        cached = self._frame_disk
+        if cached is not None and cached[0] is slices and cached[1] is label_layer:
+            disk = cached[2]
+        else:
+            # Premultiplied, so rotating does not bleed the transparent color into the rim
+            disk = Image.alpha_composite(slices, label_layer).convert('RGBa')
+            self._frame_disk = (slices, label_layer, disk)
+        
+        center = self.size // 2
+        img = Image.new('RGBA', (self.size, self.size), self.transparent_color)
+        rotated = disk.rotate(-rotation_angle, resample=Image.BILINEAR, center=(center, center))
+        img.paste(rotated.convert('RGBA'), (0, 0), self._disk_mask())
+        self.paste_overlay(img)
+        return img
+    
+    def paste_overlay(self, img: Image.Image):
+        """Composite the cached hub and pointer onto a frame (same pixels as draw_overlay())"""
+        key = (self.size, self.hub_color, self.pointer_color, self.pointer_outline)
+        cached = self._overlay_patch
+        if cached is None or cached[0] != key:
+            # Only the part with the hub and pointer, so each frame composites a small patch
+            layer = self.overlay_layer()
+            box = layer.getbbox()
+            cached = self._overlay_patch = (key, layer.crop(box), box[:2])
+        img.alpha_composite(cached[1], cached[2])
+    
+    def draw_disk(self, draw, segments: int, rotation_angle: float, labels: List[str],
+                  angle_table: Optional[List[float]] = None):
+        """Draw the slices and labels of the wheel at the given rotation"""
         center = self.size // 2
         radius = self.size // 2 - 20
         angle_per_segment = self.circle_degrees / segments
         
-        consistent_position = self.calculate_consistent_text_position(radius, angle_per_segment, labels)
+        slice_angles = None
+        if angle_table is not None:
+            slice_angles = [angle_table[i + 1] - angle_table[i] for i in range(segments)]
+        consistent_position = self.calculate_consistent_text_position(radius, angle_per_segment, labels,
+                                                                      slice_angles)
         
         # Get intelligent color distribution
         segment_colors = self.distribute_colors(segments)
         
-        for i in range(segments):
-            start_angle = rotation_angle + (i * angle_per_segment)
-            end_angle = start_angle + angle_per_segment
-            
+        for i, (start_angle, end_angle) in enumerate(self._slice_spans(segments, rotation_angle, angle_table)):
             # Draw pie slice with intelligently distributed color
             draw.pieslice(
                 [center - radius, center - radius, center + radius, center + radius],
@@ -295,59 +622,534 @@ class WheelGenerator:
             
             # Add text label
             if i < len(labels):
-                mid_angle = start_angle + (angle_per_segment / 2)
+                mid_angle = (start_angle + end_angle) / 2
                 self.draw_segment_label(draw, center, radius, mid_angle, labels[i], 
-                                      angle_per_segment, consistent_position)
+                                      end_angle - start_angle, consistent_position)
+    
+    def _slice_spans(self, segments: int, rotation_angle: float = 0,
+                     angle_table: Optional[List[float]] = None) -> Iterator[Tuple[float, float]]:
+        """Start and end angle of each slice at the given rotation"""
+        angle_per_segment = self.circle_degrees / segments
+        for i in range(segments):
+            if angle_table is not None:
+                yield rotation_angle + angle_table[i], rotation_angle + angle_table[i + 1]
+            else:
+                start_angle = rotation_angle + (i * angle_per_segment)
+                yield start_angle, start_angle + angle_per_segment
+    
+    def _disk_mask(self) -> Image.Image:
+        """The circle the disk fills, for pasting rotated disks (shared; do not draw on it)"""
+        mask = self._mask
+        if mask is None or mask.size != (self.size, self.size):
+            center = self.size // 2
+            radius = self.size // 2 - 20
+            mask = Image.new('L', (self.size, self.size), 0)
+            ImageDraw.Draw(mask).ellipse(
+                [center - radius, center - radius, center + radius, center + radius], fill=255)
+            self._mask = mask
+        return mask
+    
+    def _label_key(self, labels: List[str], *layout) -> tuple:
+        """Labels plus every setting their layout depends on, except colors and overlay style"""
+        return (self.size, self.font_size, self.min_font_px, self.max_font_px, self.font_fallback,
+                tuple(labels)) + layout
+    
+    def slice_layer(self, segments: int, angle_table: Optional[List[float]] = None) -> Image.Image:
+        """
+        The colored slices at rotation 0 on a transparent background, cached
+        by size, slice colors and slice boundaries (see layers). Shared; do
+        not draw on it.
+        """
+        colors = tuple(self.distribute_colors(segments))
+        key = ('disk', self.size, colors, tuple(angle_table) if angle_table is not None else segments)
+        return layer_cache.get('slices', key, lambda: self._draw_slices(segments, colors, angle_table))
+    
+    def _draw_slices(self, segments: int, colors: Tuple[str, ...],
+                     angle_table: Optional[List[float]] = None) -> Image.Image:
+        center = self.size // 2
+        radius = self.size // 2 - 20
+        layer = Image.new('RGBA', (self.size, self.size), self.transparent_color)
+        draw = ImageDraw.Draw(layer)
+        for i, (start_angle, end_angle) in enumerate(self._slice_spans(segments, 0, angle_table)):
+            draw.pieslice(
+                [center - radius, center - radius, center + radius, center + radius],
+                start_angle, end_angle,
+                fill=colors[i]
+            )
+        return layer
+    
+    def label_layer(self, labels: List[str], angle_table: Optional[List[float]] = None) -> Image.Image:
+        """
+        The labels at rotation 0 on a transparent background, cached by the
+        labels, slice boundaries and font settings, so it survives a change
+        of colors (see layers). Shared; do not draw on it.
+        """
+        key = self._label_key(labels, tuple(angle_table) if angle_table is not None else None)
+        return layer_cache.get('labels', key, lambda: self._draw_labels(labels, angle_table))
+    
+    def _draw_labels(self, labels: List[str], angle_table: Optional[List[float]] = None) -> Image.Image:
+        center = self.size // 2
+        radius = self.size // 2 - 20
+        segments = len(labels)
         
-        # Draw center circle
-        draw.ellipse([center-radius/10, center-radius/10, center+radius/10, center+radius/10], 
-                     fill='white')
+        slice_angles = None
+        if angle_table is not None:
+            slice_angles = [angle_table[i + 1] - angle_table[i] for i in range(segments)]
+        consistent_position = self.calculate_consistent_text_position(radius, self.circle_degrees / segments,
+                                                                      labels, slice_angles)
         
-        # Draw triangle pointer
-        self.draw_triangle_pointer(draw, center, radius)
+        layer = Image.new('RGBA', (self.size, self.size), (0, 0, 0, 0))
+        for i, (start_angle, end_angle) in enumerate(self._slice_spans(segments, 0, angle_table)):
+            self._composite_label(layer, center, radius, (start_angle + end_angle) / 2, labels[i],
+                                  consistent_position)
+        return layer
+    
+    def _composite_label(self, layer: Image.Image, center: int, radius: int, angle: float, label: str,
+                         consistent_position: dict):
+        """Draw a label onto a transparent layer, keeping the sprite's own alpha"""
+        sprite, x, y = self.place_segment_label(center, radius, angle, label, consistent_position)
+        # alpha_composite() takes no negative offsets, so crop the sprite instead
+        layer.alpha_composite(sprite, (max(x, 0), max(y, 0)), (max(-x, 0), max(-y, 0)))
+    
+    def overlay_layer(self) -> Image.Image:
+        """
+        The hub and pointer on a transparent background, cached by size and
+        their style (hub_color, pointer_color, pointer_outline). Shared; do
+        not draw on it.
+        """
+        key = (self.size, self.hub_color, self.pointer_color, self.pointer_outline)
+        return layer_cache.get('overlay', key, self._draw_overlay_layer)
+    
+    def _draw_overlay_layer(self) -> Image.Image:
+        layer = Image.new('RGBA', (self.size, self.size), self.transparent_color)
+        self.draw_overlay(ImageDraw.Draw(layer), self.size // 2, self.size // 2 - 20)
+        return layer
+    
+    def render_layers(self, labels: List[str],
+                      angle_table: Optional[List[float]] = None) -> Tuple[Image.Image, Image.Image]:
+        """
+        The two layers every frame is composed of, on transparent backgrounds:
+        the disk with its labels at rotation 0, and the static hub and pointer.
+        Rotating the disk about the center and drawing the overlay on top
+        reproduces a frame (without the large-wheel highlight).
+        
+        The disk is composed from the cached slice and label layers, so a
+        wheel that differs only in colors, labels or overlay style redraws
+        only that layer.
+        """
+        if self.is_large_wheel(len(labels)):
+            disk = Image.new('RGBA', (self.size, self.size), self.transparent_color)
+            large_disk, mask = self.render_large_disk(labels, angle_table)
+            disk.paste(large_disk, (0, 0), mask)
+        else:
+            disk = Image.alpha_composite(self.slice_layer(len(labels), angle_table),
+                                         self.label_layer(labels, angle_table))
+        return disk, self.overlay_layer().copy()
+    
+    def create_animation_frame(self, labels: List[str], start_rotation: float, index: int, num_frames: int,
+                               angle_table: Optional[List[float]] = None) -> Image.Image:
+        """
+        Create frame `index` of a spin animation of num_frames frames.
+        With motion_blur, frames that move at least blur_min_px at the rim
+        before the next frame are blurred over that movement.
+        """
+        rotation = spin_rotation(index, num_frames, start_rotation, self.circle_degrees, self.easing_power)
+        highlight = index >= num_frames - self.highlight_frames
+        if self.motion_blur and not (highlight and self.is_large_wheel(len(labels))):
+            sweep = spin_rotation(index + 1, num_frames, start_rotation, self.circle_degrees,
+                                  self.easing_power) - rotation
+            if math.radians(sweep) * (self.size // 2 - 20) >= self.blur_min_px:
+                return self.create_blurred_frame(rotation, sweep, labels, angle_table)
+        return self.create_wheel_frame(len(labels), rotation, labels, highlight=highlight,
+                                       angle_table=angle_table)
+    
+    def create_blurred_frame(self, rotation_angle: float, sweep: float, labels: List[str],
+                             angle_table: Optional[List[float]] = None) -> Image.Image:
+        """
+        A frame with the disk blurred over sweep degrees centered on rotation_angle:
+        the mean of blur_samples rotations of the cached disk, with a sharp overlay.
+        """
+        disk, mask = self.render_blur_disk(labels, angle_table)
+        
+        center = self.size // 2
+        
+        # Running mean: sample k is blended in with weight 1 / (k + 1). Averaging
+        # smooths the edges, so the much cheaper nearest-neighbor rotation suffices.
+        blurred = None
+        for k in range(self.blur_samples):
+            angle = rotation_angle + sweep * ((k + 0.5) / self.blur_samples - 0.5)
+            rotated = disk.rotate(-angle, resample=Image.NEAREST, center=(center, center))
+            blurred = rotated if blurred is None else Image.blend(blurred, rotated, 1 / (k + 1))
+        
+        img = Image.new('RGBA', (self.size, self.size), self.transparent_color)
+        img.paste(blurred, (0, 0), mask)
+        self.paste_overlay(img)
+        return img
+    
+    def render_blur_disk(self, labels: List[str],
+                         angle_table: Optional[List[float]] = None) -> Tuple[Image.Image, Image.Image]:
+        """
+        The RGB disk at rotation 0 and its circular mask, drawn once per
+        wheel for motion blur (large wheels reuse render_large_disk()).
+        """
+        if self.is_large_wheel(len(labels)):
+            return self.render_large_disk(labels, angle_table)
+        
+        key = self._wheel_key(labels, angle_table)
+        cached = self._blur_disk
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        
+        with self._lock:
+            cached = self._blur_disk
+            if cached is not None and cached[0] == key:
+                return cached[1], cached[2]
+            
+            disk = Image.new('RGB', (self.size, self.size), 'white')
+            slices = self.slice_layer(len(labels), angle_table)
+            disk.paste(slices, (0, 0), slices)
+            label_layer = self.label_layer(labels, angle_table)
+            disk.paste(label_layer, (0, 0), label_layer)
+            mask = self._disk_mask()
+            
+            self._blur_disk = (key, disk, mask)
+            return disk, mask
+    
+    @staticmethod
+    def _wheel_key(labels: List[str], angle_table: Optional[List[float]]) -> tuple:
+        """
+        What a whole-wheel disk is drawn from, by content: labels edited in
+        place or an equal angle table rebuilt for every call still match. An
+        EntrantIndex is immutable and supplies its key without decoding names.
+        """
+        labels_key = labels.content_key if isinstance(labels, EntrantIndex) else tuple(labels)
+        return labels_key, None if angle_table is None else tuple(angle_table)
+    
+    def is_large_wheel(self, segments: int) -> bool:
+        """Whether a wheel with this many segments uses large-wheel mode"""
+        return is_large_wheel(segments, self.large_mode)
+    
+    def render_large_disk(self, labels: List[str],
+                          angle_table: Optional[List[float]] = None) -> Tuple[Image.Image, Image.Image]:
+        """
+        Render the disk of a large wheel once, at rotation 0.
+        
+        Slices narrower than min_band_px at the rim are merged into colored
+        bands and only slices at least min_label_px wide get a label, so the
+        cost is bounded by the image size rather than the number of entrants.
+        Returns the RGB disk and the circular mask used to paste it.
+        """
+        key = self._wheel_key(labels, angle_table)
+        cached = self._large_disk
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        
+        with self._lock:
+            # Threads rendering the same wheel wait for a single disk render
+            cached = self._large_disk
+            if cached is not None and cached[0] == key:
+                return cached[1], cached[2]
+            disk, mask = self._draw_large_disk(labels, angle_table)
+            self._large_disk = (key, disk, mask)
+            return disk, mask
+    
+    def _draw_large_disk(self, labels: List[str],
+                         angle_table: Optional[List[float]] = None) -> Tuple[Image.Image, Image.Image]:
+        """Draw a large-wheel disk from its cached band and label layers (called under the lock)"""
+        radius = self.size // 2 - 20
+        segments = len(labels)
+        angle_per_segment = self.circle_degrees / segments
+        min_band_angle = math.degrees(self.min_band_px / radius)
+        
+        # Band boundaries as (start slice, end slice) index pairs
+        if angle_table is None:
+            group = max(1, math.ceil(min_band_angle / angle_per_segment))
+            bands = [(start, min(segments, start + group)) for start in range(0, segments, group)]
+        else:
+            # Walk the weighted table, jumping to the first boundary past the minimum width
+            bands = []
+            start = 0
+            while start < segments:
+                end = bisect_left(angle_table, angle_table[start] + min_band_angle, start + 1, segments)
+                bands.append((start, end))
+                start = end
+        band_colors = self.distribute_colors(len(bands))
+        
+        def slice_angle(index):
+            return angle_table[index] if angle_table is not None else index * angle_per_segment
+        
+        band_spans = tuple((slice_angle(start), slice_angle(end)) for start, end in bands)
+        slices = layer_cache.get('slices', ('bands', self.size, tuple(band_colors), band_spans),
+                                 lambda: self._draw_bands(band_spans, band_colors))
+        
+        # Label the slices that are wide enough to read (all of them, or none, when unweighted)
+        label_angle = math.degrees(self.min_label_px / (radius * 0.85))
+        labeled = [start for start, end in bands
+                   if end - start == 1 and slice_angle(end) - slice_angle(start) >= label_angle]
+        disk = slices.copy()
+        if labeled:
+            label_spans = tuple((slice_angle(i), slice_angle(i + 1)) for i in labeled)
+            labeled_names = [labels[i] for i in labeled]
+            label_layer = layer_cache.get(
+                'labels', self._label_key(labeled_names, 'bands', angle_per_segment, label_spans),
+                lambda: self._draw_band_labels(labeled_names, label_spans, angle_per_segment))
+            disk.paste(label_layer, (0, 0), label_layer)
+        
+        return disk, self._disk_mask()
+    
+    def _draw_bands(self, band_spans: Tuple[Tuple[float, float], ...], band_colors: List[str]) -> Image.Image:
+        """The colored bands of a large wheel, on white"""
+        center = self.size // 2
+        # Bands overshoot the rim so rotating the disk never samples the background
+        outer = self.size // 2 - 20 + 3
+        disk = Image.new('RGB', (self.size, self.size), 'white')
+        draw = ImageDraw.Draw(disk)
+        for band, (start_angle, end_angle) in enumerate(band_spans):
+            draw.pieslice(
+                [center - outer, center - outer, center + outer, center + outer],
+                start_angle, end_angle,
+                fill=band_colors[band]
+            )
+        return disk
+    
+    def _draw_band_labels(self, labels: List[str], spans: Tuple[Tuple[float, float], ...],
+                          angle_per_segment: float) -> Image.Image:
+        """The labels of the slices of a large wheel that are wide enough to read"""
+        center = self.size // 2
+        radius = self.size // 2 - 20
+        consistent_position = self.calculate_consistent_text_position(
+            radius, angle_per_segment, labels, [end - start for start, end in spans])
+        layer = Image.new('RGBA', (self.size, self.size), (0, 0, 0, 0))
+        for label, (start_angle, end_angle) in zip(labels, spans):
+            self._composite_label(layer, center, radius, (start_angle + end_angle) / 2, label,
+                                  consistent_position)
+        return layer
+    
+    def create_large_wheel_frame(self, rotation_angle: float, labels: List[str], highlight: bool = False,
+                                 angle_table: Optional[List[float]] = None) -> Image.Image:
+        """Create a large-wheel frame by rotating the cached disk"""
+        disk, mask = self.render_large_disk(labels, angle_table)
+        
+        center = self.size // 2
+        radius = self.size // 2 - 20
+        
+        img = Image.new('RGBA', (self.size, self.size), self.transparent_color)
+        rotated = disk.rotate(-rotation_angle, resample=Image.BICUBIC, center=(center, center))
+        img.paste(rotated, (0, 0), mask)
+        
+        if highlight:
+            self.draw_pointer_highlight(ImageDraw.Draw(img), center, radius, rotation_angle, labels, angle_table)
+        
+        self.paste_overlay(img)
         
         return img
     
+    def draw_pointer_highlight(self, draw, center: int, radius: int, rotation_angle: float,
+                               labels: List[str], angle_table: Optional[List[float]] = None):
+        """Outline the entrant under the pointer and show its name next to the pointer"""
+        index, name = calculate_winner(rotation_angle, labels, self.circle_degrees, angle_table)
+        
+        # Widen sub-pixel slices so the outline stays visible
+        if angle_table is not None:
+            start_angle = rotation_angle + angle_table[index]
+            end_angle = rotation_angle + angle_table[index + 1]
+        else:
+            angle_per_segment = self.circle_degrees / len(labels)
+            start_angle = rotation_angle + index * angle_per_segment
+            end_angle = start_angle + angle_per_segment
+        min_angle = math.degrees(2 * self.min_band_px / radius)
+        if end_angle - start_angle < min_angle:
+            mid_angle = (start_angle + end_angle) / 2
+            start_angle, end_angle = mid_angle - min_angle / 2, mid_angle + min_angle / 2
+        draw.pieslice(
+            [center - radius, center - radius, center + radius, center + radius],
+            start_angle, end_angle,
+            outline='white', width=2
+        )
+        
+        font_size = max(self.font_size, self.size // 30)
+        display_label = self.fit_label(name, font_size, radius)
+        text_dims = self.get_text_dimensions(display_label, font_size)
+        padding = 4
+        right = center + radius * 0.9
+        box = [
+            right - text_dims['width'] - 2 * padding, center - text_dims['height'] / 2 - padding,
+            right, center + text_dims['height'] / 2 + padding
+        ]
+        draw.rounded_rectangle(box, radius=padding, fill='white', outline='black')
+        self._draw_text(draw, (right - padding, center), display_label, text_dims, anchor='rm')
+    
     def calculate_frames(self, segments: int) -> int:
         """Calculate number of animation frames based on segment count"""
-        base_frames = 60
-        base_segments = 8
-        frame_multiplier = max(1.0, segments / base_segments * 0.27)
-        return int(base_frames * frame_multiplier * self.animation_speed)
+        return calculate_frames(segments, self.animation_speed, self.is_large_wheel(segments))
     
-    def create_gif(self, labels: List[str], start_rotation: float, output_file: str) -> int:
-        """Create the animated GIF"""
+    def create_gif(self, labels: List[str], start_rotation: float, output_file: str,
+                   weights: Optional[List[float]] = None, num_frames: Optional[int] = None,
+                   duration: int = 50, palette_size: Optional[int] = None, delta: bool = False,
+                   processes: Optional[int] = None) -> int:
+        """
+        Create the animated GIF (slice sizes proportional to weights, if given).
+        num_frames overrides calculate_frames(); duration is per frame in ms.
+        palette_size and delta are passed on to encoding.encode_gif().
+        
+        With the default encoding, rendering and palette conversion overlap
+        with feeding the GIF writer (see pipeline.run_pipeline); its
+        per-stage utilization is kept in last_pipeline_stats. With processes,
+        frames are rendered by that many worker processes instead and passed
+        back through shared memory (see frame_ring.render_gif_processes); a
+        script doing so must run under ``if __name__ == '__main__':``, since
+        the workers re-import the main module.
+        """
         segments = len(labels)
-        num_frames = self.calculate_frames(segments)
+        if num_frames is None:
+            num_frames = self.calculate_frames(segments)
+        angle_table = self.build_angle_table(labels, weights)
         frames = []
         
         print(f"Generating {num_frames} frames for {segments} segments...")
         
+        if processes and palette_size is None and not delta:
+            self._local.pipeline_stats = render_gif_processes(self, labels, start_rotation, num_frames, output_file,
+                                                              duration, angle_table, processes)
+            return num_frames
+        
+        if palette_size is None and not delta:
+            self._local.pipeline_stats = run_pipeline(
+                lambda i: self.create_animation_frame(labels, start_rotation, i, num_frames, angle_table),
+                num_frames, output_file, duration)
+            return num_frames
+        
+        # Palette reduction and delta frames need every frame up front
         for i in range(num_frames):
-            progress = i / num_frames
-            eased_progress = 1 - (1 - progress) ** 3  # Cubic easing
-            rotation = start_rotation + (eased_progress * 2 * self.circle_degrees)
-            
-            frame = self.create_wheel_frame(segments, rotation, labels)
+            frame = self.create_animation_frame(labels, start_rotation, i, num_frames, angle_table)
             frames.append(frame)
         
         # Save animated GIF
-        frames[0].save(
-            output_file,
-            format='GIF',
-            append_images=frames[1:],
-            save_all=True,
-            duration=50,
-            transparency=0,
-            disposal=2
-        )
+        encode_gif(frames, output_file, duration=duration, palette_size=palette_size, delta=delta)
         
         return num_frames
     
-    def calculate_winner(self, start_rotation: float, segments: List[str]) -> Tuple[int, str]:
-        """Calculate which segment wins"""
-        angle_per_segment = self.circle_degrees / len(segments)
-        relative_angle = (0 - start_rotation) % self.circle_degrees  # Pointer at 0 degrees
-        segment_index = int(relative_angle / angle_per_segment) % len(segments)
+    def create_gifs(self, labels: List[str], start_rotation: float, outputs: Dict[int, str],
+                    weights: Optional[List[float]] = None, num_frames: Optional[int] = None,
+                    duration: int = 50) -> int:
+        """
+        Create the same animated GIF at several sizes from one render.
+
+        outputs maps image size to output file; the largest size must equal
+        self.size. Each frame is rendered once, then downscaled once per
+        smaller size with the shared filter (each from the next larger size)
+        and handed to one encoder thread per output while the next frame renders.
+        Each encoder buffers at most pipeline.QUEUE_SIZE frames; rendering
+        waits for one that falls behind, and stops if one fails.
+        """
+        sizes = sorted(outputs, reverse=True)
+        if sizes[0] != self.size:
+            raise ValueError("Largest output size must equal the render size")
+        
+        segments = len(labels)
+        if num_frames is None:
+            num_frames = self.calculate_frames(segments)
+        angle_table = self.build_angle_table(labels, weights)
+        # Bounded, so rendering waits for an encoder that falls behind instead of buffering frames
+        queues = {size: queue.Queue(maxsize=QUEUE_SIZE) for size in sizes}
+        
+        print(f"Generating {num_frames} frames for {segments} segments at {len(sizes)} sizes...")
+        
+        with ThreadPoolExecutor(max_workers=len(sizes)) as pool:
+            encoders = {size: pool.submit(encode_gif, iter(queues[size].get, None), outputs[size], duration)
+                        for size in sizes}
+            
+            def put(size, item) -> bool:
+                """Queue item for one encoder, waiting while it is full; False once that encoder has stopped"""
+                while not encoders[size].done():
+                    try:
+                        queues[size].put(item, timeout=0.05)
+                        return True
+                    except queue.Full:
+                        continue
+                return False
+            
+            try:
+                for i in range(num_frames):
+                    frame = self.create_animation_frame(labels, start_rotation, i, num_frames, angle_table)
+                    stopped = False
+                    for size in sizes:
+                        # Each size is reduced from the next larger one, which is cheaper
+                        frame = downscale(frame, size)
+                        stopped = not put(size, frame) or stopped
+                    if stopped:
+                        break  # an encoder failed; result() below raises its error
+            finally:
+                for size in sizes:
+                    put(size, None)  # end of frames, also on error
+            for size in sizes:
+                encoders[size].result()
         
-        return segment_index, segments[segment_index]
\ No newline at end of file
+        return num_frames
+    
+    def create_sprite_sheet(self, labels: List[str], start_rotation: float, num_frames: int,
+                            angle_table: Optional[List[float]] = None,
+                            frame_size: Optional[int] = None) -> Tuple[Image.Image, int]:
+        """
+        Render every frame of a spin into one image, left to right and top to
+        bottom in a near-square grid. Frames are downscaled to frame_size if
+        given. Returns the sheet and its number of columns.
+        """
+        frame_size = frame_size or self.size
+        columns = math.ceil(math.sqrt(num_frames))
+        rows = math.ceil(num_frames / columns)
+        sheet = Image.new('RGBA', (columns * frame_size, rows * frame_size), self.transparent_color)
+        for i in range(num_frames):
+            frame = self.create_animation_frame(labels, start_rotation, i, num_frames, angle_table)
+            sheet.paste(downscale(frame, frame_size), ((i % columns) * frame_size, (i // columns) * frame_size))
+        return sheet, columns
+    
+    def render_still(self, labels: List[str], rotation: float, output_file: Optional[str] = None,
+                     format: str = 'PNG', weights: Optional[List[float]] = None,
+                     highlight: bool = False) -> bytes:
+        """
+        Render one frame at the given rotation as a PNG or WebP image.
+        Writes output_file if given and returns the encoded bytes.
+        """
+        frame = self.create_wheel_frame(len(labels), rotation, labels, highlight=highlight,
+                                        angle_table=self.build_angle_table(labels, weights))
+        return encode_still(frame, output_file, format)
+    
+    def build_angle_table(self, labels: List[str], weights: Optional[List[float]] = None) -> Optional[List[float]]:
+        """Cumulative slice boundaries for weighted labels (None for equal slices)"""
+        if weights is None:
+            return None
+        return build_angle_table(weights, self.circle_degrees, len(labels))
+    
+    def calculate_winner(self, start_rotation: float, segments: List[str],
+                         weights: Optional[List[float]] = None) -> Tuple[int, str]:
+        """Calculate which segment wins"""
+        angle_table = self.build_angle_table(segments, weights)
+        return calculate_winner(start_rotation, segments, self.circle_degrees, angle_table)
+
+
+def shared_generator(size: int = 500, colors: Optional[Sequence[str]] = None, font_size: int = 11,
+                     animation_speed: float = 1.0, large_mode: Optional[bool] = None,
+                     easing_power: float = EASING_POWER, motion_blur: bool = False) -> WheelGenerator:
+    """
+    The process-wide generator for a configuration, so layouts and sprites
+    stay cached between spins and are shared by threads (and, after
+    warmup(), by forked workers). Do not change its attributes.
+    
+    Arguments are normalized first, so positional and keyword calls, lists
+    and tuples, and omitted defaults all find the same generator.
+    """
+    return _shared_generator(int(size), tuple(colors) if colors else DEFAULT_COLORS, int(font_size),
+                             float(animation_speed), None if large_mode is None else bool(large_mode),
+                             float(easing_power), bool(motion_blur))
+
+
+@lru_cache(maxsize=8)
+def _shared_generator(size: int, colors: Tuple[str, ...], font_size: int, animation_speed: float,
+                      large_mode: Optional[bool], easing_power: float, motion_blur: bool) -> WheelGenerator:
+    return WheelGenerator(size=size, colors=list(colors), font_size=font_size, animation_speed=animation_speed,
+                          large_mode=large_mode, easing_power=easing_power, motion_blur=motion_blur)
+
+
+shared_generator.cache_info = _shared_generator.cache_info
+shared_generator.cache_clear = _shared_generator.cache_clear
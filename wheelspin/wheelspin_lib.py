@@ -12,9 +12,14 @@ Example usage:
     print(f"The winner is: {winner}!")
 """
 
-from .wheel_generator import WheelGenerator
 import random
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+from .geometry import LARGE_WHEEL_THRESHOLD, build_angle_table, calculate_winner
+from .result import SpinResult
+
+# Rendering (and therefore Pillow) is imported lazily inside the functions
+# that draw, so winner-only callers never pay for it.
 
 
 def create_spinning_wheel(
@@ -42,12 +47,14 @@ def create_spinning_wheel(
     if not segments:
         raise ValueError("Segments list cannot be empty")
     
-    if len(segments) > 100:
+    if 100 < len(segments) <= LARGE_WHEEL_THRESHOLD:
         print("Warning: Many segments may result in small, hard-to-read text")
     
     # Generate random starting rotation
     start_rotation = random.uniform(0, 360)
     
+    from .wheel_generator import WheelGenerator
+
     # Create the wheel generator
     generator = WheelGenerator(
         size=size, 
@@ -74,7 +81,15 @@ def create_spinning_wheel_advanced(
     start_rotation: Optional[float] = None,
     colors: Optional[List[str]] = None,
     font_size: int = 11,
-    animation_speed: float = 1.0
+    animation_speed: float = 1.0,
+    large_mode: Optional[bool] = None,
+    weights: Optional[List[float]] = None,
+    max_render_time: Optional[float] = None,
+    max_frames: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    frame_policy: str = 'linear',
+    frame_cap: Optional[int] = None,
+    motion_blur: bool = False
 ) -> Tuple[str, dict]:
     """
     Create an animated spinning wheel GIF with advanced customization options.
@@ -87,6 +102,19 @@ def create_spinning_wheel_advanced(
         colors: List of hex colors for segments (cycles if fewer than segments)
         font_size: Font size for text labels (default: 11)
         animation_speed: Speed multiplier (1.0 = normal, 2.0 = twice as fast)
+        large_mode: Render as a large wheel (banded slices, labels only where
+            they fit, highlighted winner); automatic above 500 segments if None
+        weights: Relative slice sizes, one per segment (equal slices if None)
+        max_render_time: Render time budget in seconds; frame count, sampling
+            and quality tier are chosen to fit it (reported in info['budget'])
+        max_frames: Hard cap on the number of frames rendered
+        max_bytes: Maximum GIF file size; palette, frame count and dimensions
+            are reduced as needed (reported in info['size_target'])
+        frame_policy: How the spin length grows with the segment count:
+            'linear' (default), 'log' or 'capped' (reported in info['frame_policy'])
+        frame_cap: Hard maximum on the spin length in frames, for any policy
+        motion_blur: Render half the frames, each shown twice as long, with
+            fast frames blurred along their rotation
     
     Returns:
         Tuple[str, dict]: Winner name and detailed information dictionary
@@ -102,6 +130,154 @@ def create_spinning_wheel_advanced(
         >>> print(f"Winner: {winner}")
         >>> print(f"Started at: {info['start_rotation']:.1f}°")
     """
+    result = spin_wheel(
+        segments,
+        size=size,
+        start_rotation=start_rotation,
+        colors=colors,
+        font_size=font_size,
+        animation_speed=animation_speed,
+        large_mode=large_mode,
+        weights=weights,
+        max_render_time=max_render_time,
+        max_frames=max_frames,
+        max_bytes=max_bytes,
+        frame_policy=frame_policy,
+        frame_cap=frame_cap,
+        motion_blur=motion_blur
+    )
+    
+    # Generate the spinning wheel GIF
+    result.save(output_file)
+    
+    winner_index, winner_name = result.winner_index, result.winner
+    frames_count = result.info['frames_generated']
+    info = dict(result.info, output_file=output_file)
+    
+    print(f"✅ Advanced wheel created: {output_file}")
+    print(f"🎯 Winner: {winner_name} (segment {winner_index + 1}/{len(segments)})")
+    print(f"📊 Animation: {frames_count} frames at {animation_speed}x speed")
+    print(f"🎨 Size: {size}x{size}px")
+    
+    return winner_name, info
+
+
+def create_spinning_wheel_sizes(
+    segments: List[str],
+    outputs: Dict[int, str],
+    start_rotation: Optional[float] = None,
+    colors: Optional[List[str]] = None,
+    font_size: int = 11,
+    animation_speed: float = 1.0,
+    large_mode: Optional[bool] = None,
+    weights: Optional[List[float]] = None,
+    max_frames: Optional[int] = None
+) -> Tuple[str, dict]:
+    """
+    Create the same spinning wheel GIF at several sizes from one render.
+    
+    The wheel is laid out and rendered once at the largest size; every frame
+    is downscaled once per smaller size with the same filter and encoded for
+    all outputs concurrently. Labels are sized so they stay legible in the
+    smallest output.
+    
+    Args:
+        segments: List of segment names/labels
+        outputs: Image size in pixels -> path of the GIF at that size
+        start_rotation: Starting rotation angle in degrees (random if None)
+        colors: List of hex colors for segments (cycles if fewer than segments)
+        font_size: Font size for text labels (default: 11)
+        animation_speed: Speed multiplier (1.0 = normal, 2.0 = twice as fast)
+        large_mode: Render as a large wheel; automatic above 500 segments if None
+        weights: Relative slice sizes, one per segment (equal slices if None)
+        max_frames: Hard cap on the number of frames rendered
+    
+    Returns:
+        Tuple[str, dict]: Winner name and information dictionary
+        
+    Example:
+        >>> winner, info = create_spinning_wheel_sizes(
+        ...     ['Alice', 'Bob', 'Charlie'],
+        ...     {120: 'thumb.gif', 300: 'chat.gif', 600: 'full.gif'}
+        ... )
+    """
+    if not outputs:
+        raise ValueError("Outputs cannot be empty")
+    
+    result = spin_wheel(
+        segments,
+        size=max(outputs),
+        start_rotation=start_rotation,
+        colors=colors,
+        font_size=font_size,
+        animation_speed=animation_speed,
+        large_mode=large_mode,
+        weights=weights,
+        max_frames=max_frames
+    )
+    result.save_sizes(outputs)
+    
+    info = dict(result.info, outputs=dict(sorted(outputs.items())))
+    
+    print(f"✅ Wheel created at {len(outputs)} sizes: {', '.join(outputs[s] for s in sorted(outputs))}")
+    print(f"🎯 Winner: {result.winner} (segment {result.winner_index + 1}/{len(segments)})")
+    
+    return result.winner, info
+
+
+def spin_wheel(
+    segments: List[str],
+    size: int = 500,
+    start_rotation: Optional[float] = None,
+    colors: Optional[List[str]] = None,
+    font_size: int = 11,
+    animation_speed: float = 1.0,
+    large_mode: Optional[bool] = None,
+    weights: Optional[List[float]] = None,
+    max_render_time: Optional[float] = None,
+    max_frames: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    processes: Optional[int] = None,
+    frame_policy: str = 'linear',
+    frame_cap: Optional[int] = None,
+    motion_blur: bool = False,
+    background: bool = False
+) -> SpinResult:
+    """
+    Spin a wheel and return the result before the animation is rendered.
+    
+    The winner, its index and the info dictionary are available immediately.
+    The GIF is rendered when result.gif_bytes or result.save() is first used,
+    or right away in a background thread when background=True.
+    
+    Args:
+        segments: List of segment names/labels
+        size: Image size in pixels (default: 500)
+        start_rotation: Starting rotation angle in degrees (random if None)
+        colors: List of hex colors for segments (cycles if fewer than segments)
+        font_size: Font size for text labels (default: 11)
+        animation_speed: Speed multiplier (1.0 = normal, 2.0 = twice as fast)
+        large_mode: Render as a large wheel; automatic above 500 segments if None
+        weights: Relative slice sizes, one per segment (equal slices if None)
+        max_render_time: Render time budget in seconds (see create_spinning_wheel_advanced)
+        max_frames: Hard cap on the number of frames rendered
+        max_bytes: Maximum GIF file size in bytes (see create_spinning_wheel_advanced)
+        processes: Render frames in this many worker processes (shared memory transport).
+            Workers re-import the main module, so a script must make the call
+            under ``if __name__ == '__main__':``
+        frame_policy: 'linear', 'log' or 'capped' spin length (see create_spinning_wheel_advanced)
+        frame_cap: Hard maximum on the spin length in frames
+        motion_blur: Half the frames, fast ones blurred (see create_spinning_wheel_advanced)
+        background: Start rendering in a background thread immediately
+    
+    Returns:
+        SpinResult: Winner and metadata, with the animation rendered on demand
+        
+    Example:
+        >>> result = spin_wheel(['Alice', 'Bob', 'Charlie'], background=True)
+        >>> print(f"The winner is: {result.winner}!")
+        >>> result.save('wheel.gif')  # waits for the background render
+    """
     if not segments:
         raise ValueError("Segments list cannot be empty")
     
@@ -111,37 +287,118 @@ def create_spinning_wheel_advanced(
     if colors is None:
         colors = ['#eeb312', '#d61126', '#346ae9', '#019b26', '#9b59b6', '#e67e22']
     
-    # Create the wheel generator with custom settings
-    generator = WheelGenerator(
+    return SpinResult(
+        segments,
+        start_rotation,
         size=size,
         colors=colors,
         font_size=font_size,
-        animation_speed=animation_speed
+        animation_speed=animation_speed,
+        large_mode=large_mode,
+        weights=weights,
+        max_render_time=max_render_time,
+        max_frames=max_frames,
+        max_bytes=max_bytes,
+        processes=processes,
+        frame_policy=frame_policy,
+        frame_cap=frame_cap,
+        motion_blur=motion_blur,
+        background=background
     )
+
+
+def render_still(
+    labels: List[str],
+    rotation: float,
+    output_file: Optional[str] = None,
+    size: int = 500,
+    colors: Optional[List[str]] = None,
+    font_size: int = 11,
+    format: str = 'PNG',
+    weights: Optional[List[float]] = None,
+    large_mode: Optional[bool] = None
+) -> bytes:
+    """
+    Render the wheel at a single rotation as a PNG or WebP, without an animation.
     
-    # Generate the spinning wheel GIF
-    frames_count = generator.create_gif(segments, start_rotation, output_file)
+    Use it for link previews and notifications. Passing a spin's
+    start_rotation gives the resting pose that decides its winner. Generators
+    are reused between calls with the same settings, so repeat calls only draw
+    and encode a single frame.
     
-    # Calculate winner and detailed info
-    winner_index, winner_name = generator.calculate_winner(start_rotation, segments)
+    Args:
+        labels: List of segment names/labels
+        rotation: Wheel rotation in degrees
+        output_file: Path to write the image to (optional)
+        size: Image size in pixels (default: 500)
+        colors: List of hex colors for segments (cycles if fewer than segments)
+        font_size: Font size for text labels (default: 11)
+        format: 'PNG' or 'WEBP' (default: 'PNG')
+        weights: Relative slice sizes, one per segment (equal slices if None)
+        large_mode: Render as a large wheel; automatic above 500 segments if None
+    
+    Returns:
+        bytes: The encoded image
+        
+    Example:
+        >>> winner, info = pick_winner(['Alice', 'Bob', 'Charlie'])
+        >>> render_still(['Alice', 'Bob', 'Charlie'], info['start_rotation'], 'poster.png')
+    """
+    if not labels:
+        raise ValueError("Segments list cannot be empty")
+    
+    if colors is None:
+        colors = ['#eeb312', '#d61126', '#346ae9', '#019b26', '#9b59b6', '#e67e22']
+    
+    from .wheel_generator import shared_generator
+    
+    generator = shared_generator(size, colors, font_size, large_mode=large_mode)
+    return generator.render_still(labels, rotation, output_file, format, weights=weights)
+
+
+def pick_winner(
+    segments: List[str],
+    start_rotation: Optional[float] = None,
+    weights: Optional[List[float]] = None
+) -> Tuple[str, dict]:
+    """
+    Decide the winner of a spin without rendering anything.
+    
+    This is the lightweight entry point: it never imports Pillow. Passing the
+    returned start_rotation to create_spinning_wheel_advanced() renders an
+    animation that lands on the same winner.
+    
+    Args:
+        segments: List of segment names/labels
+        start_rotation: Starting rotation angle in degrees (random if None)
+        weights: Relative slice sizes, one per segment (equal slices if None)
+    
+    Returns:
+        Tuple[str, dict]: Winner name and information dictionary
+        
+    Example:
+        >>> winner, info = pick_winner(['Alice', 'Bob', 'Charlie'])
+        >>> print(f"{winner} wins (rotation {info['start_rotation']:.1f}°)")
+    """
+    if not segments:
+        raise ValueError("Segments list cannot be empty")
+    
+    if start_rotation is None:
+        start_rotation = random.uniform(0, 360)
+    
+    angle_table = None
+    if weights is not None:
+        angle_table = build_angle_table(weights, segments=len(segments))
+    
+    winner_index, winner_name = calculate_winner(start_rotation, segments, angle_table=angle_table)
     
     info = {
         'winner_index': winner_index,
         'winner_name': winner_name,
         'start_rotation': start_rotation,
-        'total_segments': len(segments),
-        'frames_generated': frames_count,
-        'output_file': output_file,
-        'size': size,
-        'animation_speed': animation_speed,
-        'colors_used': colors[:len(segments)]
+        'total_segments': len(segments)
     }
     
-    print(f"✅ Advanced wheel created: {output_file}")
-    print(f"🎯 Winner: {winner_name} (segment {winner_index + 1}/{len(segments)})")
-    print(f"📊 Animation: {frames_count} frames at {animation_speed}x speed")
-    print(f"🎨 Size: {size}x{size}px")
-    
     return winner_name, info
 
 
@@ -196,6 +453,10 @@ __description__ = "Create animated spinning wheel GIFs for games and decision-ma
 __all__ = [
     'create_spinning_wheel',
     'create_spinning_wheel_advanced', 
+    'create_spinning_wheel_sizes',
+    'spin_wheel',
+    'render_still',
+    'pick_winner',
     'quick_spin',
     'decision_wheel'
 ]
\ No newline at end of file